@@ -67,7 +67,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
-    
+    'django.contrib.sitemaps',
 ]
 
 MIDDLEWARE = [
@@ -329,6 +329,36 @@ else:
 
 # DynamoDB Settings for Blog Posts
 DYNAMODB_BLOG_TABLE = env('DYNAMODB_BLOG_TABLE', default='omimi-blog-posts')
+# Search postings, one item per (term, post); kept out of the posts table so scans never read them
+DYNAMODB_BLOG_SEARCH_TABLE = env('DYNAMODB_BLOG_SEARCH_TABLE', default=f'{DYNAMODB_BLOG_TABLE}-search')
+
+# Blog storage backend: 'dynamodb' (AWS), or the local stand-in ('memory' or 'sqlite')
+# for development, CI and load testing without network access
+BLOG_STORAGE_BACKEND = env('BLOG_STORAGE_BACKEND', default='dynamodb')
+BLOG_STORAGE_SQLITE_PATH = env('BLOG_STORAGE_SQLITE_PATH', default=str(BASE_DIR / 'blog_local.sqlite3'))
+# List DynamoDB posts in the blog feeds and sitemap (opening the DynamoDB tables on first render)
+BLOG_FEEDS_INCLUDE_DYNAMODB = env.bool('BLOG_FEEDS_INCLUDE_DYNAMODB', default=False)
+
+# Per-process read-through cache for blog items and list pages (TTL in seconds, 0 disables)
+BLOG_CACHE_TTL = env.int('BLOG_CACHE_TTL', default=60)
+BLOG_CACHE_MAX_ENTRIES = env.int('BLOG_CACHE_MAX_ENTRIES', default=1000)
+
+# Blog post bodies of at least this many bytes are stored zlib-compressed in DynamoDB (0 disables)
+BLOG_CONTENT_COMPRESS_THRESHOLD = env.int('BLOG_CONTENT_COMPRESS_THRESHOLD', default=4096)
+
+# Split blog view counters across this many DynamoDB items to avoid hot keys (0 or 1 = single counter).
+# Only ever increase it: counts in shards above a lowered value would no longer be read.
+BLOG_VIEW_COUNTER_SHARDS = env.int('BLOG_VIEW_COUNTER_SHARDS', default=0)
+# The site-wide view total is always spread over this many items; the same rule applies
+BLOG_TOTAL_VIEW_SHARDS = env.int('BLOG_TOTAL_VIEW_SHARDS', default=10)
+
+# Parallel Segment/TotalSegments scans used by whole-table jobs (export, reindex, backfills)
+BLOG_SCAN_SEGMENTS = env.int('BLOG_SCAN_SEGMENTS', default=4)
+
+# Simple blog views are logged and folded into the post counters at most this often (seconds,
+# 0 = only by the flush_blog_views command); flushes also fill the per-day views rollup
+BLOG_VIEW_FLUSH_INTERVAL = env.int('BLOG_VIEW_FLUSH_INTERVAL', default=60)
+BLOG_VIEW_ROLLUP = env.bool('BLOG_VIEW_ROLLUP', default=True)
 
 # Caching Configuration
 CACHES = {
@@ -22,6 +22,8 @@ from django.urls import re_path
 from django.http import JsonResponse
 import projects
 import projects.views
+from projects.feeds import blog_atom_feed, blog_feed
+from projects.sitemaps import SITEMAPS, sitemap_index, sitemap_section
 
 def health_check(request):
     """Robust health check endpoint for Railway deployment"""
@@ -69,6 +71,10 @@ urlpatterns = [
     path('sales/', projects.views.sales, name='sales'),
     path('details_sales/<int:sword_sales_id>',projects.views.details_sales, name='details_sales'),
     path("ckeditor5/", include('django_ckeditor_5.urls'), name="ck_editor_5_upload_file"),
+    path('feeds/blog.xml', blog_feed, name='blog_feed'),
+    path('feeds/blog.atom', blog_atom_feed, name='blog_atom_feed'),
+    path('sitemap.xml', sitemap_index, {'sitemaps': SITEMAPS, 'sitemap_url_name': 'sitemap_section'}, name='sitemap'),
+    path('sitemap-<section>.xml', sitemap_section, {'sitemaps': SITEMAPS}, name='sitemap_section'),
 ]
 
 # Only serve media files locally when NOT using S3
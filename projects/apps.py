@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ProjectsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'projects'
+
+    def ready(self):
+        # Signal handlers keeping the simple blog's search index, related posts and caches current
+        from . import document_cache, simple_blog_cache, simple_blog_search, simple_related_posts  # noqa: F401
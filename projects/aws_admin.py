@@ -10,6 +10,7 @@ from django.shortcuts import redirect
 from django.contrib import messages
 from django.http import HttpResponseRedirect
 from .aws_models import DynamoDBBlogPost, BlogImageS3
+from .aws_blog_service import blog_service
 from .models import BlogImages  # Keep existing BlogImages for compatibility
 import json
 
@@ -114,13 +115,11 @@ class DynamoDBBlogPostAdmin(admin.ModelAdmin):
     
     def delete_queryset(self, request, queryset):
         """Bulk delete from DynamoDB"""
-        deleted_count = 0
-        for obj in queryset:
-            try:
-                obj.delete()
-                deleted_count += 1
-            except Exception as e:
-                messages.error(request, f'Error deleting "{obj.title}": {e}')
+        try:
+            deleted_count = blog_service.delete_blog_posts([obj.blog_id for obj in queryset])
+        except Exception as e:
+            messages.error(request, f'Error deleting blog posts: {e}')
+            return
         
         if deleted_count > 0:
             messages.success(request, f'Successfully deleted {deleted_count} blog posts from DynamoDB.')
@@ -137,10 +136,8 @@ class DynamoDBBlogPostAdmin(admin.ModelAdmin):
     def preview_content(self, obj):
         """Show content preview"""
         if obj.content:
-            preview = obj.stripped_content[:100]
-            if len(obj.stripped_content) > 100:
-                preview += '...'
-            return preview
+            text = obj.stripped_content
+            return text[:100] + '...' if len(text) > 100 else text
         return 'No content'
     preview_content.short_description = 'Content Preview'
     
@@ -183,14 +180,11 @@ class DynamoDBBlogPostAdmin(admin.ModelAdmin):
     
     def make_published(self, request, queryset):
         """Publish selected blog posts"""
-        updated = 0
-        for obj in queryset:
-            try:
-                obj.published = True
-                obj.save()
-                updated += 1
-            except Exception as e:
-                messages.error(request, f'Error publishing "{obj.title}": {e}')
+        try:
+            updated = blog_service.set_published_many([obj.blog_id for obj in queryset], True)
+        except Exception as e:
+            messages.error(request, f'Error publishing blog posts: {e}')
+            return
         
         if updated > 0:
             messages.success(request, f'Successfully published {updated} blog posts.')
@@ -199,14 +193,11 @@ class DynamoDBBlogPostAdmin(admin.ModelAdmin):
     
     def make_unpublished(self, request, queryset):
         """Unpublish selected blog posts"""
-        updated = 0
-        for obj in queryset:
-            try:
-                obj.published = False
-                obj.save()
-                updated += 1
-            except Exception as e:
-                messages.error(request, f'Error unpublishing "{obj.title}": {e}')
+        try:
+            updated = blog_service.set_published_many([obj.blog_id for obj in queryset], False)
+        except Exception as e:
+            messages.error(request, f'Error unpublishing blog posts: {e}')
+            return
         
         if updated > 0:
             messages.success(request, f'Successfully unpublished {updated} blog posts.')
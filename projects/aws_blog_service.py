@@ -5,30 +5,211 @@ This service layer handles blog posts in DynamoDB while maintaining Django compa
 
 import boto3
 import json
+import queue
+import random
+import threading
+import time
 import uuid
+import zlib
+from boto3.dynamodb.conditions import Attr, Key
+from boto3.dynamodb.types import Binary
+from boto3.resources.base import ServiceResource
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from django.conf import settings
+from django.utils.functional import SimpleLazyObject
 from botocore.exceptions import ClientError
 import logging
 
+from . import blog_search
+from .blog_cache import BlogItemCache
+
 logger = logging.getLogger(__name__)
 
+# Aggregate items kept alongside the posts in the same table
+STATS_KEY = 'STATS#global'
+TAG_COUNT_PREFIX = 'TAGCOUNT#'
+RECENT_POSTS_LIMIT = 10
+BATCH_GET_LIMIT = 100
+BATCH_RETRY_LIMIT = 8
+BATCH_RETRY_BASE_DELAY = 0.05  # seconds, doubled on each retry
+BULK_UPDATE_WORKERS = 8
+
+# Search postings live in their own table, one (term, blog_id) item per posting,
+# plus one (DOC_LENGTH_TERM, blog_id) item per post holding its indexed length.
+# Terms are \w+ stems, so DOC_LENGTH_TERM can never collide with one.
+DOC_LENGTH_TERM = '#length'
+# Postings were once stored as TERM#<stem> items in the posts table; rebuild_search_index removes them
+LEGACY_SEARCH_TERM_PREFIX = 'TERM#'
+
+# Archive index: one partition per UTC month, posts sorted by created_date within it
+ARCHIVE_INDEX = 'ArchiveIndex'
+LEGACY_DATE_INDEX = 'DateIndex'
+ARCHIVE_QUERY_MAX_MONTHS = 24
+INDEX_POLL_SECONDS = 10
+
+# Content at or above this many UTF-8 bytes is stored zlib-compressed in content_z
+COMPRESSED_CONTENT_ATTRIBUTE = 'content_z'
+CONTENT_COMPRESSION_LEVEL = 6
+
+# Sharded view counters: VIEWS#<blog_id>#<n> per post, VIEWS#STATS#global#<n> for the total
+VIEW_SHARD_PREFIX = 'VIEWS#'
+
+# Parallel scans: pages buffered per segment before a slow consumer blocks the scanners
+SCAN_QUEUE_PAGES = 4
+
+# Attributes list views need; full content is only read by the detail page
+SUMMARY_ATTRIBUTES = [
+    'blog_id', 'title', 'excerpt', 'created_date', 'tags', 'images',
+    'view_count', 'published', 'word_count', 'reading_time',
+]
+
+
+def _summary_projection():
+    """ProjectionExpression and attribute names for SUMMARY_ATTRIBUTES"""
+    names = {}
+    parts = []
+    for attribute in SUMMARY_ATTRIBUTES:
+        name, bracket, index = attribute.partition('[')
+        names[f'#{name}'] = name
+        parts.append(f'#{name}{bracket}{index}')
+    return ', '.join(parts), names
+
+
+def month_key(timestamp: str) -> str:
+    """Archive partition (YYYY-MM) for an ISO timestamp"""
+    return timestamp[:7]
+
+
+def month_start(month: str) -> str:
+    """Timestamp of the first instant of an archive partition, comparable with created_date"""
+    return f"{month}-01T00:00:00"
+
+
+def next_month(month: str) -> str:
+    year, number = int(month[:4]), int(month[5:7])
+    return f"{year + 1:04d}-01" if number == 12 else f"{year:04d}-{number + 1:02d}"
+
+
+def months_between(start: str, end: str) -> List[str]:
+    """Archive partitions covering the UTC timestamps start (inclusive) to end (exclusive)"""
+    months = [month_key(start)]
+    while month_start(next_month(months[-1])) < end[:19]:
+        months.append(next_month(months[-1]))
+    return months
+
+
+def _archive_index_definition() -> Dict:
+    """GSI keyed by month with created_date as sort key, carrying the summary attributes"""
+    return {
+        'IndexName': ARCHIVE_INDEX,
+        'KeySchema': [
+            {'AttributeName': 'created_month', 'KeyType': 'HASH'},
+            {'AttributeName': 'created_date', 'KeyType': 'RANGE'},
+        ],
+        'Projection': {
+            'ProjectionType': 'INCLUDE',
+            'NonKeyAttributes': [
+                name.split('[')[0] for name in SUMMARY_ATTRIBUTES
+                if name not in ('blog_id', 'created_date')
+            ],
+        },
+    }
+
+
+ARCHIVE_ATTRIBUTE_DEFINITIONS = [
+    {'AttributeName': 'created_month', 'AttributeType': 'S'},
+    {'AttributeName': 'created_date', 'AttributeType': 'S'},
+]
+
+
+def normalize_tags(tags) -> List[str]:
+    """Tags as stored: stripped, lower-cased and without duplicates, so tag lookups ignore case"""
+    normalized = [tag.strip().lower() for tag in tags or []]
+    return list(dict.fromkeys(tag for tag in normalized if tag))
+
+
+def compress_content(content: str, threshold: int) -> Dict:
+    """
+    Attributes to store for a post body: {'content': str} for short posts,
+    {'content_z': Binary} when the body is large and compression pays off.
+    """
+    raw = (content or '').encode('utf-8')
+    if threshold and len(raw) >= threshold:
+        packed = zlib.compress(raw, CONTENT_COMPRESSION_LEVEL)
+        if len(packed) < len(raw):
+            return {COMPRESSED_CONTENT_ATTRIBUTE: Binary(packed)}
+    return {'content': content}
+
+
+def inflate_content(item: Optional[Dict]) -> Optional[Dict]:
+    """Replace a compressed content_z attribute with the plain content string, in place"""
+    if item and COMPRESSED_CONTENT_ATTRIBUTE in item:
+        packed = item.pop(COMPRESSED_CONTENT_ATTRIBUTE)
+        item['content'] = zlib.decompress(bytes(getattr(packed, 'value', packed))).decode('utf-8')
+    return item
+
 
 class DynamoDBBlogService:
     """Service for managing blog posts in DynamoDB"""
     
-    def __init__(self):
+    def __init__(self, dynamodb=None):
         """Initialize DynamoDB client and table"""
-        self.dynamodb = boto3.resource(
+        self.dynamodb = dynamodb or self._create_resource()
+        self.table_name = getattr(settings, 'DYNAMODB_BLOG_TABLE', 'omimi-blog-posts')
+        self.search_table_name = getattr(settings, 'DYNAMODB_BLOG_SEARCH_TABLE', f'{self.table_name}-search')
+        self.table = None
+        self.search_table = None
+        self._thread_local = threading.local()
+        self.cache = BlogItemCache(
+            ttl=getattr(settings, 'BLOG_CACHE_TTL', 60),
+            max_entries=getattr(settings, 'BLOG_CACHE_MAX_ENTRIES', 1000)
+        )
+        self.compress_threshold = getattr(settings, 'BLOG_CONTENT_COMPRESS_THRESHOLD', 4096)
+        self.view_counter_shards = getattr(settings, 'BLOG_VIEW_COUNTER_SHARDS', 0)
+        self.total_view_shards = getattr(settings, 'BLOG_TOTAL_VIEW_SHARDS', 10)
+        self.scan_segments = getattr(settings, 'BLOG_SCAN_SEGMENTS', 4)
+        self._ensure_table_exists()
+    
+    @staticmethod
+    def _create_resource():
+        """Build the storage resource selected by BLOG_STORAGE_BACKEND"""
+        backend = getattr(settings, 'BLOG_STORAGE_BACKEND', 'dynamodb')
+        if backend == 'memory':
+            from .local_dynamodb import LocalDynamoDBResource
+            return LocalDynamoDBResource()
+        if backend == 'sqlite':
+            from .local_dynamodb import LocalDynamoDBResource
+            return LocalDynamoDBResource(path=settings.BLOG_STORAGE_SQLITE_PATH)
+        
+        return DynamoDBBlogService._boto3_resource(boto3)
+    
+    @staticmethod
+    def _boto3_resource(session):
+        """DynamoDB resource from a boto3 Session (or the boto3 module for the default session)"""
+        return session.resource(
             'dynamodb',
             region_name=getattr(settings, 'AWS_S3_REGION_NAME', 'us-east-1'),
             aws_access_key_id=getattr(settings, 'AWS_ACCESS_KEY_ID', None),
             aws_secret_access_key=getattr(settings, 'AWS_SECRET_ACCESS_KEY', None)
         )
-        self.table_name = getattr(settings, 'DYNAMODB_BLOG_TABLE', 'omimi-blog-posts')
-        self.table = None
-        self._ensure_table_exists()
+    
+    def _thread_table(self, table_name: str):
+        """
+        Table handle for use from a worker thread. boto3 resources must not be
+        shared between threads, so each thread builds its own from a new
+        Session; the local stand-in is locked internally and its handles are shared.
+        """
+        if not isinstance(self.dynamodb, ServiceResource):
+            return self.search_table if table_name == self.search_table_name else self.table
+        local = self._thread_local
+        if not hasattr(local, 'tables'):
+            local.resource = self._boto3_resource(boto3.session.Session())
+            local.tables = {}
+        if table_name not in local.tables:
+            local.tables[table_name] = local.resource.Table(table_name)
+        return local.tables[table_name]
     
     def _ensure_table_exists(self):
         """Create DynamoDB table if it doesn't exist"""
@@ -44,6 +225,35 @@ class DynamoDBBlogService:
             else:
                 logger.error(f"Error accessing DynamoDB table: {e}")
                 raise
+        self._ensure_search_table_exists()
+    
+    def _ensure_search_table_exists(self):
+        """Create the search postings table if it doesn't exist"""
+        try:
+            self.search_table = self.dynamodb.Table(self.search_table_name)
+            self.search_table.load()
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ResourceNotFoundException':
+                logger.error(f"Error accessing DynamoDB table: {e}")
+                raise
+            logger.info(f"Creating DynamoDB table: {self.search_table_name}")
+            try:
+                self.search_table = self.dynamodb.create_table(
+                    TableName=self.search_table_name,
+                    KeySchema=[
+                        {'AttributeName': 'term', 'KeyType': 'HASH'},
+                        {'AttributeName': 'blog_id', 'KeyType': 'RANGE'},
+                    ],
+                    AttributeDefinitions=[
+                        {'AttributeName': 'term', 'AttributeType': 'S'},
+                        {'AttributeName': 'blog_id', 'AttributeType': 'S'},
+                    ],
+                    BillingMode='PAY_PER_REQUEST'
+                )
+                self.search_table.wait_until_exists()
+            except ClientError as e:
+                logger.error(f"Error creating DynamoDB table: {e}")
+                raise
     
     def _create_table(self):
         """Create the blog posts table"""
@@ -60,27 +270,9 @@ class DynamoDBBlogService:
                     {
                         'AttributeName': 'blog_id',
                         'AttributeType': 'S'
-                    },
-                    {
-                        'AttributeName': 'created_date',
-                        'AttributeType': 'S'
-                    }
-                ],
-                GlobalSecondaryIndexes=[
-                    {
-                        'IndexName': 'DateIndex',
-                        'KeySchema': [
-                            {
-                                'AttributeName': 'created_date',
-                                'KeyType': 'HASH'
-                            }
-                        ],
-                        'Projection': {
-                            'ProjectionType': 'ALL'
-                        },
-                        'BillingMode': 'PAY_PER_REQUEST'
                     }
-                ],
+                ] + ARCHIVE_ATTRIBUTE_DEFINITIONS,
+                GlobalSecondaryIndexes=[_archive_index_definition()],
                 BillingMode='PAY_PER_REQUEST'  # Serverless pricing
             )
             
@@ -102,57 +294,223 @@ class DynamoDBBlogService:
         item = {
             'blog_id': blog_id,
             'title': title,
-            'content': content,
             'images': images or [],
-            'tags': tags or [],
+            'tags': normalize_tags(tags),
             'created_date': now.isoformat(),
+            'created_month': month_key(now.isoformat()),
             'updated_date': now.isoformat(),
             'published': True,
             'view_count': 0
         }
+        item.update(compress_content(content, self.compress_threshold))
+        item.update(blog_search.text_fields(content))
         
         try:
             self.table.put_item(Item=item)
             logger.info(f"Created blog post: {blog_id}")
+            self._invalidate_cache([])
+            self._update_stats(None, item)
+            self._update_search_index(None, inflate_content(item))
             return blog_id
         except ClientError as e:
             logger.error(f"Error creating blog post: {e}")
             raise
     
-    def get_blog_post(self, blog_id: str) -> Optional[Dict]:
-        """Get a specific blog post by ID"""
+    def get_blog_post(self, blog_id: str, summary: bool = False) -> Optional[Dict]:
+        """Get a specific blog post by ID (only the summary attributes if summary=True)"""
+        cache_key = ('item', blog_id, summary)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        
         try:
-            response = self.table.get_item(Key={'blog_id': blog_id})
-            return response.get('Item')
+            if summary:
+                projection, names = _summary_projection()
+                response = self.table.get_item(
+                    Key={'blog_id': blog_id},
+                    ProjectionExpression=projection,
+                    ExpressionAttributeNames=names
+                )
+            else:
+                response = self.table.get_item(Key={'blog_id': blog_id})
         except ClientError as e:
             logger.error(f"Error getting blog post {blog_id}: {e}")
             return None
+        
+        item = inflate_content(response.get('Item'))
+        if item is None:
+            return None
+        self._add_sharded_views([item])
+        self.cache.set_item(cache_key, item)
+        return dict(item)
     
-    def get_all_blog_posts(self, limit: int = 50) -> List[Dict]:
-        """Get all blog posts, ordered by creation date (newest first)"""
-        try:
-            # Use the DateIndex to get posts ordered by date
-            response = self.table.scan(
-                Limit=limit,
-                ScanFilter={
-                    'published': {
-                        'AttributeValueList': [True],
-                        'ComparisonOperator': 'EQ'
-                    }
-                }
+    def get_all_blog_posts(self, limit: int = 50, summary: bool = False) -> List[Dict]:
+        """
+        Get the newest published blog posts (up to limit).
+        With summary=True only SUMMARY_ATTRIBUTES are read, which skips the content HTML.
+        """
+        return self.find_blog_posts(published=True, limit=limit, summary=summary)
+    
+    def find_blog_posts(self, published: Optional[bool] = None, tag: Optional[str] = None,
+                        created_from: Optional[str] = None, created_before: Optional[str] = None,
+                        blog_ids: Optional[List[str]] = None, newest_first: Optional[bool] = True,
+                        limit: Optional[int] = None, summary: bool = False) -> List[Dict]:
+        """
+        Find posts matching simple criteria without reading more than needed.
+        Known ids become key lookups. Date ranges, and any ordered read with a
+        limit, are Queries on the archive index walked month by month in order
+        (ScanIndexForward, Limit) until enough posts are found; everything else
+        is a scan with the criteria pushed into a FilterExpression.
+        Dates are ISO timestamps compared as strings, like the stored created_date;
+        newest_first=None skips sorting so a limited read can stop after the first pages.
+        """
+        cache_key = (
+            'list', 'find', published, tag, created_from, created_before,
+            tuple(blog_ids) if blog_ids is not None else None, newest_first, limit, summary,
+        )
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return [dict(item) for item in cached]
+        
+        items = self._find_blog_posts(published, tag, created_from, created_before, blog_ids, newest_first, limit, summary)
+        if items is not None:
+            self.cache.set(cache_key, items)
+        return [dict(item) for item in items or []]
+    
+    def _find_blog_posts(self, published, tag, created_from, created_before, blog_ids, newest_first, limit,
+                         summary) -> Optional[List[Dict]]:
+        """Uncached body of find_blog_posts; returns None on errors so they are not cached"""
+        projection_kwargs = {}
+        if summary:
+            projection_kwargs['ProjectionExpression'], projection_kwargs['ExpressionAttributeNames'] = _summary_projection()
+        
+        def matches(item):
+            return (
+                (published is None or item.get('published', True) == published)
+                and (tag is None or tag in (item.get('tags') or []))
+                and (created_from is None or item.get('created_date', '') >= created_from)
+                and (created_before is None or item.get('created_date', '') < created_before)
             )
+        
+        try:
+            if blog_ids is not None:
+                items = [item for item in self.get_many(blog_ids, summary=summary) if matches(item)]
+            else:
+                attribute_filter = None
+                if published is not None:
+                    attribute_filter = Attr('published').eq(published)
+                if tag is not None:
+                    tag_filter = Attr('tags').contains(tag)
+                    attribute_filter = tag_filter if attribute_filter is None else attribute_filter & tag_filter
+                
+                bounds = None
+                if created_from is not None and created_before is not None:
+                    bounds = (created_from, created_before)
+                elif newest_first is not None and limit is not None:
+                    bounds = self._archive_bounds(created_from, created_before)
+                if bounds is not None:
+                    items = self._query_archive(
+                        bounds[0], bounds[1], newest_first is not False, limit, summary, attribute_filter
+                    )
+                    if items is not None:
+                        return items
+                
+                # Only posts have created_date; aggregate and index items never match
+                condition = Attr('created_date').exists()
+                if attribute_filter is not None:
+                    condition &= attribute_filter
+                if created_from is not None:
+                    condition &= Attr('created_date').gte(created_from)
+                if created_before is not None:
+                    condition &= Attr('created_date').lt(created_before)
+                
+                items = []
+                scan_kwargs = dict(projection_kwargs, FilterExpression=condition)
+                while True:
+                    response = self.table.scan(**scan_kwargs)
+                    items.extend(inflate_content(item) for item in response.get('Items', []))
+                    # Scans are unordered, so an early stop is only safe when no order is needed
+                    if newest_first is None and limit is not None and len(items) >= limit:
+                        break
+                    if 'LastEvaluatedKey' not in response:
+                        break
+                    scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+                self._add_sharded_views(items)
             
-            # Sort by created_date in Python (DynamoDB scan doesn't guarantee order)
-            items = response.get('Items', [])
-            items.sort(key=lambda x: x.get('created_date', ''), reverse=True)
-            
-            return items
+            if newest_first is not None:
+                items.sort(key=lambda x: x.get('created_date', ''), reverse=newest_first)
+            return items[:limit] if limit is not None else items
         except ClientError as e:
-            logger.error(f"Error getting blog posts: {e}")
-            return []
+            logger.error(f"Error finding blog posts: {e}")
+            return None
+    
+    def _query_archive(self, created_from: str, created_before: str, newest_first: bool,
+                       limit: Optional[int], summary: bool, attribute_filter=None) -> Optional[List[Dict]]:
+        """
+        Read a date range from the archive index, one Query per month partition,
+        walking the partitions in order so a limit can stop early.
+        Returns None when an unlimited range is too wide or the index is not
+        available yet.
+        """
+        months = months_between(created_from, created_before)
+        if limit is None and len(months) > ARCHIVE_QUERY_MAX_MONTHS:
+            return None
+        if newest_first:
+            months.reverse()
+        
+        query_kwargs = {'IndexName': ARCHIVE_INDEX, 'ScanIndexForward': not newest_first}
+        if summary:
+            query_kwargs['ProjectionExpression'], query_kwargs['ExpressionAttributeNames'] = _summary_projection()
+        if attribute_filter is not None:
+            query_kwargs['FilterExpression'] = attribute_filter
+        
+        items = []
+        try:
+            for month in months:
+                # BETWEEN is inclusive, so a post exactly at created_before is dropped below
+                kwargs = dict(
+                    query_kwargs,
+                    KeyConditionExpression=Key('created_month').eq(month) & Key('created_date').between(created_from, created_before)
+                )
+                while limit is None or len(items) < limit:
+                    if limit is not None:
+                        kwargs['Limit'] = limit - len(items)
+                    response = self.table.query(**kwargs)
+                    items.extend(item for item in response.get('Items', []) if item['created_date'] < created_before)
+                    if 'LastEvaluatedKey' not in response:
+                        break
+                    kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ValidationException':
+                raise
+            logger.warning(f"{ARCHIVE_INDEX} is not available, falling back to a scan: {e}")
+            return None
+        
+        if limit is not None:
+            items = items[:limit]
+        if not summary:
+            # The index only carries summary attributes
+            return self.get_many([item['blog_id'] for item in items])
+        self._add_sharded_views(items)
+        return items
+    
+    def _archive_bounds(self, created_from: Optional[str], created_before: Optional[str]) -> Optional[Tuple[str, str]]:
+        """
+        Close an open date range at the oldest archive partition (first_month
+        on the stats item) and the end of the current month.
+        Returns None if first_month is not recorded yet, so the caller scans.
+        """
+        if created_from is None:
+            stats = self.table.get_item(Key={'blog_id': STATS_KEY}, ProjectionExpression='first_month').get('Item', {})
+            if 'first_month' not in stats:
+                return None
+            created_from = month_start(stats['first_month'])
+        if created_before is None:
+            created_before = month_start(next_month(month_key(datetime.now(timezone.utc).isoformat())))
+        return created_from, created_before
     
     def update_blog_post(self, blog_id: str, **kwargs) -> bool:
-        """Update a blog post"""
+        """Update a blog post; returns False if it doesn't exist"""
         if not kwargs:
             return False
             
@@ -160,62 +518,895 @@ class DynamoDBBlogService:
         update_expression = "SET updated_date = :updated_date"
         expression_values = {':updated_date': datetime.now(timezone.utc).isoformat()}
         
+        if 'tags' in kwargs:
+            kwargs['tags'] = normalize_tags(kwargs['tags'])
         for key, value in kwargs.items():
-            if key in ['title', 'content', 'images', 'tags', 'published']:
+            if key in ['title', 'images', 'tags', 'published']:
                 update_expression += f", {key} = :{key}"
                 expression_values[f":{key}"] = value
         
+        if 'content' in kwargs:
+            stored = compress_content(kwargs['content'], self.compress_threshold)
+            stored.update(blog_search.text_fields(kwargs['content']))
+            for key, value in stored.items():
+                update_expression += f", {key} = :{key}"
+                expression_values[f":{key}"] = value
+            # Drop whichever representation of the body is no longer used
+            unused = 'content' if COMPRESSED_CONTENT_ATTRIBUTE in stored else COMPRESSED_CONTENT_ATTRIBUTE
+            update_expression += f" REMOVE {unused}"
+        
         try:
-            self.table.update_item(
+            response = self.table.update_item(
                 Key={'blog_id': blog_id},
                 UpdateExpression=update_expression,
-                ExpressionAttributeValues=expression_values
+                # Without the condition an unknown id would be created as a partial post
+                ConditionExpression=Attr('blog_id').exists(),
+                ExpressionAttributeValues=expression_values,
+                ReturnValues='ALL_OLD'
             )
-            logger.info(f"Updated blog post: {blog_id}")
-            return True
         except ClientError as e:
-            logger.error(f"Error updating blog post {blog_id}: {e}")
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                logger.warning(f"Blog post {blog_id} not found, nothing updated")
+            else:
+                logger.error(f"Error updating blog post {blog_id}: {e}")
             return False
+        
+        logger.info(f"Updated blog post: {blog_id}")
+        old_item = inflate_content(response['Attributes'])
+        new_item = dict(old_item)
+        new_item.update({key[1:]: value for key, value in expression_values.items()})
+        if 'content' in kwargs:
+            new_item.pop(COMPRESSED_CONTENT_ATTRIBUTE, None)
+            new_item['content'] = kwargs['content']
+        self._update_stats(old_item, new_item)
+        self._update_search_index(old_item, new_item)
+        self._invalidate_cache([blog_id])
+        return True
     
     def delete_blog_post(self, blog_id: str) -> bool:
         """Delete a blog post"""
         try:
-            self.table.delete_item(Key={'blog_id': blog_id})
+            response = self.table.delete_item(Key={'blog_id': blog_id}, ReturnValues='ALL_OLD')
             logger.info(f"Deleted blog post: {blog_id}")
+            old_item = inflate_content(response.get('Attributes'))
+            if old_item:
+                # The post's views leave the total along with it
+                self._add_sharded_views([old_item])
+                self._delete_view_shards([blog_id])
+            self._update_stats(old_item, None)
+            self._update_search_index(old_item, None)
+            self._invalidate_cache([blog_id])
             return True
         except ClientError as e:
             logger.error(f"Error deleting blog post {blog_id}: {e}")
             return False
     
-    def increment_view_count(self, blog_id: str):
-        """Increment the view count for a blog post"""
+    def delete_blog_posts(self, blog_ids: List[str]) -> int:
+        """
+        Delete several posts with parallel DeleteItem calls.
+        Each call returns the item it removed (ALL_OLD), so the aggregates and
+        search index are updated once for the whole batch from what was
+        actually stored, never from a cached copy. Returns the number deleted.
+        """
+        def delete(blog_id):
+            try:
+                response = self._thread_table(self.table_name).delete_item(
+                    Key={'blog_id': blog_id}, ReturnValues='ALL_OLD'
+                )
+            except ClientError as e:
+                logger.error(f"Error deleting blog post {blog_id}: {e}")
+                return None
+            return inflate_content(response.get('Attributes'))
+        
+        with ThreadPoolExecutor(max_workers=BULK_UPDATE_WORKERS) as executor:
+            old_items = [item for item in executor.map(delete, list(dict.fromkeys(blog_ids))) if item]
+        if not old_items:
+            return 0
+        deleted_ids = [item['blog_id'] for item in old_items]
+        logger.info(f"Deleted {len(old_items)} blog posts")
+        
+        self._add_sharded_views(old_items)
+        try:
+            self._delete_view_shards(deleted_ids)
+        except ClientError as e:
+            logger.error(f"Error deleting view counter shards: {e}")
+        self._update_stats_many([(item, None) for item in old_items])
+        self._remove_from_search_index(old_items)
+        self._invalidate_cache(deleted_ids)
+        return len(old_items)
+    
+    def set_published_many(self, blog_ids: List[str], published: bool) -> int:
+        """
+        Publish or unpublish several posts with parallel UpdateItem calls.
+        Only the status and updated_date change, so the search index is untouched.
+        Returns the number of posts updated.
+        """
+        updated_date = datetime.now(timezone.utc).isoformat()
+        
+        def flip(blog_id):
+            try:
+                response = self._thread_table(self.table_name).update_item(
+                    Key={'blog_id': blog_id},
+                    UpdateExpression="SET published = :published, updated_date = :updated_date",
+                    ConditionExpression=Attr('blog_id').exists(),
+                    ExpressionAttributeValues={':published': published, ':updated_date': updated_date},
+                    ReturnValues='ALL_OLD'
+                )
+            except ClientError as e:
+                logger.error(f"Error updating blog post {blog_id}: {e}")
+                return None
+            old_item = response['Attributes']
+            return old_item, dict(old_item, published=published, updated_date=updated_date)
+        
+        with ThreadPoolExecutor(max_workers=BULK_UPDATE_WORKERS) as executor:
+            changes = [change for change in executor.map(flip, list(dict.fromkeys(blog_ids))) if change]
+        
+        self._update_stats_many(changes)
+        self._invalidate_cache([old_item['blog_id'] for old_item, _ in changes])
+        logger.info(f"Set published={published} on {len(changes)} blog posts")
+        return len(changes)
+    
+    def _invalidate_cache(self, blog_ids: Optional[List[str]] = None):
+        """
+        Drop cached copies of the given posts and every cached list page
+        (any write can change a list). With no ids the whole cache is cleared.
+        """
+        if blog_ids is None:
+            self.cache.clear()
+            return
+        for blog_id in blog_ids:
+            self.cache.delete_matching('item', blog_id)
+        self.cache.delete_matching('list')
+    
+    def increment_view_count(self, blog_id: str) -> bool:
+        """
+        Increment the view count for a blog post and the site-wide total.
+        With BLOG_VIEW_COUNTER_SHARDS > 1 the post's increment goes to a random
+        shard item so a popular post does not turn its own item into a hot key;
+        the total is always spread over BLOG_TOTAL_VIEW_SHARDS items.
+        Cached copies keep their old count until the TTL runs out; dropping
+        them on every view would defeat the cache for popular posts.
+        """
+        post_key = blog_id
+        if self.view_counter_shards > 1:
+            post_key = f"{VIEW_SHARD_PREFIX}{blog_id}#{random.randrange(self.view_counter_shards)}"
+        total_key = f"{VIEW_SHARD_PREFIX}{STATS_KEY}#{random.randrange(max(1, self.total_view_shards))}"
+        
         try:
             self.table.update_item(
-                Key={'blog_id': blog_id},
+                Key={'blog_id': post_key},
                 UpdateExpression="ADD view_count :inc",
                 ExpressionAttributeValues={':inc': 1}
             )
+            self.table.update_item(
+                Key={'blog_id': total_key},
+                UpdateExpression="ADD total_views :inc",
+                ExpressionAttributeValues={':inc': 1}
+            )
+            return True
         except ClientError as e:
             logger.error(f"Error incrementing view count for {blog_id}: {e}")
+            return False
     
-    def search_blog_posts(self, search_term: str, limit: int = 20) -> List[Dict]:
-        """Search blog posts by title or content (basic implementation)"""
+    def _view_shard_keys(self, owner_id: str) -> List[Dict]:
+        """Keys of the counter shards for a post; none when sharding is off"""
+        if self.view_counter_shards <= 1:
+            return []
+        return [{'blog_id': f"{VIEW_SHARD_PREFIX}{owner_id}#{n}"} for n in range(self.view_counter_shards)]
+    
+    def _total_view_shard_keys(self) -> List[Dict]:
+        """Keys of the shards holding the site-wide view total"""
+        return [{'blog_id': f"{VIEW_SHARD_PREFIX}{STATS_KEY}#{n}"} for n in range(max(1, self.total_view_shards))]
+    
+    def _add_sharded_views(self, items: List[Dict]):
+        """Add the shard counters of each post to its view_count with one batched read"""
+        if self.view_counter_shards <= 1 or not items:
+            return
+        keys = [key for item in items for key in self._view_shard_keys(item['blog_id'])]
         try:
-            # Note: This is a basic search. For production, consider AWS OpenSearch
-            response = self.table.scan(
-                FilterExpression=boto3.dynamodb.conditions.Attr('title').contains(search_term) |
-                               boto3.dynamodb.conditions.Attr('content').contains(search_term),
-                Limit=limit
+            shards = self._batch_get_items(keys)
+        except ClientError as e:
+            logger.error(f"Error reading view counter shards: {e}")
+            return
+        
+        views = {}
+        for shard in shards:
+            owner_id = shard['blog_id'][len(VIEW_SHARD_PREFIX):].rsplit('#', 1)[0]
+            views[owner_id] = views.get(owner_id, 0) + int(shard.get('view_count', 0))
+        for item in items:
+            if 'view_count' in item or item['blog_id'] in views:
+                item['view_count'] = int(item.get('view_count', 0)) + views.get(item['blog_id'], 0)
+    
+    def _delete_view_shards(self, blog_ids: List[str]):
+        """Remove the counter shards of deleted posts"""
+        if self.view_counter_shards <= 1:
+            return
+        with self.table.batch_writer() as batch:
+            for blog_id in blog_ids:
+                for key in self._view_shard_keys(blog_id):
+                    batch.delete_item(Key=key)
+    
+    def backfill_text_fields(self, force: bool = False, progress=None) -> Dict:
+        """Store plain_text, excerpt, word_count and reading_time on posts that lack them"""
+        updated = 0
+        skipped = 0
+        for item in self._scan_all_posts(progress=progress):
+            if not force and 'plain_text' in item and 'reading_time' in item:
+                skipped += 1
+                continue
+            
+            fields = blog_search.text_fields(item.get('content', ''))
+            self.table.update_item(
+                Key={'blog_id': item['blog_id']},
+                UpdateExpression="SET " + ", ".join(f"{key} = :{key}" for key in fields),
+                ExpressionAttributeValues={f":{key}": value for key, value in fields.items()}
+            )
+            updated += 1
+        
+        self._invalidate_cache()
+        logger.info(f"Backfilled text fields on {updated} blog posts")
+        return {'updated': updated, 'skipped': skipped}
+    
+    def ensure_archive_index(self) -> Dict:
+        """
+        Bring an existing table onto the archive index: drop the old DateIndex
+        and create ArchiveIndex. DynamoDB allows one index change at a time, so
+        each step waits for the table to become ACTIVE again.
+        """
+        self.table.reload()
+        index_names = {index['IndexName'] for index in self.table.global_secondary_indexes or []}
+        result = {'dropped_legacy': False, 'created': False}
+        
+        if LEGACY_DATE_INDEX in index_names:
+            logger.info(f"Deleting {LEGACY_DATE_INDEX} from {self.table_name}")
+            self.table.update(GlobalSecondaryIndexUpdates=[{'Delete': {'IndexName': LEGACY_DATE_INDEX}}])
+            self._wait_for_indexes()
+            result['dropped_legacy'] = True
+        
+        if ARCHIVE_INDEX not in index_names:
+            logger.info(f"Creating {ARCHIVE_INDEX} on {self.table_name}")
+            self.table.update(
+                AttributeDefinitions=ARCHIVE_ATTRIBUTE_DEFINITIONS,
+                GlobalSecondaryIndexUpdates=[{'Create': _archive_index_definition()}]
             )
+            self._wait_for_indexes()
+            result['created'] = True
+        
+        return result
+    
+    def _set_first_month(self, month: str):
+        """Record the oldest archive partition holding a post"""
+        self.table.update_item(
+            Key={'blog_id': STATS_KEY},
+            UpdateExpression="SET first_month = :month",
+            ExpressionAttributeValues={':month': month}
+        )
+    
+    def _wait_for_indexes(self):
+        """Block until the table and all of its indexes are ACTIVE"""
+        while True:
+            self.table.reload()
+            indexes = self.table.global_secondary_indexes or []
+            if self.table.table_status == 'ACTIVE' and all(
+                index.get('IndexStatus') == 'ACTIVE' for index in indexes
+            ):
+                return
+            time.sleep(INDEX_POLL_SECONDS)
+    
+    def backfill_archive_months(self) -> Dict:
+        """
+        Set created_month on posts saved before the archive index existed and
+        record the oldest month, where ordered reads stop walking the index.
+        """
+        updated = 0
+        skipped = 0
+        months = set()
+        for item in self._scan_all_posts():
+            if 'created_date' in item:
+                months.add(month_key(item['created_date']))
+            if 'created_month' in item or 'created_date' not in item:
+                skipped += 1
+                continue
+            
+            self.table.update_item(
+                Key={'blog_id': item['blog_id']},
+                UpdateExpression="SET created_month = :month",
+                ExpressionAttributeValues={':month': month_key(item['created_date'])}
+            )
+            updated += 1
+        
+        if months:
+            self._set_first_month(min(months))
+        self._invalidate_cache()
+        logger.info(f"Backfilled created_month on {updated} blog posts")
+        return {'updated': updated, 'skipped': skipped}
+    
+    def compress_existing_content(self) -> Dict:
+        """
+        Rewrite posts saved before compression so large bodies live in content_z.
+        Each rewrite is conditional on the content being unchanged, so a
+        concurrent edit is never overwritten.
+        """
+        compressed = 0
+        skipped = 0
+        for item in self.parallel_scan(FilterExpression=Attr('content').exists()):
+            stored = compress_content(item['content'], self.compress_threshold)
+            if COMPRESSED_CONTENT_ATTRIBUTE not in stored:
+                skipped += 1
+                continue
+            try:
+                self.table.update_item(
+                    Key={'blog_id': item['blog_id']},
+                    UpdateExpression="SET content_z = :packed REMOVE content",
+                    ConditionExpression=Attr('content').eq(item['content']),
+                    ExpressionAttributeValues={':packed': stored[COMPRESSED_CONTENT_ATTRIBUTE]}
+                )
+                compressed += 1
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                    raise
+                logger.warning(f"Blog post {item['blog_id']} changed during compression, skipped")
+                skipped += 1
+        
+        self._invalidate_cache()
+        logger.info(f"Compressed content on {compressed} blog posts")
+        return {'compressed': compressed, 'skipped': skipped}
+    
+    def rewrite_post_images(self, transform, dry_run: bool = False) -> Dict:
+        """
+        Apply transform to each value in every post's images list and store the
+        lists that changed. Each write is conditional on the list being unchanged.
+        """
+        updated = 0
+        skipped = 0
+        for item in self.parallel_scan(ProjectionExpression='blog_id, images', FilterExpression=Attr('images').exists()):
+            images = list(item.get('images') or [])
+            rewritten = [transform(value) for value in images]
+            if rewritten == images:
+                skipped += 1
+                continue
+            if not dry_run:
+                try:
+                    self.table.update_item(
+                        Key={'blog_id': item['blog_id']},
+                        UpdateExpression="SET images = :images",
+                        ConditionExpression=Attr('images').eq(images),
+                        ExpressionAttributeValues={':images': rewritten}
+                    )
+                except ClientError as e:
+                    if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                        raise
+                    logger.warning(f"Blog post {item['blog_id']} changed during image rewrite, skipped")
+                    skipped += 1
+                    continue
+            updated += 1
+        
+        if not dry_run:
+            self._invalidate_cache()
+        logger.info(f"Rewrote images on {updated} blog posts")
+        return {'updated': updated, 'skipped': skipped}
+    
+    # Aggregates -----------------------------------------------------------
+    
+    @staticmethod
+    def _stats_contribution(item: Optional[Dict]):
+        """Counter and tag values a single post contributes to the aggregates"""
+        if not item:
+            return {}, {}
+        published = bool(item.get('published', True))
+        counters = {
+            'total_posts': 1,
+            'published_count': 1 if published else 0,
+            'draft_count': 0 if published else 1,
+            'total_views': int(item.get('view_count', 0)),
+        }
+        # Tag popularity only counts published posts
+        tags = {tag: 1 for tag in set(item.get('tags') or [])} if published else {}
+        return counters, tags
+    
+    def _update_stats(self, old_item: Optional[Dict], new_item: Optional[Dict]):
+        """Apply the difference between two versions of a post to the aggregate items"""
+        self._update_stats_many([(old_item, new_item)])
+    
+    def _update_stats_many(self, changes: List[Tuple[Optional[Dict], Optional[Dict]]]):
+        """Apply the combined difference of several (old, new) post versions in one pass"""
+        counter_deltas = {}
+        tag_deltas = {}
+        new_tag_names = set()
+        created_ids = []
+        created_months = set()
+        deleted_ids = set()
+        
+        for old_item, new_item in changes:
+            old_counters, old_tags = self._stats_contribution(old_item)
+            new_counters, new_tags = self._stats_contribution(new_item)
+            for key in set(old_counters) | set(new_counters):
+                counter_deltas[key] = counter_deltas.get(key, 0) + new_counters.get(key, 0) - old_counters.get(key, 0)
+            for tag in set(old_tags) | set(new_tags):
+                tag_deltas[tag] = tag_deltas.get(tag, 0) + new_tags.get(tag, 0) - old_tags.get(tag, 0)
+            new_tag_names.update(new_tags)
+            
+            if new_item and not old_item:
+                created_ids.insert(0, new_item['blog_id'])
+                created_months.add(month_key(new_item['created_date']))
+            if old_item and not new_item:
+                deleted_ids.add(old_item['blog_id'])
+        
+        counter_deltas = {key: delta for key, delta in counter_deltas.items() if delta}
+        tag_deltas = {tag: delta for tag, delta in tag_deltas.items() if delta}
+        
+        try:
+            set_clauses = []
+            add_clauses = [f"{key} :{key}" for key in counter_deltas]
+            expression_values = {f":{key}": delta for key, delta in counter_deltas.items()}
+            
+            if new_tag_names:
+                add_clauses.append("tag_names :tag_names")
+                expression_values[':tag_names'] = new_tag_names
+            
+            if created_ids:
+                set_clauses.append("recent_ids = list_append(:new_ids, if_not_exists(recent_ids, :empty_list))")
+                expression_values[':new_ids'] = created_ids
+                expression_values[':empty_list'] = []
+            
+            if set_clauses or add_clauses:
+                update_expression = ""
+                if set_clauses:
+                    update_expression += "SET " + ", ".join(set_clauses) + " "
+                if add_clauses:
+                    update_expression += "ADD " + ", ".join(add_clauses)
+                response = self.table.update_item(
+                    Key={'blog_id': STATS_KEY},
+                    UpdateExpression=update_expression.strip(),
+                    ExpressionAttributeValues=expression_values,
+                    ReturnValues='ALL_NEW'
+                )
+                stats = response.get('Attributes', {})
+                self._trim_recent_ids(stats.get('recent_ids', []), deleted_ids)
+                # The first posts of a new table start the archive; existing tables
+                # get first_month from rebuild_blog_stats or the archive migration
+                if created_ids and 'first_month' not in stats and int(stats.get('total_posts', 0)) == len(created_ids):
+                    self._set_first_month(min(created_months))
+            
+            for tag, delta in tag_deltas.items():
+                self.table.update_item(
+                    Key={'blog_id': TAG_COUNT_PREFIX + tag},
+                    UpdateExpression="SET tag_name = :tag_name ADD post_count :delta",
+                    ExpressionAttributeValues={':tag_name': tag, ':delta': delta}
+                )
+        except ClientError as e:
+            # Counters can be rebuilt with `manage.py rebuild_blog_stats`
+            logger.error(f"Error updating blog stats: {e}")
+    
+    def _trim_recent_ids(self, recent_ids: List[str], deleted_ids=()):
+        """Keep the recent post list bounded and free of deleted posts"""
+        stale_indexes = [i for i, blog_id in enumerate(recent_ids[:RECENT_POSTS_LIMIT]) if blog_id in deleted_ids]
+        stale_indexes.extend(range(RECENT_POSTS_LIMIT, len(recent_ids)))
+        if not stale_indexes:
+            return
+        
+        self.table.update_item(
+            Key={'blog_id': STATS_KEY},
+            UpdateExpression="REMOVE " + ", ".join(f"recent_ids[{i}]" for i in stale_indexes)
+        )
+    
+    def _batch_get_items(self, keys: List[Dict], summary: bool = False,
+                         table_name: Optional[str] = None) -> List[Dict]:
+        """
+        Fetch items by key with BatchGetItem, in chunks of 100.
+        UnprocessedKeys (throttling or the 16 MB response cap) are retried with
+        exponential backoff. Results come back in no particular order.
+        """
+        table_name = table_name or self.table_name
+        table_request = {}
+        if summary:
+            table_request['ProjectionExpression'], table_request['ExpressionAttributeNames'] = _summary_projection()
+        
+        items = []
+        for start in range(0, len(keys), BATCH_GET_LIMIT):
+            request = {table_name: dict(table_request, Keys=keys[start:start + BATCH_GET_LIMIT])}
+            attempt = 0
+            while request:
+                response = self.dynamodb.batch_get_item(RequestItems=request)
+                items.extend(inflate_content(item) for item in response.get('Responses', {}).get(table_name, []))
+                request = response.get('UnprocessedKeys') or None
+                if request:
+                    if attempt >= BATCH_RETRY_LIMIT:
+                        logger.error(f"Giving up on {len(request[table_name]['Keys'])} unprocessed keys")
+                        break
+                    time.sleep(BATCH_RETRY_BASE_DELAY * 2 ** attempt)
+                    attempt += 1
+        return items
+    
+    def get_many(self, blog_ids: List[str], summary: bool = False) -> List[Dict]:
+        """
+        Fetch several posts in as few round-trips as possible.
+        Results follow the order of blog_ids; missing posts are skipped.
+        """
+        by_id = {}
+        missing_ids = []
+        for blog_id in dict.fromkeys(blog_ids):  # BatchGetItem rejects duplicate keys
+            cached = self.cache.get(('item', blog_id, summary))
+            if cached is not None:
+                by_id[blog_id] = cached
+            else:
+                missing_ids.append(blog_id)
+        
+        if missing_ids:
+            try:
+                items = self._batch_get_items([{'blog_id': blog_id} for blog_id in missing_ids], summary=summary)
+            except ClientError as e:
+                logger.error(f"Error getting blog posts {missing_ids}: {e}")
+                items = []
+            self._add_sharded_views(items)
+            for item in items:
+                self.cache.set_item(('item', item['blog_id'], summary), item)
+                by_id[item['blog_id']] = item
+        
+        return [dict(by_id[blog_id]) for blog_id in blog_ids if blog_id in by_id]
+    
+    def parallel_scan(self, segments: Optional[int] = None, progress=None, table_name: Optional[str] = None,
+                      **scan_kwargs):
+        """
+        Yield every item of table_name (the posts table by default) matching
+        scan_kwargs using a segmented scan.
+        Each Segment of TotalSegments is paged (following LastEvaluatedKey) by
+        its own thread with its own table handle; pages are handed over through
+        a bounded queue, so items stream out while the scan runs.
+        progress(scanned_count) is called after every page. Items arrive in no
+        particular order.
+        """
+        segments = max(1, segments or self.scan_segments)
+        table_name = table_name or self.table_name
+        pages = queue.Queue(maxsize=segments * SCAN_QUEUE_PAGES)
+        stop = threading.Event()
+        done = object()
+        
+        def scan_segment(segment):
+            try:
+                kwargs = dict(scan_kwargs)
+                if segments > 1:
+                    kwargs.update(Segment=segment, TotalSegments=segments)
+                table = self._thread_table(table_name)
+                while not stop.is_set():
+                    response = table.scan(**kwargs)
+                    pages.put((response.get('Items', []), response.get('ScannedCount', 0)))
+                    if 'LastEvaluatedKey' not in response:
+                        break
+                    kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+            except Exception as e:
+                pages.put(e)
+            finally:
+                pages.put(done)
+        
+        scanned = 0
+        executor = ThreadPoolExecutor(max_workers=segments)
+        try:
+            for segment in range(segments):
+                executor.submit(scan_segment, segment)
+            remaining = segments
+            while remaining:
+                page = pages.get()
+                if page is done:
+                    remaining -= 1
+                    continue
+                if isinstance(page, Exception):
+                    raise page
+                items, page_scanned = page
+                scanned += page_scanned
+                if progress:
+                    progress(scanned)
+                yield from items
+        finally:
+            # Unblock scanners if the consumer stopped early or a segment failed
+            stop.set()
+            while not pages.empty():
+                pages.get_nowait()
+            executor.shutdown(wait=False)
+    
+    def _scan_all_posts(self, segments: Optional[int] = None, progress=None):
+        """Yield every blog post in the table (aggregate and index items skipped)"""
+        for item in self.parallel_scan(segments=segments, progress=progress):
+            if '#' not in item.get('blog_id', '#'):
+                yield inflate_content(item)
+    
+    def get_blog_stats(self, tag_limit: int = 20) -> Dict:
+        """
+        Read the aggregate counters without touching the posts themselves.
+        total_views is the stats item's own total (deleted posts' views and
+        rebuild corrections) plus the view total shards.
+        """
+        try:
+            stats = self.table.get_item(Key={'blog_id': STATS_KEY}).get('Item', {})
+            tag_keys = [{'blog_id': TAG_COUNT_PREFIX + tag} for tag in sorted(stats.get('tag_names', []))]
+            total_views = int(stats.get('total_views', 0))
+            tag_counts = []
+            # Tag counts and the view total shards come back in the same batched read
+            for item in self._batch_get_items(tag_keys + self._total_view_shard_keys()):
+                if item['blog_id'].startswith(VIEW_SHARD_PREFIX):
+                    total_views += int(item.get('total_views', 0))
+                elif item.get('post_count', 0) > 0:
+                    tag_counts.append((item['tag_name'], int(item['post_count'])))
+        except ClientError as e:
+            logger.error(f"Error getting blog stats: {e}")
+            stats, tag_counts, total_views = {}, [], 0
+        
+        tag_counts.sort(key=lambda x: (-x[1], x[0]))
+        return {
+            'total_posts': int(stats.get('total_posts', 0)),
+            'published_count': int(stats.get('published_count', 0)),
+            'draft_count': int(stats.get('draft_count', 0)),
+            'total_views': total_views,
+            'popular_tags': tag_counts[:tag_limit],
+            'recent_ids': list(stats.get('recent_ids', []))[:RECENT_POSTS_LIMIT],
+        }
+    
+    def tag_post_count(self, tag: str) -> int:
+        """Number of published posts carrying tag (in any case), from its TAGCOUNT# item"""
+        tag = tag.lower()
+        try:
+            item = self.table.get_item(Key={'blog_id': TAG_COUNT_PREFIX + tag}).get('Item', {})
+        except ClientError as e:
+            logger.error(f"Error getting post count for tag '{tag}': {e}")
+            return 0
+        return max(0, int(item.get('post_count', 0)))
+    
+    def rebuild_blog_stats(self) -> Dict:
+        """
+        Recompute every aggregate item from a full table scan. Tags stored
+        before they were normalised are rewritten in lower case on the way.
+        """
+        counters = {'total_posts': 0, 'published_count': 0, 'draft_count': 0, 'total_views': 0}
+        tag_counts = {}
+        recent = []
+        months = set()
+        total_shard_prefix = f"{VIEW_SHARD_PREFIX}{STATS_KEY}#"
+        total_shard_views = 0
+        
+        for item in self.parallel_scan():
+            blog_id = item.get('blog_id', '')
+            if blog_id.startswith(total_shard_prefix):
+                total_shard_views += int(item.get('total_views', 0))
+                continue
+            if blog_id.startswith(VIEW_SHARD_PREFIX):
+                counters['total_views'] += int(item.get('view_count', 0))
+                continue
+            if '#' in blog_id:
+                continue
+            tags = normalize_tags(item.get('tags'))
+            if tags != list(item.get('tags') or []):
+                self._rewrite_tags(item, tags)
+            item_counters, item_tags = self._stats_contribution(dict(item, tags=tags))
+            for key, value in item_counters.items():
+                counters[key] += value
+            for tag in item_tags:
+                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+            recent.append((item.get('created_date', ''), item['blog_id']))
+            if 'created_date' in item:
+                months.add(month_key(item['created_date']))
+        
+        recent.sort(reverse=True)
+        stats_values = dict(counters, recent_ids=[blog_id for _, blog_id in recent[:RECENT_POSTS_LIMIT]])
+        if months:
+            stats_values['first_month'] = min(months)
+        # The stored total is whatever the total's shards do not already hold
+        stats_values['total_views'] = counters['total_views'] - total_shard_views
+        
+        # Zero out tags that no longer have published posts
+        previous = self.table.get_item(Key={'blog_id': STATS_KEY}).get('Item', {})
+        all_tags = set(previous.get('tag_names', [])) | set(tag_counts)
+        if all_tags:
+            stats_values['tag_names'] = all_tags
+        
+        # SET rather than put_item so other attributes on the stats item survive
+        self.table.update_item(
+            Key={'blog_id': STATS_KEY},
+            UpdateExpression="SET " + ", ".join(f"{key} = :{key}" for key in stats_values),
+            ExpressionAttributeValues={f":{key}": value for key, value in stats_values.items()}
+        )
+        for tag in all_tags:
+            self.table.put_item(Item={
+                'blog_id': TAG_COUNT_PREFIX + tag,
+                'tag_name': tag,
+                'post_count': tag_counts.get(tag, 0),
+            })
+        
+        self._invalidate_cache()
+        logger.info(f"Rebuilt blog stats: {counters['total_posts']} posts, {len(tag_counts)} tags")
+        return dict(counters, tag_count=len(tag_counts))
+    
+    def _rewrite_tags(self, item: Dict, tags: List[str]):
+        """Store normalised tags on a post, unless its tags changed since it was read"""
+        try:
+            self.table.update_item(
+                Key={'blog_id': item['blog_id']},
+                UpdateExpression="SET tags = :tags",
+                ConditionExpression=Attr('tags').eq(item.get('tags')),
+                ExpressionAttributeValues={':tags': tags}
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+            logger.warning(f"Blog post {item['blog_id']} changed while normalising tags, skipped")
+    
+    # Search index ---------------------------------------------------------
+    
+    def _update_search_index(self, old_item: Optional[Dict], new_item: Optional[Dict]):
+        """
+        Keep the search postings in sync with a post write.
+        Only postings whose term frequency changed are written, in one BatchWriteItem stream.
+        """
+        old_terms = blog_search.term_frequencies(old_item) if old_item else {}
+        new_terms = blog_search.term_frequencies(new_item) if new_item else {}
+        blog_id = (new_item or old_item or {}).get('blog_id')
+        if not blog_id:
+            return
+        
+        old_length = sum(old_terms.values())
+        new_length = sum(new_terms.values())
+        
+        try:
+            with self.search_table.batch_writer() as batch:
+                for term in set(old_terms) - set(new_terms):
+                    batch.delete_item(Key={'term': term, 'blog_id': blog_id})
+                for term, frequency in new_terms.items():
+                    if old_terms.get(term) != frequency:
+                        batch.put_item(Item={'term': term, 'blog_id': blog_id, 'tf': frequency})
+                if not new_item:
+                    batch.delete_item(Key={'term': DOC_LENGTH_TERM, 'blog_id': blog_id})
+                elif not old_item or new_length != old_length:
+                    batch.put_item(Item={'term': DOC_LENGTH_TERM, 'blog_id': blog_id, 'length': new_length})
+            
+            doc_delta = (1 if new_item else 0) - (1 if old_item else 0)
+            length_delta = new_length - old_length
+            if doc_delta or length_delta:
+                self.table.update_item(
+                    Key={'blog_id': STATS_KEY},
+                    UpdateExpression="ADD search_docs :docs, search_length :length",
+                    ExpressionAttributeValues={':docs': doc_delta, ':length': length_delta}
+                )
+        except ClientError as e:
+            # The index can be rebuilt with `manage.py reindex_dynamo_blog_search`
+            logger.error(f"Error updating search index for {blog_id}: {e}")
+    
+    def _remove_from_search_index(self, old_items: List[Dict]):
+        """Drop several posts' postings from the index in one BatchWriteItem stream"""
+        total_length = 0
+        try:
+            with self.search_table.batch_writer() as batch:
+                for item in old_items:
+                    frequencies = blog_search.term_frequencies(item)
+                    total_length += sum(frequencies.values())
+                    for term in list(frequencies) + [DOC_LENGTH_TERM]:
+                        batch.delete_item(Key={'term': term, 'blog_id': item['blog_id']})
+            
+            if old_items:
+                self.table.update_item(
+                    Key={'blog_id': STATS_KEY},
+                    UpdateExpression="ADD search_docs :docs, search_length :length",
+                    ExpressionAttributeValues={':docs': -len(old_items), ':length': -total_length}
+                )
+        except ClientError as e:
+            # The index can be rebuilt with `manage.py reindex_dynamo_blog_search`
+            logger.error(f"Error removing posts from search index: {e}")
+    
+    def rebuild_search_index(self, progress=None) -> Dict:
+        """
+        Index all posts from scratch: write the postings that differ from the
+        search table, delete the ones no post has any more, and drop the legacy
+        TERM# items from the posts table.
+        """
+        postings = {}
+        terms = set()
+        total_docs = 0
+        total_length = 0
+        
+        for item in self._scan_all_posts(progress=progress):
+            frequencies = blog_search.term_frequencies(item)
+            length = sum(frequencies.values())
+            for term, frequency in frequencies.items():
+                postings[(term, item['blog_id'])] = ('tf', frequency)
+            postings[(DOC_LENGTH_TERM, item['blog_id'])] = ('length', length)
+            terms.update(frequencies)
+            total_docs += 1
+            total_length += length
+        
+        stale_keys = []
+        current = set()
+        for posting in self.parallel_scan(table_name=self.search_table_name):
+            key = (posting['term'], posting['blog_id'])
+            if key not in postings:
+                stale_keys.append(key)
+            elif posting.get(postings[key][0]) == postings[key][1]:
+                current.add(key)
+        
+        with self.search_table.batch_writer() as batch:
+            for term, blog_id in stale_keys:
+                batch.delete_item(Key={'term': term, 'blog_id': blog_id})
+            for (term, blog_id), (name, value) in postings.items():
+                if (term, blog_id) not in current:
+                    batch.put_item(Item={'term': term, 'blog_id': blog_id, name: value})
+        
+        legacy_keys = [
+            item['blog_id']
+            for item in self.parallel_scan(
+                FilterExpression=Attr('blog_id').begins_with(LEGACY_SEARCH_TERM_PREFIX),
+                ProjectionExpression='blog_id'
+            )
+        ]
+        with self.table.batch_writer() as batch:
+            for key in legacy_keys:
+                batch.delete_item(Key={'blog_id': key})
+        
+        self.table.update_item(
+            Key={'blog_id': STATS_KEY},
+            UpdateExpression="SET search_docs = :docs, search_length = :length",
+            ExpressionAttributeValues={':docs': total_docs, ':length': total_length}
+        )
+        
+        logger.info(f"Rebuilt search index: {total_docs} posts, {len(terms)} terms")
+        return {'posts': total_docs, 'terms': len(terms), 'removed_postings': len(stale_keys) + len(legacy_keys)}
+    
+    def _query_postings(self, term: str) -> Dict[str, int]:
+        """{blog_id: term frequency} for every post containing term"""
+        postings = {}
+        kwargs = {'KeyConditionExpression': Key('term').eq(term)}
+        while True:
+            response = self.search_table.query(**kwargs)
+            for posting in response.get('Items', []):
+                postings[posting['blog_id']] = int(posting['tf'])
+            if 'LastEvaluatedKey' not in response:
+                return postings
+            kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    
+    def search_blog_posts(self, search_term: str, limit: int = 20) -> List[Dict]:
+        """
+        Search blog posts through the inverted index, best matches first.
+        Each returned item carries a BM25 `search_score` and a highlighted `search_snippet`.
+        """
+        terms = sorted(set(blog_search.analyze(search_term)))
+        if not terms:
+            return []
+        
+        try:
+            frequencies = {term: self._query_postings(term) for term in terms}
+            candidates = sorted(set().union(*frequencies.values()))
+            length_keys = [{'term': DOC_LENGTH_TERM, 'blog_id': blog_id} for blog_id in candidates]
+            lengths = {
+                item['blog_id']: int(item['length'])
+                for item in self._batch_get_items(length_keys, table_name=self.search_table_name)
+            }
+            stats = self.table.get_item(Key={'blog_id': STATS_KEY}).get('Item', {})
+            
+            total_docs = int(stats.get('search_docs', 0))
+            average_length = int(stats.get('search_length', 0)) / total_docs if total_docs else 0
+            postings = {
+                term: {blog_id: (frequency, lengths.get(blog_id, average_length)) for blog_id, frequency in docs.items()}
+                for term, docs in frequencies.items()
+            }
+            scores = blog_search.bm25_scores(postings, total_docs, average_length)
+            ranked = sorted(scores, key=lambda blog_id: -scores[blog_id])
             
-            items = response.get('Items', [])
-            items.sort(key=lambda x: x.get('created_date', ''), reverse=True)
+            results = []
+            # Fetch the ranked posts a page at a time, skipping drafts
+            for start in range(0, len(ranked), limit):
+                for item in self.get_many(ranked[start:start + limit]):
+                    if not item.get('published', True):
+                        continue
+                    item['search_score'] = scores[item['blog_id']]
+                    text = item['plain_text'] if 'plain_text' in item else blog_search.plain_text(item.get('content', ''))
+                    item['search_snippet'] = blog_search.highlight_snippet(text, terms)
+                    results.append(item)
+                    if len(results) >= limit:
+                        break
+                if len(results) >= limit:
+                    break
             
-            return items
+            return results
         except ClientError as e:
             logger.error(f"Error searching blog posts: {e}")
             return []
 
 
-# Singleton instance
-blog_service = DynamoDBBlogService()
\ No newline at end of file
+# Singleton instance (created on first use, so importing this module never touches AWS)
+blog_service = SimpleLazyObject(DynamoDBBlogService)
\ No newline at end of file
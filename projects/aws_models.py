@@ -13,6 +13,15 @@ import json
 import uuid
 
 from .aws_blog_service import blog_service
+from .media_urls import resolve_image_url, resolve_image_urls
+
+
+def parse_dynamo_datetime(value) -> Optional[datetime]:
+    """Parse an ISO timestamp stored in DynamoDB"""
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return None
 
 
 class DynamoDBBlogPost(models.Model):
@@ -34,7 +43,7 @@ class DynamoDBBlogPost(models.Model):
     )
     image_urls = models.TextField(
         blank=True,
-        help_text="JSON array of image URLs (managed automatically)"
+        help_text="JSON array of image storage keys (managed automatically)"
     )
     tags = models.CharField(
         max_length=500,
@@ -53,17 +62,26 @@ class DynamoDBBlogPost(models.Model):
         help_text="Upload images for this blog post"
     )
     
+    # Derived text attributes, filled in from the stored DynamoDB item
+    plain_text = None
+    excerpt = ''
+    word_count = 0
+    reading_time = 1
+    
     def __str__(self):
         return self.title or f"Blog Post {self.blog_id}"
     
     @property
     def stripped_content(self):
         """Get content without HTML tags"""
+        if self.plain_text is not None:
+            return self.plain_text
+        # Unsaved admin edits, and posts stored before plain_text was backfilled
         return strip_tags(self.content)
     
     @property
-    def image_list(self) -> List[str]:
-        """Get list of image URLs"""
+    def image_keys(self) -> List[str]:
+        """Stored image values: storage keys (or URLs on posts not yet converted)"""
         if self.image_urls:
             try:
                 return json.loads(self.image_urls)
@@ -71,6 +89,17 @@ class DynamoDBBlogPost(models.Model):
                 return []
         return []
     
+    @property
+    def image_list(self) -> List[str]:
+        """Get list of image URLs, signed at render time"""
+        return resolve_image_urls(self.image_keys)
+    
+    @property
+    def cover_image(self) -> Optional[str]:
+        """First image URL, the only one list views read"""
+        keys = self.image_keys
+        return resolve_image_url(keys[0]) if keys else None
+    
     def get_tags_list(self) -> List[str]:
         """Get tags as a list"""
         if self.tags:
@@ -83,12 +112,12 @@ class DynamoDBBlogPost(models.Model):
         if not self.blog_id:
             self.blog_id = str(uuid.uuid4())
         
-        # Collect image URLs from related BlogImages
+        # Collect image storage keys from related BlogImages (URLs are signed when rendered)
         image_urls = []
         if self.pk:  # Only if object exists
             for blog_image in self.blog_images.all():
                 if blog_image.image:
-                    image_urls.append(blog_image.image.url)
+                    image_urls.append(blog_image.image.name)
         
         # Prepare data for DynamoDB
         blog_data = {
@@ -115,6 +144,9 @@ class DynamoDBBlogPost(models.Model):
         # Update image_urls field
         self.image_urls = json.dumps(image_urls)
         
+        # The stored plain text belongs to the previous content
+        self.plain_text = None
+        
         # Don't call super().save() since we're not using SQL database
         # Instead, mark the object as saved
         self._state.adding = False
@@ -132,6 +164,110 @@ class DynamoDBBlogPost(models.Model):
         return DynamoDBBlogPostManager()
 
 
+class DynamoDBBlogPostQuery:
+    """
+    Lazy, chainable blog post query translated into a single service read.
+    Supports the lookups in LOOKUPS, order_by('created_date'/'-created_date')
+    and [:n] slicing, which becomes the read limit.
+    """
+    LOOKUPS = {
+        'published': 'published',
+        'tags__contains': 'tag',
+        'created_date__gte': 'created_from',
+        'created_date__lt': 'created_before',
+        'blog_id__in': 'blog_ids',
+    }
+    
+    def __init__(self, manager, criteria=None, newest_first=True, limit=None, summary=False):
+        self._manager = manager
+        self._criteria = criteria or {}
+        self._newest_first = newest_first
+        self._limit = limit
+        self._summary = summary
+        self._results = None
+    
+    def _clone(self, **changes):
+        options = {
+            'criteria': dict(self._criteria),
+            'newest_first': self._newest_first,
+            'limit': self._limit,
+            'summary': self._summary,
+        }
+        options.update(changes)
+        return DynamoDBBlogPostQuery(self._manager, **options)
+    
+    def filter(self, **kwargs):
+        """Narrow the query; lookups are ANDed together"""
+        criteria = dict(self._criteria)
+        for lookup, value in kwargs.items():
+            if lookup not in self.LOOKUPS:
+                raise ValueError(f"Unsupported lookup '{lookup}' for DynamoDBBlogPost")
+            if lookup.startswith('created_date__') and isinstance(value, datetime):
+                # Stored dates are UTC ISO strings, so compare in the same form
+                if value.tzinfo is None:
+                    value = value.replace(tzinfo=timezone.utc)
+                value = value.astimezone(timezone.utc).isoformat()
+            elif lookup == 'blog_id__in':
+                value = list(value)
+            elif lookup == 'tags__contains':
+                # Tags are stored lower-cased, so tag lookups ignore case
+                value = value.lower()
+            criteria[self.LOOKUPS[lookup]] = value
+        return self._clone(criteria=criteria)
+    
+    def order_by(self, field: str):
+        """Order by created date, newest first with '-created_date'"""
+        if field not in ('created_date', '-created_date'):
+            raise ValueError(f"Unsupported ordering '{field}' for DynamoDBBlogPost")
+        return self._clone(newest_first=field.startswith('-'))
+    
+    def summaries(self):
+        """Read only the summary attributes and return BlogPostRecord objects"""
+        return self._clone(summary=True)
+    
+    def _fetch(self):
+        if self._results is None:
+            items = blog_service.find_blog_posts(
+                newest_first=self._newest_first,
+                limit=self._limit,
+                summary=self._summary,
+                **self._criteria
+            )
+            if self._summary:
+                self._results = [BlogPostRecord(item) for item in items]
+            else:
+                self._results = [self._manager._dynamo_to_django(item) for item in items]
+        return self._results
+    
+    def __getitem__(self, key):
+        if self._results is None and isinstance(key, slice) and key.stop is not None and key.step is None:
+            start = key.start or 0
+            if start >= 0 and key.stop >= 0:
+                limit = key.stop if self._limit is None else min(key.stop, self._limit)
+                return self._clone(limit=limit)._fetch()[start:]
+        return self._fetch()[key]
+    
+    def __iter__(self):
+        return iter(self._fetch())
+    
+    def __len__(self):
+        return len(self._fetch())
+    
+    def __bool__(self):
+        return bool(self._fetch())
+    
+    def count(self) -> int:
+        # Published posts per tag are a maintained aggregate, so paging a tag needs no full read
+        criteria = self._criteria
+        if self._results is None and self._limit is None and set(criteria) == {'published', 'tag'} and criteria['published'] is True:
+            return blog_service.tag_post_count(criteria['tag'])
+        return len(self._fetch())
+    
+    def first(self):
+        results = self[:1]
+        return results[0] if results else None
+
+
 class DynamoDBBlogPostManager:
     """Manager for DynamoDB blog post operations"""
     
@@ -140,6 +276,11 @@ class DynamoDBBlogPostManager:
         dynamo_posts = blog_service.get_all_blog_posts()
         return [self._dynamo_to_django(post) for post in dynamo_posts]
     
+    def summaries(self, limit: int = 50) -> List['BlogPostRecord']:
+        """Get published posts as lightweight records with only the summary attributes"""
+        dynamo_posts = blog_service.get_all_blog_posts(limit=limit, summary=True)
+        return [BlogPostRecord(post) for post in dynamo_posts]
+    
     def get(self, **kwargs):
         """Get a single blog post"""
         if 'pk' in kwargs:
@@ -155,15 +296,17 @@ class DynamoDBBlogPostManager:
         
         return self._dynamo_to_django(dynamo_post)
     
-    def filter(self, **kwargs):
-        """Filter blog posts (basic implementation)"""
-        all_posts = self.all()
-        
-        # Basic filtering
-        if 'published' in kwargs:
-            all_posts = [post for post in all_posts if post.published == kwargs['published']]
-        
-        return all_posts
+    def get_many(self, blog_ids: List[str]) -> List['DynamoDBBlogPost']:
+        """Get several blog posts with batched reads, in the order given"""
+        return [self._dynamo_to_django(item) for item in blog_service.get_many(blog_ids)]
+    
+    def filter(self, **kwargs) -> DynamoDBBlogPostQuery:
+        """Filter blog posts; see DynamoDBBlogPostQuery for supported lookups"""
+        return DynamoDBBlogPostQuery(self).filter(**kwargs)
+    
+    def order_by(self, field: str) -> DynamoDBBlogPostQuery:
+        """All blog posts in the given created date order"""
+        return DynamoDBBlogPostQuery(self).order_by(field)
     
     def create(self, **kwargs):
         """Create a new blog post"""
@@ -178,16 +321,10 @@ class DynamoDBBlogPostManager:
         updated_date = None
         
         if 'created_date' in dynamo_item:
-            try:
-                created_date = datetime.fromisoformat(dynamo_item['created_date'].replace('Z', '+00:00'))
-            except (ValueError, AttributeError):
-                created_date = datetime.now(timezone.utc)
+            created_date = parse_dynamo_datetime(dynamo_item['created_date']) or datetime.now(timezone.utc)
         
         if 'updated_date' in dynamo_item:
-            try:
-                updated_date = datetime.fromisoformat(dynamo_item['updated_date'].replace('Z', '+00:00'))
-            except (ValueError, AttributeError):
-                updated_date = created_date or datetime.now(timezone.utc)
+            updated_date = parse_dynamo_datetime(dynamo_item['updated_date']) or created_date or datetime.now(timezone.utc)
         
         # Create Django model instance
         blog_post = DynamoDBBlogPost(
@@ -202,6 +339,12 @@ class DynamoDBBlogPostManager:
             view_count=dynamo_item.get('view_count', 0)
         )
         
+        # Text attributes computed by the service on write (summary reads carry no content)
+        blog_post.excerpt = dynamo_item.get('excerpt', '')
+        blog_post.plain_text = dynamo_item.get('plain_text')
+        blog_post.word_count = dynamo_item.get('word_count', 0)
+        blog_post.reading_time = dynamo_item.get('reading_time', 1)
+        
         # Mark as not adding (existing record)
         blog_post._state.adding = False
         blog_post._state.db = 'default'
@@ -213,6 +356,77 @@ class DynamoDBBlogPostManager:
 DynamoDBBlogPost.objects = DynamoDBBlogPostManager()
 
 
+class BlogPostRecord:
+    """
+    Read-only view of a DynamoDB blog item for list and API paths.
+    Much cheaper to build than an unsaved DynamoDBBlogPost: lists stay native
+    and dates are only parsed when a template or serializer asks for them.
+    """
+    __slots__ = (
+        'blog_id', 'title', 'content', 'excerpt', 'plain_text', 'images', 'tags',
+        'published', 'view_count', 'word_count', 'reading_time',
+        'search_snippet', 'search_score',
+        '_created_raw', '_updated_raw', '_created_date', '_updated_date',
+    )
+    
+    def __init__(self, item: Dict):
+        self.blog_id = item.get('blog_id', '')
+        self.title = item.get('title', '')
+        self.content = item.get('content', '')
+        self.excerpt = item.get('excerpt', '')
+        self.plain_text = item.get('plain_text')
+        self.images = item.get('images') or []
+        self.tags = item.get('tags') or []
+        self.published = item.get('published', True)
+        self.view_count = item.get('view_count', 0)
+        self.word_count = item.get('word_count', 0)
+        self.reading_time = item.get('reading_time', 1)
+        self.search_snippet = item.get('search_snippet', '')
+        self.search_score = item.get('search_score', 0)
+        self._created_raw = item.get('created_date')
+        self._updated_raw = item.get('updated_date')
+        self._created_date = self._updated_date = None
+    
+    def __str__(self):
+        return self.title or f"Blog Post {self.blog_id}"
+    
+    @property
+    def pk(self):
+        return self.blog_id
+    
+    @property
+    def created_date(self) -> Optional[datetime]:
+        if self._created_date is None and self._created_raw:
+            self._created_date = parse_dynamo_datetime(self._created_raw)
+        return self._created_date
+    
+    @property
+    def updated_date(self) -> Optional[datetime]:
+        if self._updated_date is None and self._updated_raw:
+            self._updated_date = parse_dynamo_datetime(self._updated_raw)
+        return self._updated_date or self.created_date
+    
+    @property
+    def stripped_content(self) -> str:
+        """Stored plain text; derived from content on posts not yet backfilled, the excerpt on summaries"""
+        if self.plain_text is not None:
+            return self.plain_text
+        if self.content:
+            return strip_tags(self.content)
+        return self.excerpt
+    
+    @property
+    def image_list(self) -> List[str]:
+        return resolve_image_urls(self.images)
+    
+    @property
+    def cover_image(self) -> Optional[str]:
+        return resolve_image_url(self.images[0]) if self.images else None
+    
+    def get_tags_list(self) -> List[str]:
+        return self.tags
+
+
 class BlogImageS3(models.Model):
     """
     Enhanced BlogImages model with better S3 integration
@@ -243,7 +457,7 @@ class BlogImageS3(models.Model):
     
     @property
     def image_url(self):
-        """Get the S3 URL for this image"""
+        """Get the S3 URL for this image (signed URLs are cached)"""
         if self.image:
-            return self.image.url
+            return resolve_image_url(self.image.name)
         return None
\ No newline at end of file
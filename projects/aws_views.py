@@ -9,8 +9,10 @@ from django.contrib import messages
 from django.core.paginator import Paginator
 from django.views.decorators.cache import cache_page
 from django.views.decorators.http import require_http_methods
+from django.utils import timezone
+from datetime import MAXYEAR, MINYEAR, datetime
 from .aws_blog_service import blog_service
-from .aws_models import DynamoDBBlogPost
+from .aws_models import DynamoDBBlogPost, BlogPostRecord
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,8 +24,8 @@ def aws_blog(request):
     Display all published blog posts from DynamoDB
     """
     try:
-        # Get all blog posts from DynamoDB
-        blog_posts = DynamoDBBlogPost.objects.all()
+        # Summaries only: the list page never renders full content
+        blog_posts = DynamoDBBlogPost.objects.summaries()
         
         # Filter for published posts
         published_posts = [post for post in blog_posts if post.published]
@@ -105,14 +107,14 @@ def aws_blog_search(request):
         return redirect('aws_blog')
     
     try:
-        # Search using the blog service
+        # Search using the blog service (ranked by relevance)
         search_results = blog_service.search_blog_posts(search_query, limit=50)
         
-        # Convert DynamoDB results to Django model instances
+        # Convert DynamoDB results to read-only records
         blog_posts = []
         for item in search_results:
             try:
-                blog_post = DynamoDBBlogPost.objects._dynamo_to_django(item)
+                blog_post = BlogPostRecord(item)
                 if blog_post.published:  # Only show published posts
                     blog_posts.append(blog_post)
             except Exception as e:
@@ -145,14 +147,9 @@ def aws_blog_by_tag(request, tag):
     Display blog posts filtered by tag
     """
     try:
-        # Get all blog posts
-        all_posts = DynamoDBBlogPost.objects.all()
-        
-        # Filter by tag and published status
-        tagged_posts = []
-        for post in all_posts:
-            if post.published and tag.lower() in [t.lower() for t in post.get_tags_list()]:
-                tagged_posts.append(post)
+        # Tag and status are filtered by DynamoDB, and only summaries are read.
+        # The paginator counts from the tag's counter and reads up to the end of the page.
+        tagged_posts = DynamoDBBlogPost.objects.filter(published=True, tags__contains=tag).summaries()
         
         # Pagination
         paginator = Paginator(tagged_posts, 10)
@@ -164,7 +161,7 @@ def aws_blog_by_tag(request, tag):
             'page_obj': page_obj,
             'is_paginated': page_obj.has_other_pages(),
             'tag': tag,
-            'total_results': len(tagged_posts),
+            'total_results': paginator.count,
         }
         
         return render(request, 'projects/aws_blog_tag.html', context)
@@ -175,6 +172,47 @@ def aws_blog_by_tag(request, tag):
         return redirect('aws_blog')
 
 
+@cache_page(60 * 5)  # Cache for 5 minutes
+@require_http_methods(["GET"])
+def aws_blog_archive(request, year, month):
+    """
+    Display the published blog posts from one month, using the archive index
+    """
+    if not 1 <= month <= 12:
+        raise Http404("Invalid month")
+    # The bounds below (and their UTC offsets) must stay within datetime's range
+    if not MINYEAR < year < MAXYEAR:
+        raise Http404("Invalid year")
+    
+    # Month boundaries in site time; in UTC they span one or two index partitions
+    start = timezone.make_aware(datetime(year, month, 1))
+    end = timezone.make_aware(datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1))
+    
+    try:
+        archive_posts = list(
+            DynamoDBBlogPost.objects.filter(
+                published=True, created_date__gte=start, created_date__lt=end
+            ).summaries()
+        )
+    except Exception as e:
+        logger.error(f"Error loading blog archive {year}-{month:02d}: {e}")
+        messages.error(request, "Sorry, there was an error loading the blog posts. Please try again later.")
+        return redirect('aws_blog')
+    
+    paginator = Paginator(archive_posts, 10)
+    page_obj = paginator.get_page(request.GET.get('page'))
+    
+    context = {
+        'blogs': page_obj,
+        'page_obj': page_obj,
+        'is_paginated': page_obj.has_other_pages(),
+        'archive_month': start,
+        'total_results': len(archive_posts),
+    }
+    
+    return render(request, 'projects/aws_blog.html', context)
+
+
 @require_http_methods(["GET"])
 def aws_blog_api(request):
     """
@@ -184,8 +222,8 @@ def aws_blog_api(request):
         limit = int(request.GET.get('limit', 10))
         offset = int(request.GET.get('offset', 0))
         
-        # Get all published posts
-        all_posts = DynamoDBBlogPost.objects.all()
+        # Get all published post summaries
+        all_posts = DynamoDBBlogPost.objects.summaries()
         published_posts = [post for post in all_posts if post.published]
         
         # Apply pagination manually
@@ -197,10 +235,11 @@ def aws_blog_api(request):
             posts_data.append({
                 'id': post.blog_id,
                 'title': post.title,
-                'content': post.stripped_content[:200] + '...' if len(post.stripped_content) > 200 else post.stripped_content,
+                'content': post.excerpt,
                 'created_date': post.created_date.isoformat() if post.created_date else None,
                 'tags': post.get_tags_list(),
                 'image_urls': post.image_list,
+                'cover_image_url': post.cover_image,
                 'view_count': post.view_count,
             })
         
@@ -220,16 +259,7 @@ def get_popular_tags(limit=10):
     Helper function to get popular tags across all blog posts
     """
     try:
-        all_posts = DynamoDBBlogPost.objects.all()
-        tag_counts = {}
-        
-        for post in all_posts:
-            if post.published:
-                for tag in post.get_tags_list():
-                    tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        
-        # Sort by count and return top tags
-        popular_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)[:limit]
+        popular_tags = blog_service.get_blog_stats(tag_limit=limit)['popular_tags']
         return [tag for tag, count in popular_tags]
         
     except Exception as e:
@@ -245,24 +275,24 @@ def aws_blog_stats(request):
         raise Http404("Not found")
     
     try:
-        all_posts = DynamoDBBlogPost.objects.all()
-        
-        published_count = sum(1 for post in all_posts if post.published)
-        draft_count = sum(1 for post in all_posts if not post.published)
-        total_views = sum(post.view_count for post in all_posts)
-        
-        popular_tags = get_popular_tags(20)
+        # Counters are maintained by the blog service on every write
+        stats = blog_service.get_blog_stats(tag_limit=20)
         
         # Get recent posts
-        recent_posts = sorted(all_posts, key=lambda x: x.created_date or datetime.min, reverse=True)[:10]
+        recent_posts = [
+            BlogPostRecord(item)
+            for item in blog_service.get_many(stats['recent_ids'], summary=True)
+        ]
         
         context = {
-            'published_count': published_count,
-            'draft_count': draft_count,
-            'total_posts': len(all_posts),
-            'total_views': total_views,
-            'popular_tags': popular_tags,
+            'published_count': stats['published_count'],
+            'draft_count': stats['draft_count'],
+            'total_posts': stats['total_posts'],
+            'total_views': stats['total_views'],
+            'popular_tags': [tag for tag, count in stats['popular_tags']],
+            'tag_counts': stats['popular_tags'],
             'recent_posts': recent_posts,
+            'cache_stats': blog_service.cache.stats(),
         }
         
         return render(request, 'projects/aws_blog_stats.html', context)
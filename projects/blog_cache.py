@@ -0,0 +1,96 @@
+"""
+In-process read-through cache for DynamoDB blog reads.
+Each worker keeps its own copy, so entries are short-lived (TTL) and the blog
+service drops them explicitly whenever it writes the post they came from.
+Hit/miss/eviction counters are kept so the size and TTL can be tuned.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+
+class BlogItemCache:
+    """Thread-safe LRU cache with a TTL, holding post items and list pages"""
+
+    def __init__(self, ttl: float = 60, max_entries: int = 1000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def get(self, key: Hashable):
+        """Return the cached value, or None on a miss or expired entry"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def set_item(self, key: Hashable, item: Dict):
+        """
+        Cache a post item unless a newer version (by updated_date) is already
+        cached, so a slow read racing a write cannot put back a stale copy.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[1].get('updated_date', '') > item.get('updated_date', ''):
+                return
+        self.set(key, item)
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_matching(self, prefix: str, blog_id: Optional[str] = None):
+        """Drop every tuple key starting with prefix (and, if given, for blog_id)"""
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if key[0] == prefix and (blog_id is None or key[1] == blog_id)
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """Counters for sizing the cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
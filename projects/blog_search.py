@@ -0,0 +1,247 @@
+"""
+Text analysis and ranking for the DynamoDB blog search index.
+The service stores one (stem, blog_id) posting item per term in each post;
+this module turns post HTML into stemmed terms, scores postings with BM25
+and builds highlighted snippets for the results page.
+"""
+
+import html
+import math
+import re
+from typing import Dict, Iterable, List
+
+from django.utils.html import escape, strip_tags
+from django.utils.safestring import mark_safe
+
+# Title terms count this many times towards a post's term frequencies
+TITLE_WEIGHT = 3
+
+# BM25 tuning parameters (standard defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+SNIPPET_WORDS = 30
+EXCERPT_LENGTH = 200
+WORDS_PER_MINUTE = 200
+
+STOP_WORDS = frozenset("""
+a about after all also an and any are as at be been but by can could did do does
+for from had has have he her his how i if in into is it its just me my no not of
+on or our out over she so than that the their them then there these they this to
+up was we were what when which who will with you your
+""".split())
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def plain_text(content: str) -> str:
+    """Strip tags and entities from rich text content"""
+    return html.unescape(strip_tags(content or ''))
+
+
+def make_excerpt(text: str, length: int = EXCERPT_LENGTH) -> str:
+    """Plain-text excerpt stored with each post for list views"""
+    return text[:length] + '...' if len(text) > length else text
+
+
+def text_fields(content: str) -> Dict:
+    """Derived text attributes stored on every write so reads never parse HTML"""
+    text = plain_text(content)
+    word_count = len(text.split())
+    return {
+        'plain_text': text,
+        'excerpt': make_excerpt(text),
+        'word_count': word_count,
+        'reading_time': max(1, round(word_count / WORDS_PER_MINUTE)),
+    }
+
+
+def tokenize(text: str) -> List[str]:
+    """Split plain text into lowercase word tokens"""
+    return _WORD_RE.findall(text.lower())
+
+
+def analyze(text: str) -> List[str]:
+    """Tokenize, drop stop words and stem"""
+    return [stem(token) for token in tokenize(text) if token not in STOP_WORDS]
+
+
+def term_frequencies(item: Dict) -> Dict[str, int]:
+    """Weighted term frequencies for a blog post item"""
+    frequencies = {}
+    for term in analyze(item.get('title', '')):
+        frequencies[term] = frequencies.get(term, 0) + TITLE_WEIGHT
+    text = item['plain_text'] if 'plain_text' in item else plain_text(item.get('content', ''))
+    for term in analyze(text):
+        frequencies[term] = frequencies.get(term, 0) + 1
+    return frequencies
+
+
+def bm25_scores(postings: Dict[str, Dict[str, tuple]], total_docs: int, average_length: float) -> Dict[str, float]:
+    """
+    Score documents for a query.
+    postings maps each query term to {blog_id: (term_frequency, doc_length)}.
+    """
+    scores = {}
+    average_length = average_length or 1.0
+    for term_postings in postings.values():
+        doc_freq = len(term_postings)
+        if not doc_freq:
+            continue
+        idf = math.log(1 + (total_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+        for blog_id, (frequency, length) in term_postings.items():
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+            scores[blog_id] = scores.get(blog_id, 0.0) + idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+    return scores
+
+
+def highlight_snippet(text: str, terms: Iterable[str], length: int = SNIPPET_WORDS) -> str:
+    """Return an escaped excerpt around the first match with matches wrapped in <mark>"""
+    terms = set(terms)
+    words = text.split()
+    matches = [i for i, word in enumerate(words) if any(stem(t) in terms for t in tokenize(word))]
+
+    start = max(0, matches[0] - length // 3) if matches else 0
+    window = words[start:start + length]
+    matched = {i - start for i in matches}
+
+    parts = []
+    for i, word in enumerate(window):
+        parts.append(f'<mark>{escape(word)}</mark>' if i in matched else escape(word))
+
+    snippet = ' '.join(parts)
+    if start > 0:
+        snippet = '… ' + snippet
+    if start + length < len(words):
+        snippet += ' …'
+    return mark_safe(snippet)
+
+
+# Porter stemmer -------------------------------------------------------------
+
+_VOWELS = 'aeiou'
+
+
+def _is_consonant(word: str, i: int) -> bool:
+    if word[i] in _VOWELS:
+        return False
+    if word[i] == 'y':
+        return i == 0 or not _is_consonant(word, i - 1)
+    return True
+
+
+def _measure(stem_: str) -> int:
+    """Number of vowel-consonant sequences in the stem"""
+    count = 0
+    previous_vowel = False
+    for i in range(len(stem_)):
+        if _is_consonant(stem_, i):
+            if previous_vowel:
+                count += 1
+            previous_vowel = False
+        else:
+            previous_vowel = True
+    return count
+
+
+def _has_vowel(stem_: str) -> bool:
+    return any(not _is_consonant(stem_, i) for i in range(len(stem_)))
+
+
+def _ends_double_consonant(word: str) -> bool:
+    return len(word) >= 2 and word[-1] == word[-2] and _is_consonant(word, len(word) - 1)
+
+
+def _ends_cvc(word: str) -> bool:
+    return (
+        len(word) >= 3
+        and _is_consonant(word, len(word) - 3)
+        and not _is_consonant(word, len(word) - 2)
+        and _is_consonant(word, len(word) - 1)
+        and word[-1] not in 'wxy'
+    )
+
+
+_STEP2 = [
+    ('ational', 'ate'), ('tional', 'tion'), ('enci', 'ence'), ('anci', 'ance'),
+    ('izer', 'ize'), ('bli', 'ble'), ('alli', 'al'), ('entli', 'ent'), ('eli', 'e'),
+    ('ousli', 'ous'), ('ization', 'ize'), ('ation', 'ate'), ('ator', 'ate'),
+    ('alism', 'al'), ('iveness', 'ive'), ('fulness', 'ful'), ('ousness', 'ous'),
+    ('aliti', 'al'), ('iviti', 'ive'), ('biliti', 'ble'), ('logi', 'log'),
+]
+_STEP3 = [
+    ('icate', 'ic'), ('ative', ''), ('alize', 'al'), ('iciti', 'ic'),
+    ('ical', 'ic'), ('ful', ''), ('ness', ''),
+]
+_STEP4 = [
+    'al', 'ance', 'ence', 'er', 'ic', 'able', 'ible', 'ant', 'ement', 'ment',
+    'ent', 'ion', 'ou', 'ism', 'ate', 'iti', 'ous', 'ive', 'ize',
+]
+
+
+def _replace_suffix(word: str, rules, min_measure: int) -> str:
+    """Apply the longest matching rule whose stem has a large enough measure"""
+    for suffix, replacement in sorted(rules, key=lambda rule: -len(rule[0])):
+        if word.endswith(suffix):
+            stem_ = word[:-len(suffix)]
+            if _measure(stem_) > min_measure:
+                return stem_ + replacement
+            return word
+    return word
+
+
+def stem(word: str) -> str:
+    """Reduce an English word to its Porter stem"""
+    if len(word) <= 2 or not word.isalpha():
+        return word
+
+    # Step 1a: plurals
+    if word.endswith('sses'):
+        word = word[:-2]
+    elif word.endswith('ies'):
+        word = word[:-2]
+    elif word.endswith('s') and not word.endswith('ss'):
+        word = word[:-1]
+
+    # Step 1b: -eed, -ed, -ing
+    if word.endswith('eed'):
+        if _measure(word[:-3]) > 0:
+            word = word[:-1]
+    else:
+        for suffix in ('ed', 'ing'):
+            if word.endswith(suffix) and _has_vowel(word[:-len(suffix)]):
+                word = word[:-len(suffix)]
+                if word.endswith(('at', 'bl', 'iz')):
+                    word += 'e'
+                elif _ends_double_consonant(word) and word[-1] not in 'lsz':
+                    word = word[:-1]
+                elif _measure(word) == 1 and _ends_cvc(word):
+                    word += 'e'
+                break
+
+    # Step 1c: terminal y
+    if word.endswith('y') and _has_vowel(word[:-1]):
+        word = word[:-1] + 'i'
+
+    # Steps 2 and 3: double and derivational suffixes
+    word = _replace_suffix(word, _STEP2, 0)
+    word = _replace_suffix(word, _STEP3, 0)
+
+    # Step 4: residual suffixes
+    for suffix in sorted(_STEP4, key=len, reverse=True):
+        if word.endswith(suffix):
+            stem_ = word[:-len(suffix)]
+            if _measure(stem_) > 1 and (suffix != 'ion' or stem_.endswith(('s', 't'))):
+                word = stem_
+            break
+
+    # Step 5: tidy up final e and double l
+    if word.endswith('e'):
+        stem_ = word[:-1]
+        measure = _measure(stem_)
+        if measure > 1 or (measure == 1 and not _ends_cvc(stem_)):
+            word = stem_
+    if word.endswith('ll') and _measure(word) > 1:
+        word = word[:-1]
+
+    return word
@@ -0,0 +1,96 @@
+"""
+Caching for crawler documents (feeds and sitemaps).
+Each document depends on one or more content sections; a section's
+generation is bumped whenever its models change, so a document is rendered
+once and then served from the cache, with an ETag, until one of its sections
+changes. Generations are shared by all workers (see simple_blog_cache), so
+a long timeout is safe. The blog section follows the simple blog's
+generation and the legacy_blog section the legacy Blog posts; DynamoDB
+posts don't send Django signals, so documents including them also expire
+after BLOG_DOCUMENT_TIMEOUT.
+"""
+
+import hashlib
+from functools import wraps
+from typing import Callable, Iterable
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+
+from .models import Blog, Classes, Gallery, Sword_sales
+from .simple_blog_cache import bump_cache_generation, cache_generation
+
+DOCUMENT_CACHE_PREFIX = 'document:'
+SECTION_GENERATION_PREFIX = 'document-generation:'
+
+DOCUMENT_TIMEOUT = 24 * 60 * 60
+BLOG_DOCUMENT_TIMEOUT = 5 * 60
+
+# How long crawlers and proxies may reuse a document without revalidating
+CLIENT_MAX_AGE = 5 * 60
+
+SECTIONS = ('blog', 'gallery', 'sales', 'classes')
+
+
+def section_generation(section: str) -> int:
+    if section == 'blog':
+        return cache_generation()
+    return cache_generation(SECTION_GENERATION_PREFIX + section)
+
+
+def cached_document(sections: Callable[..., Iterable[str]]):
+    """
+    Cache a document view's body per host, path with query string (sitemap
+    pages are ?p=N) and section generations,
+    and answer conditional GETs with 304. sections(**view_kwargs) names the
+    sections the document depends on.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            depends_on = list(sections(**kwargs))
+            versions = ':'.join(f'{section}{section_generation(section)}' for section in depends_on)
+            identity = f'{request.get_host()}{request.get_full_path()}:{versions}'
+            key = DOCUMENT_CACHE_PREFIX + hashlib.md5(identity.encode()).hexdigest()
+
+            cached = cache.get(key)
+            if cached is None:
+                response = view(request, *args, **kwargs)
+                if hasattr(response, 'render'):
+                    response.render()
+                if response.status_code != 200:
+                    return response
+                cached = (response.content, response['Content-Type'])
+                cache.set(key, cached, BLOG_DOCUMENT_TIMEOUT if 'blog' in depends_on else DOCUMENT_TIMEOUT)
+
+            content, content_type = cached
+            etag = f'"{hashlib.md5(content).hexdigest()}"'
+            response = get_conditional_response(request, etag=etag) or HttpResponse(content, content_type=content_type)
+            response['ETag'] = etag
+            patch_cache_control(response, public=True, max_age=CLIENT_MAX_AGE)
+            return response
+        return wrapper
+    return decorator
+
+
+@receiver([post_save, post_delete], sender=Gallery)
+def _gallery_changed(sender, **kwargs):
+    bump_cache_generation(SECTION_GENERATION_PREFIX + 'gallery')
+
+
+@receiver([post_save, post_delete], sender=Sword_sales)
+def _sales_changed(sender, **kwargs):
+    bump_cache_generation(SECTION_GENERATION_PREFIX + 'sales')
+
+
+@receiver([post_save, post_delete], sender=Classes)
+def _classes_changed(sender, **kwargs):
+    bump_cache_generation(SECTION_GENERATION_PREFIX + 'classes')
+
+
+@receiver([post_save, post_delete], sender=Blog)
+def _legacy_blog_changed(sender, **kwargs):
+    bump_cache_generation(SECTION_GENERATION_PREFIX + 'legacy_blog')
@@ -0,0 +1,172 @@
+"""
+RSS and Atom feeds for the blog: the legacy posts on the blog page, plus the
+simple blog (SimpleBlogPost) and the DynamoDB blog wherever their detail
+routes are installed. Served through cached_document, so crawlers polling
+the feed get a cached body or a 304.
+"""
+
+import logging
+from datetime import datetime, time
+from typing import List, NamedTuple, Optional
+
+from django.conf import settings
+from django.contrib.syndication.views import Feed
+from django.urls import NoReverseMatch, reverse
+from django.utils import timezone
+from django.utils.feedgenerator import Atom1Feed
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+from .document_cache import cached_document
+from .models import Blog
+from .simple_aws_models import SimpleBlogPost
+
+logger = logging.getLogger(__name__)
+
+FEED_ITEMS = 30
+# DynamoDB posts are read newest first through the archive index; listings
+# without a limit (the sitemap) stop after this many instead of scanning the table
+DYNAMODB_ENTRIES_CAP = 1000
+
+
+class BlogEntry(NamedTuple):
+    """A blog post from either backend, as feeds and sitemaps need it"""
+    guid: str
+    title: str
+    link: str
+    description: str
+    published: datetime
+    updated: datetime
+
+
+def route_installed(name: str, *sample_args) -> bool:
+    """Whether a URL route is in the URLconf, so links to it can be built"""
+    try:
+        reverse(name, args=sample_args)
+    except NoReverseMatch:
+        return False
+    return True
+
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def _legacy_entries(limit: Optional[int]) -> List[BlogEntry]:
+    """Legacy posts have no page of their own; they link to the blog page"""
+    posts = Blog.objects.only('pk', 'date', 'updated', 'description').order_by('-date', '-pk')
+    blog_page = reverse('blog')
+    return [
+        BlogEntry(
+            guid=f'legacy-blog-{post.pk}',
+            title=post.date.strftime('%B %d, %Y'),
+            link=blog_page,
+            description=Truncator(strip_tags(post.description)).words(60),
+            published=timezone.make_aware(datetime.combine(post.date, time.min)),
+            updated=post.updated,
+        )
+        for post in (posts[:limit] if limit else posts)
+    ]
+
+
+def _simple_entries(limit: Optional[int]) -> List[BlogEntry]:
+    if not route_installed('simple_blog_detail', 'post'):
+        return []
+    posts = SimpleBlogPost.objects.published().only(
+        'pk', 'slug', 'title', 'excerpt', 'publish_date', 'updated_date'
+    ).order_by('-publish_date')
+    return [
+        BlogEntry(
+            guid=f'simple-blog-{post.pk}',
+            title=post.title,
+            link=reverse('simple_blog_detail', args=[post.slug]),
+            description=post.excerpt,
+            published=post.publish_date,
+            updated=post.updated_date,
+        )
+        for post in (posts[:limit] if limit else posts)
+    ]
+
+
+def _dynamodb_entries(limit: Optional[int]) -> List[BlogEntry]:
+    # Opt-in: building the service connects to (and may create) the AWS tables
+    if not getattr(settings, 'BLOG_FEEDS_INCLUDE_DYNAMODB', False):
+        return []
+    if not route_installed('aws_blog_detail', 'post'):
+        return []
+    try:
+        from .aws_blog_service import blog_service
+        items = blog_service.get_all_blog_posts(limit=limit or DYNAMODB_ENTRIES_CAP, summary=True)
+    except Exception as e:
+        logger.error(f"Error reading DynamoDB posts for feeds: {e}")
+        return []
+    entries = []
+    for item in items:
+        published = _parse_date(item.get('created_date'))
+        if published is None:
+            continue
+        entries.append(BlogEntry(
+            guid=f'aws-blog-{item["blog_id"]}',
+            title=item.get('title', ''),
+            link=reverse('aws_blog_detail', args=[item['blog_id']]),
+            description=item.get('excerpt', ''),
+            published=published,
+            updated=_parse_date(item.get('updated_date')) or published,
+        ))
+    return entries
+
+
+def blog_entries(limit: Optional[int] = FEED_ITEMS, include_legacy: bool = True) -> List[BlogEntry]:
+    """
+    Newest posts from every blog that can be linked to (all of them with
+    limit=None). include_legacy=False leaves out the legacy posts, which
+    all share the blog page's URL.
+    """
+    entries = _simple_entries(limit) + _dynamodb_entries(limit)
+    if include_legacy:
+        entries += _legacy_entries(limit)
+    entries.sort(key=lambda entry: entry.published, reverse=True)
+    return entries[:limit] if limit else entries
+
+
+class BlogFeed(Feed):
+    title = 'Omimi Blog'
+    description = 'New posts from the Omimi Swords blog'
+
+    def link(self):
+        return reverse('blog')
+
+    def items(self):
+        return blog_entries()
+
+    def item_title(self, item):
+        return item.title
+
+    def item_description(self, item):
+        return item.description
+
+    def item_link(self, item):
+        return item.link
+
+    def item_guid(self, item):
+        return item.guid
+
+    item_guid_is_permalink = False
+
+    def item_pubdate(self, item):
+        return item.published
+
+    def item_updateddate(self, item):
+        return item.updated
+
+
+class AtomBlogFeed(BlogFeed):
+    feed_type = Atom1Feed
+    subtitle = BlogFeed.description
+
+
+blog_feed = cached_document(lambda **kwargs: ['blog', 'legacy_blog'])(BlogFeed())
+blog_atom_feed = cached_document(lambda **kwargs: ['blog', 'legacy_blog'])(AtomBlogFeed())
@@ -0,0 +1,963 @@
+"""
+Local stand-in for the DynamoDB resource used by the blog service.
+Implements the subset of the boto3 resource/Table API that DynamoDBBlogService
+relies on, with DynamoDB's item, expression, Limit and pagination semantics,
+so the blog can run, be load-tested and be regression-tested without AWS.
+
+Select it with the BLOG_STORAGE_BACKEND setting ('memory' or 'sqlite').
+"""
+
+import copy
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from bisect import bisect_right, insort
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from boto3.dynamodb import conditions
+from boto3.dynamodb.types import Binary
+from botocore.exceptions import ClientError
+
+# Service limits mirrored from DynamoDB
+MAX_ITEM_SIZE = 400 * 1024
+MAX_PAGE_SIZE = 1024 * 1024
+MAX_BATCH_GET = 100
+MAX_BATCH_WRITE = 25
+
+
+def _error(code: str, message: str, operation: str) -> ClientError:
+    return ClientError({'Error': {'Code': code, 'Message': message}}, operation)
+
+
+# Values ---------------------------------------------------------------------
+
+def _normalize(value, operation: str):
+    """Convert a Python value the way boto3's serializer would, and copy it"""
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, float):
+        raise TypeError('Float types are not supported. Use Decimal types instead.')
+    if isinstance(value, int):
+        return Decimal(value)
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, (bytes, bytearray)):
+        return Binary(bytes(value))
+    if isinstance(value, Binary):
+        return Binary(value.value)
+    if isinstance(value, (set, frozenset)):
+        if not value:
+            raise _error('ValidationException', 'One or more parameter values were invalid: An empty set is not allowed', operation)
+        return {_normalize(v, operation) for v in value}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v, operation) for v in value]
+    if isinstance(value, dict):
+        return {k: _normalize(v, operation) for k, v in value.items()}
+    raise TypeError(f'Unsupported type "{type(value)}" for value "{value}"')
+
+
+def _value_size(value) -> int:
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    if isinstance(value, Binary):
+        return len(value.value)
+    if isinstance(value, (bool,)) or value is None:
+        return 1
+    if isinstance(value, Decimal):
+        return len(str(value)) // 2 + 1
+    if isinstance(value, (set, list)):
+        return 3 + sum(_value_size(v) for v in value)
+    if isinstance(value, dict):
+        return 3 + sum(len(k.encode('utf-8')) + _value_size(v) for k, v in value.items())
+    return 0
+
+
+def item_size(item: Dict) -> int:
+    """Approximate DynamoDB item size in bytes (attribute names plus values)"""
+    return sum(len(name.encode('utf-8')) + _value_size(value) for name, value in item.items())
+
+
+def _encode(value):
+    """Tagged JSON encoding that keeps Decimal, set and binary types"""
+    if isinstance(value, Decimal):
+        return {'N': str(value)}
+    if isinstance(value, Binary):
+        return {'B': value.value.hex()}
+    if isinstance(value, set):
+        return {'SET': [_encode(v) for v in sorted(value, key=str)]}
+    if isinstance(value, list):
+        return {'L': [_encode(v) for v in value]}
+    if isinstance(value, dict):
+        return {'M': {k: _encode(v) for k, v in value.items()}}
+    return {'V': value}
+
+
+def _decode(data):
+    kind, value = next(iter(data.items()))
+    if kind == 'N':
+        return Decimal(value)
+    if kind == 'B':
+        return Binary(bytes.fromhex(value))
+    if kind == 'SET':
+        return {_decode(v) for v in value}
+    if kind == 'L':
+        return [_decode(v) for v in value]
+    if kind == 'M':
+        return {k: _decode(v) for k, v in value.items()}
+    return value
+
+
+# Document paths ---------------------------------------------------------------
+
+_PATH_TOKEN_RE = re.compile(r'\s*(?:(?P<name>#?[A-Za-z_][\w\-]*)|\[(?P<index>\d+)\]|(?P<dot>\.))')
+
+
+def _parse_path(text: str, names: Optional[Dict] = None) -> List:
+    """Parse 'a.b[0]' or '#a[1]' into a list of map keys and list indexes"""
+    segments = []
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        match = _PATH_TOKEN_RE.match(text, position)
+        if not match:
+            raise ValueError(f'Invalid document path: {text}')
+        if match.group('name'):
+            name = match.group('name')
+            if name.startswith('#'):
+                if not names or name not in names:
+                    raise ValueError(f'Undefined attribute name placeholder: {name}')
+                name = names[name]
+            segments.append(name)
+        elif match.group('index'):
+            segments.append(int(match.group('index')))
+        position = match.end()
+    return segments
+
+
+_MISSING = object()
+
+
+def _resolve(item, segments):
+    current = item
+    for segment in segments:
+        if isinstance(segment, int):
+            if not isinstance(current, list) or segment >= len(current):
+                return _MISSING
+            current = current[segment]
+        else:
+            if not isinstance(current, dict) or segment not in current:
+                return _MISSING
+            current = current[segment]
+    return current
+
+
+def _assign(item, segments, value, operation):
+    parent = _resolve(item, segments[:-1])
+    last = segments[-1]
+    if isinstance(last, int) and isinstance(parent, list):
+        if last >= len(parent):
+            parent.append(value)
+        else:
+            parent[last] = value
+    elif isinstance(last, str) and isinstance(parent, dict):
+        parent[last] = value
+    else:
+        raise _error('ValidationException',
+                     'The document path provided in the update expression is invalid for update', operation)
+
+
+def _project(item: Dict, paths: List[List]) -> Dict:
+    """Build the item subset named by a ProjectionExpression"""
+    projected = {}
+    for segments in paths:
+        value = _resolve(item, segments)
+        if value is _MISSING:
+            continue
+        target = projected
+        source = item
+        for depth, segment in enumerate(segments):
+            source = source[segment]
+            if depth == len(segments) - 1:
+                if isinstance(target, list):
+                    target.append(copy.deepcopy(source))
+                else:
+                    target[segment] = copy.deepcopy(source)
+                break
+            container = [] if isinstance(source, list) else {}
+            if isinstance(target, list):
+                target.append(container)
+                target = container
+            else:
+                target = target.setdefault(segment, container)
+    return projected
+
+
+def _parse_projection(expression: Optional[str], names: Optional[Dict]):
+    if not expression:
+        return None
+    return [_parse_path(part, names) for part in expression.split(',')]
+
+
+# Condition objects --------------------------------------------------------------
+
+def _operand(item, operand):
+    if isinstance(operand, conditions.Size):
+        value = _operand(item, operand._values[0])
+        if value is _MISSING:
+            return _MISSING
+        return Decimal(len(value.value if isinstance(value, Binary) else value))
+    if isinstance(operand, conditions.AttributeBase):
+        return _resolve(item, _parse_path(operand.name))
+    return _normalize(operand, 'Condition')
+
+
+def _compare(left, right, op):
+    if left is _MISSING or right is _MISSING:
+        return False
+    try:
+        return op(left, right)
+    except TypeError:
+        return False
+
+
+def validate_condition(condition, operation: str):
+    """
+    Raise the ValidationException DynamoDB gives for a malformed expression
+    when the stand-in can't evaluate a condition, before any item is read
+    """
+    if condition is None:
+        return
+    if isinstance(condition, str):
+        raise _error(
+            'ValidationException',
+            'The local DynamoDB stand-in only evaluates boto3 condition objects, not expression strings',
+            operation
+        )
+    if isinstance(condition, (conditions.And, conditions.Or, conditions.Not)):
+        for value in condition._values:
+            validate_condition(value, operation)
+    elif not isinstance(condition, _CONDITION_TYPES):
+        raise _error('ValidationException', f'Unsupported condition: {type(condition).__name__}', operation)
+
+
+def evaluate_condition(condition, item: Dict) -> bool:
+    """Evaluate a boto3 Attr/Key condition object (checked by validate_condition) against an item"""
+    if condition is None:
+        return True
+
+    values = condition._values
+    if isinstance(condition, conditions.And):
+        return evaluate_condition(values[0], item) and evaluate_condition(values[1], item)
+    if isinstance(condition, conditions.Or):
+        return evaluate_condition(values[0], item) or evaluate_condition(values[1], item)
+    if isinstance(condition, conditions.Not):
+        return not evaluate_condition(values[0], item)
+    if isinstance(condition, conditions.AttributeExists):
+        return _operand(item, values[0]) is not _MISSING
+    if isinstance(condition, conditions.AttributeNotExists):
+        return _operand(item, values[0]) is _MISSING
+
+    left = _operand(item, values[0])
+    if isinstance(condition, conditions.Equals):
+        return _compare(left, _operand(item, values[1]), lambda a, b: a == b)
+    if isinstance(condition, conditions.NotEquals):
+        return left is _MISSING or _compare(left, _operand(item, values[1]), lambda a, b: a != b)
+    if isinstance(condition, conditions.LessThan):
+        return _compare(left, _operand(item, values[1]), lambda a, b: a < b)
+    if isinstance(condition, conditions.LessThanEquals):
+        return _compare(left, _operand(item, values[1]), lambda a, b: a <= b)
+    if isinstance(condition, conditions.GreaterThan):
+        return _compare(left, _operand(item, values[1]), lambda a, b: a > b)
+    if isinstance(condition, conditions.GreaterThanEquals):
+        return _compare(left, _operand(item, values[1]), lambda a, b: a >= b)
+    if isinstance(condition, conditions.Between):
+        low, high = _operand(item, values[1]), _operand(item, values[2])
+        return _compare(left, low, lambda a, b: a >= b) and _compare(left, high, lambda a, b: a <= b)
+    if isinstance(condition, conditions.In):
+        return left is not _MISSING and left in [_normalize(v, 'Condition') for v in values[1]]
+    if isinstance(condition, conditions.BeginsWith):
+        return _compare(left, _operand(item, values[1]), lambda a, b: a.startswith(b))
+    if isinstance(condition, conditions.Contains):
+        right = _operand(item, values[1])
+        return _compare(left, right, lambda a, b: b in a)
+    if isinstance(condition, conditions.AttributeType):
+        return left is not _MISSING and _type_code(left) == values[1]
+    raise _error('ValidationException', f'Unsupported condition: {type(condition).__name__}', 'Condition')
+
+
+_CONDITION_TYPES = (
+    conditions.AttributeExists, conditions.AttributeNotExists, conditions.Equals, conditions.NotEquals,
+    conditions.LessThan, conditions.LessThanEquals, conditions.GreaterThan, conditions.GreaterThanEquals,
+    conditions.Between, conditions.In, conditions.BeginsWith, conditions.Contains, conditions.AttributeType,
+)
+
+
+def _type_code(value) -> str:
+    if isinstance(value, bool):
+        return 'BOOL'
+    if value is None:
+        return 'NULL'
+    if isinstance(value, str):
+        return 'S'
+    if isinstance(value, Decimal):
+        return 'N'
+    if isinstance(value, Binary):
+        return 'B'
+    if isinstance(value, list):
+        return 'L'
+    if isinstance(value, dict):
+        return 'M'
+    if isinstance(value, set):
+        sample = next(iter(value))
+        return {'S': 'SS', 'N': 'NS', 'B': 'BS'}[_type_code(sample)]
+    return '?'
+
+
+# Update expressions ---------------------------------------------------------------
+
+_UPDATE_TOKEN_RE = re.compile(
+    r'\s*(?:(?P<name>#?[A-Za-z_][\w\-]*)|(?P<value>:[\w\-]+)|(?P<index>\[\d+\])|(?P<op>[.,()=+\-]))'
+)
+_CLAUSES = {'SET', 'REMOVE', 'ADD', 'DELETE'}
+
+
+class _UpdateParser:
+    """Recursive-descent parser for DynamoDB UpdateExpression strings"""
+
+    def __init__(self, expression: str, names: Optional[Dict], values: Optional[Dict]):
+        self.tokens = []
+        position = 0
+        expression = expression.strip()
+        while position < len(expression):
+            match = _UPDATE_TOKEN_RE.match(expression, position)
+            if not match or match.end() == position:
+                raise ValueError(f'Invalid UpdateExpression near: {expression[position:]}')
+            kind = match.lastgroup
+            self.tokens.append((kind, match.group(kind)))
+            position = match.end()
+        self.position = 0
+        self.names = names or {}
+        self.values = values or {}
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def take(self, expected=None):
+        token = self.peek()
+        if expected is not None and token[1] != expected:
+            raise ValueError(f'Expected "{expected}" in UpdateExpression, got "{token[1]}"')
+        self.position += 1
+        return token
+
+    def is_clause(self):
+        kind, text = self.peek()
+        return kind == 'name' and text.upper() in _CLAUSES
+
+    def parse(self):
+        actions = []
+        while self.peek()[0] is not None:
+            if not self.is_clause():
+                raise ValueError(f'Expected SET, REMOVE, ADD or DELETE, got "{self.peek()[1]}"')
+            clause = self.take()[1].upper()
+            while True:
+                actions.append(self.parse_action(clause))
+                if self.peek()[1] == ',':
+                    self.take(',')
+                    continue
+                break
+        return actions
+
+    def parse_action(self, clause):
+        path = self.parse_path()
+        if clause == 'SET':
+            self.take('=')
+            return clause, path, self.parse_value()
+        if clause == 'REMOVE':
+            return clause, path, None
+        return clause, path, self.parse_operand()
+
+    def parse_path(self):
+        kind, text = self.take()
+        if kind != 'name':
+            raise ValueError(f'Expected an attribute name, got "{text}"')
+        segments = [self.names[text] if text.startswith('#') else text]
+        if text.startswith('#') and text not in self.names:
+            raise ValueError(f'Undefined attribute name placeholder: {text}')
+        while True:
+            kind, text = self.peek()
+            if kind == 'index':
+                self.take()
+                segments.append(int(text[1:-1]))
+            elif text == '.':
+                self.take()
+                name = self.take()[1]
+                segments.append(self.names[name] if name.startswith('#') else name)
+            else:
+                return segments
+
+    def parse_value(self):
+        left = self.parse_operand()
+        if self.peek()[1] in ('+', '-'):
+            op = self.take()[1]
+            return (op, left, self.parse_operand())
+        return left
+
+    def parse_operand(self):
+        kind, text = self.peek()
+        if kind == 'value':
+            self.take()
+            if text not in self.values:
+                raise ValueError(f'Undefined attribute value placeholder: {text}')
+            return ('value', self.values[text])
+        if kind == 'name' and text in ('if_not_exists', 'list_append'):
+            self.take()
+            self.take('(')
+            first = self.parse_path() if text == 'if_not_exists' else self.parse_operand()
+            self.take(',')
+            second = self.parse_operand()
+            self.take(')')
+            return (text, first, second)
+        return ('path', self.parse_path())
+
+
+def _evaluate_operand(item, node, operation):
+    kind = node[0]
+    if kind == 'value':
+        return _normalize(node[1], operation)
+    if kind == 'path':
+        value = _resolve(item, node[1])
+        if value is _MISSING:
+            raise _error('ValidationException',
+                         'The provided expression refers to an attribute that does not exist in the item', operation)
+        return copy.deepcopy(value)
+    if kind == 'if_not_exists':
+        value = _resolve(item, node[1])
+        return copy.deepcopy(value) if value is not _MISSING else _evaluate_operand(item, node[2], operation)
+    if kind == 'list_append':
+        first = _evaluate_operand(item, node[1], operation)
+        second = _evaluate_operand(item, node[2], operation)
+        if not isinstance(first, list) or not isinstance(second, list):
+            raise _error('ValidationException', 'Incorrect operand type for operator or function', operation)
+        return first + second
+    if kind in ('+', '-'):
+        left = _evaluate_operand(item, node[1], operation)
+        right = _evaluate_operand(item, node[2], operation)
+        if not isinstance(left, Decimal) or not isinstance(right, Decimal):
+            raise _error('ValidationException', 'Incorrect operand type for operator or function', operation)
+        return left + right if kind == '+' else left - right
+    raise ValueError(f'Unknown operand {kind}')
+
+
+def apply_update(item: Dict, expression: str, names: Optional[Dict], values: Optional[Dict]):
+    """Apply an UpdateExpression to a copy of item, returning (new_item, touched top-level names)"""
+    operation = 'UpdateItem'
+    try:
+        actions = _UpdateParser(expression, names, values).parse()
+    except ValueError as e:
+        raise _error('ValidationException', str(e), operation)
+
+    # Every operand is evaluated against the item as it was before the update
+    original = item
+    updated = copy.deepcopy(item)
+    touched = set()
+    removals = []
+
+    for clause, path, operand in actions:
+        touched.add(path[0])
+        if clause == 'SET':
+            _assign(updated, path, _evaluate_operand(original, operand, operation), operation)
+        elif clause == 'REMOVE':
+            removals.append(path)
+        elif clause == 'ADD':
+            increment = _evaluate_operand(original, operand, operation)
+            current = _resolve(original, path)
+            if isinstance(increment, Decimal):
+                if current is _MISSING:
+                    current = Decimal(0)
+                if not isinstance(current, Decimal):
+                    raise _error('ValidationException', 'An operand in the update expression has an incorrect data type', operation)
+                _assign(updated, path, current + increment, operation)
+            elif isinstance(increment, set):
+                current = set() if current is _MISSING else set(current)
+                _assign(updated, path, current | increment, operation)
+            else:
+                raise _error('ValidationException', 'ADD only supports numbers and sets', operation)
+        elif clause == 'DELETE':
+            subtract = _evaluate_operand(original, operand, operation)
+            current = _resolve(original, path)
+            if current is not _MISSING:
+                remaining = set(current) - set(subtract)
+                if remaining:
+                    _assign(updated, path, remaining, operation)
+                else:
+                    removals.append(path)
+
+    # Remove list elements from the highest index down so positions stay valid
+    for path in sorted(removals, key=lambda p: [(-s if isinstance(s, int) else 0) for s in p]):
+        parent = _resolve(updated, path[:-1])
+        last = path[-1]
+        if isinstance(last, int) and isinstance(parent, list) and last < len(parent):
+            del parent[last]
+        elif isinstance(last, str) and isinstance(parent, dict):
+            parent.pop(last, None)
+
+    return updated, touched
+
+
+# Storage ---------------------------------------------------------------------------
+
+def _position(key_values) -> str:
+    """Stable pseudo-random ordering, like DynamoDB's partition hash"""
+    return hashlib.md5(json.dumps([str(v) for v in key_values]).encode('utf-8')).hexdigest()
+
+
+class _MemoryStore:
+    """Items held in process memory"""
+
+    def __init__(self):
+        self.definitions = {}
+        self.items = {}
+        self.order = {}
+
+    def get_definition(self, table):
+        return self.definitions.get(table)
+
+    def set_definition(self, table, definition):
+        self.definitions[table] = definition
+        self.items.setdefault(table, {})
+        self.order.setdefault(table, [])
+
+    def get(self, table, pk):
+        entry = self.items[table].get(pk)
+        return entry[1] if entry else None
+
+    def put(self, table, pk, position, item):
+        if pk not in self.items[table]:
+            insort(self.order[table], (position, pk))
+        self.items[table][pk] = (position, item)
+
+    def delete(self, table, pk):
+        entry = self.items[table].pop(pk, None)
+        if entry:
+            self.order[table].remove((entry[0], pk))
+
+    def scan(self, table, after_position=None):
+        order = self.order[table]
+        start = bisect_right(order, (after_position, chr(0x10FFFF))) if after_position else 0
+        for position, pk in order[start:]:
+            entry = self.items[table].get(pk)
+            if entry:
+                yield position, entry[1]
+
+
+class _SQLiteStore:
+    """Items persisted in a SQLite file, one JSON document per item"""
+
+    def __init__(self, path):
+        self.connection = sqlite3.connect(str(path), check_same_thread=False)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS dynamo_tables (name TEXT PRIMARY KEY, definition TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS dynamo_items (
+                table_name TEXT NOT NULL,
+                pk TEXT NOT NULL,
+                position TEXT NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (table_name, pk)
+            );
+            CREATE INDEX IF NOT EXISTS dynamo_items_position ON dynamo_items (table_name, position);
+        """)
+
+    def get_definition(self, table):
+        row = self.connection.execute('SELECT definition FROM dynamo_tables WHERE name = ?', (table,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_definition(self, table, definition):
+        with self.connection:
+            self.connection.execute('INSERT OR REPLACE INTO dynamo_tables VALUES (?, ?)', (table, json.dumps(definition)))
+
+    def get(self, table, pk):
+        row = self.connection.execute(
+            'SELECT data FROM dynamo_items WHERE table_name = ? AND pk = ?', (table, pk)
+        ).fetchone()
+        return _decode(json.loads(row[0])) if row else None
+
+    def put(self, table, pk, position, item):
+        with self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO dynamo_items VALUES (?, ?, ?, ?)',
+                (table, pk, position, json.dumps(_encode(item)))
+            )
+
+    def delete(self, table, pk):
+        with self.connection:
+            self.connection.execute('DELETE FROM dynamo_items WHERE table_name = ? AND pk = ?', (table, pk))
+
+    def scan(self, table, after_position=None):
+        rows = self.connection.execute(
+            'SELECT position, data FROM dynamo_items WHERE table_name = ? AND position > ? ORDER BY position, pk',
+            (table, after_position or '')
+        ).fetchall()
+        for position, data in rows:
+            yield position, _decode(json.loads(data))
+
+
+# Resource and table -------------------------------------------------------------------
+
+class LocalDynamoDBResource:
+    """
+    Drop-in for boto3.resource('dynamodb') backed by memory or a SQLite file.
+    item_write_limit, if set, caps writes per item per second and raises
+    ProvisionedThroughputExceededException beyond it, approximating DynamoDB's
+    per-partition throughput limit for hot-key load tests.
+    """
+
+    def __init__(self, path=None, item_write_limit=None):
+        self._store = _SQLiteStore(path) if path else _MemoryStore()
+        self._lock = threading.RLock()
+        self.item_write_limit = item_write_limit
+        self._write_windows = {}  # (table, pk) -> (second, writes)
+
+    def _count_write(self, table, pk, operation):
+        """Called with the lock held before every write"""
+        if not self.item_write_limit:
+            return
+        second = int(time.monotonic())
+        window, writes = self._write_windows.get((table, pk), (second, 0))
+        if window != second:
+            writes = 0
+        if writes >= self.item_write_limit:
+            raise _error('ProvisionedThroughputExceededException', 'The level of configured provisioned throughput for the table was exceeded', operation)
+        self._write_windows[(table, pk)] = (second, writes + 1)
+
+    def Table(self, name):
+        return LocalTable(self, name)
+
+    def create_table(self, TableName, KeySchema, AttributeDefinitions=None, GlobalSecondaryIndexes=None, **kwargs):
+        with self._lock:
+            if self._store.get_definition(TableName):
+                raise _error('ResourceInUseException', f'Table already exists: {TableName}', 'CreateTable')
+            indexes = {}
+            for index in GlobalSecondaryIndexes or []:
+                indexes[index['IndexName']] = {
+                    'keys': [k['AttributeName'] for k in index['KeySchema']],
+                    'projection': index.get('Projection', {'ProjectionType': 'ALL'}),
+                }
+            self._store.set_definition(TableName, {
+                'keys': [k['AttributeName'] for k in KeySchema],
+                'indexes': indexes,
+            })
+        return self.Table(TableName)
+
+    def batch_get_item(self, RequestItems):
+        total = sum(len(request['Keys']) for request in RequestItems.values())
+        if total > MAX_BATCH_GET:
+            raise _error('ValidationException', 'Too many items requested for the BatchGetItem call', 'BatchGetItem')
+        responses = {}
+        for table_name, request in RequestItems.items():
+            table = self.Table(table_name)
+            found = []
+            for key in request['Keys']:
+                item = table.get_item(
+                    Key=key,
+                    ProjectionExpression=request.get('ProjectionExpression'),
+                    ExpressionAttributeNames=request.get('ExpressionAttributeNames'),
+                ).get('Item')
+                if item is not None:
+                    found.append(item)
+            responses[table_name] = found
+        return {'Responses': responses, 'UnprocessedKeys': {}}
+
+    def batch_write_item(self, RequestItems):
+        total = sum(len(requests) for requests in RequestItems.values())
+        if total > MAX_BATCH_WRITE:
+            raise _error('ValidationException', 'Too many items requested for the BatchWriteItem call', 'BatchWriteItem')
+        for table_name, requests in RequestItems.items():
+            table = self.Table(table_name)
+            for request in requests:
+                if 'PutRequest' in request:
+                    table.put_item(Item=request['PutRequest']['Item'])
+                else:
+                    table.delete_item(Key=request['DeleteRequest']['Key'])
+        return {'UnprocessedItems': {}}
+
+
+class LocalTable:
+    """Subset of boto3's Table resource"""
+
+    def __init__(self, resource: LocalDynamoDBResource, name: str):
+        self.resource = resource
+        self.name = name
+        self.table_name = name
+
+    # Table metadata
+
+    @property
+    def _definition(self):
+        with self.resource._lock:
+            definition = self.resource._store.get_definition(self.name)
+        if definition is None:
+            raise _error('ResourceNotFoundException', f'Requested resource not found: Table: {self.name} not found', 'DescribeTable')
+        return definition
+
+    def load(self):
+        self._definition
+
+    def wait_until_exists(self):
+        self._definition
+
+    def reload(self):
+        self._definition
+
+    @property
+    def key_names(self):
+        return self._definition['keys']
+
+    @property
+    def table_status(self):
+        self._definition
+        return 'ACTIVE'
+
+    @property
+    def global_secondary_indexes(self):
+        return [
+            {
+                'IndexName': name,
+                'KeySchema': [
+                    {'AttributeName': key, 'KeyType': 'HASH' if i == 0 else 'RANGE'}
+                    for i, key in enumerate(index['keys'])
+                ],
+                'Projection': index['projection'],
+                'IndexStatus': 'ACTIVE',
+            }
+            for name, index in self._definition['indexes'].items()
+        ] or None
+
+    def update(self, GlobalSecondaryIndexUpdates=None, AttributeDefinitions=None, **kwargs):
+        """UpdateTable for index changes; like DynamoDB, one index create or delete per call"""
+        updates = GlobalSecondaryIndexUpdates or []
+        if len(updates) > 1:
+            raise _error('ValidationException', 'Only one global secondary index can be created or deleted per call', 'UpdateTable')
+        with self.resource._lock:
+            definition = self._definition
+            for update in updates:
+                if 'Create' in update:
+                    index = update['Create']
+                    if index['IndexName'] in definition['indexes']:
+                        raise _error('ValidationException', f"Index already exists: {index['IndexName']}", 'UpdateTable')
+                    definition['indexes'][index['IndexName']] = {
+                        'keys': [k['AttributeName'] for k in index['KeySchema']],
+                        'projection': index.get('Projection', {'ProjectionType': 'ALL'}),
+                    }
+                elif 'Delete' in update:
+                    name = update['Delete']['IndexName']
+                    if name not in definition['indexes']:
+                        raise _error('ResourceNotFoundException', f'Requested resource not found: Index: {name}', 'UpdateTable')
+                    del definition['indexes'][name]
+            self.resource._store.set_definition(self.name, definition)
+        return {'TableDescription': {'TableName': self.name, 'GlobalSecondaryIndexes': self.global_secondary_indexes}}
+
+    def _pk(self, key: Dict, operation: str) -> str:
+        names = self.key_names
+        if set(key) != set(names):
+            raise _error('ValidationException', 'The provided key element does not match the schema', operation)
+        values = [_normalize(key[name], operation) for name in names]
+        return json.dumps([_encode(v) for v in values])
+
+    def _key_of(self, item: Dict) -> Dict:
+        return {name: item[name] for name in self.key_names}
+
+    def _check_condition(self, condition, item, operation):
+        validate_condition(condition, operation)
+        if condition is not None and not evaluate_condition(condition, item or {}):
+            raise _error('ConditionalCheckFailedException', 'The conditional request failed', operation)
+
+    # Single-item operations
+
+    def get_item(self, Key, ProjectionExpression=None, ExpressionAttributeNames=None, ConsistentRead=False):
+        with self.resource._lock:
+            item = self.resource._store.get(self.name, self._pk(Key, 'GetItem'))
+        if item is None:
+            return {}
+        projection = _parse_projection(ProjectionExpression, ExpressionAttributeNames)
+        return {'Item': _project(item, projection) if projection else copy.deepcopy(item)}
+
+    def put_item(self, Item, ConditionExpression=None, ReturnValues='NONE', **kwargs):
+        item = _normalize(Item, 'PutItem')
+        if item_size(item) > MAX_ITEM_SIZE:
+            raise _error('ValidationException', 'Item size has exceeded the maximum allowed size', 'PutItem')
+        pk = self._pk(self._key_of(item), 'PutItem')
+        with self.resource._lock:
+            self.resource._count_write(self.name, pk, 'PutItem')
+            old = self.resource._store.get(self.name, pk)
+            self._check_condition(ConditionExpression, old, 'PutItem')
+            self.resource._store.put(self.name, pk, _position(json.loads(pk)), item)
+        return {'Attributes': old} if ReturnValues == 'ALL_OLD' and old else {}
+
+    def delete_item(self, Key, ConditionExpression=None, ReturnValues='NONE', **kwargs):
+        pk = self._pk(Key, 'DeleteItem')
+        with self.resource._lock:
+            self.resource._count_write(self.name, pk, 'DeleteItem')
+            old = self.resource._store.get(self.name, pk)
+            self._check_condition(ConditionExpression, old, 'DeleteItem')
+            if old is not None:
+                self.resource._store.delete(self.name, pk)
+        return {'Attributes': old} if ReturnValues == 'ALL_OLD' and old else {}
+
+    def update_item(self, Key, UpdateExpression, ExpressionAttributeNames=None,
+                    ExpressionAttributeValues=None, ConditionExpression=None, ReturnValues='NONE', **kwargs):
+        pk = self._pk(Key, 'UpdateItem')
+        with self.resource._lock:
+            self.resource._count_write(self.name, pk, 'UpdateItem')
+            old = self.resource._store.get(self.name, pk)
+            self._check_condition(ConditionExpression, old, 'UpdateItem')
+            base = old if old is not None else _normalize(dict(Key), 'UpdateItem')
+            new, touched = apply_update(base, UpdateExpression, ExpressionAttributeNames, ExpressionAttributeValues)
+            if touched & set(self.key_names):
+                raise _error('ValidationException', 'Cannot update attribute which is part of the key', 'UpdateItem')
+            if item_size(new) > MAX_ITEM_SIZE:
+                raise _error('ValidationException', 'Item size to update has exceeded the maximum allowed size', 'UpdateItem')
+            self.resource._store.put(self.name, pk, _position(json.loads(pk)), new)
+
+        if ReturnValues == 'ALL_NEW':
+            return {'Attributes': copy.deepcopy(new)}
+        if ReturnValues == 'ALL_OLD':
+            return {'Attributes': old} if old else {}
+        if ReturnValues == 'UPDATED_NEW':
+            return {'Attributes': {k: copy.deepcopy(new[k]) for k in touched if k in new}}
+        if ReturnValues == 'UPDATED_OLD':
+            return {'Attributes': {k: old[k] for k in touched if old and k in old}}
+        return {}
+
+    def batch_writer(self, overwrite_by_pkeys=None):
+        return _LocalBatchWriter(self)
+
+    # Multi-item reads
+
+    def _page(self, candidates, operation, Limit=None, FilterExpression=None, ProjectionExpression=None,
+              ExpressionAttributeNames=None, Select=None, last_key=None):
+        """Evaluate up to Limit items (and at most 1 MB), then filter and project them"""
+        validate_condition(FilterExpression, operation)
+        projection = _parse_projection(ProjectionExpression, ExpressionAttributeNames)
+        items = []
+        scanned = 0
+        read_bytes = 0
+        last_item = None
+        exhausted = True
+        for item in candidates:
+            if (Limit is not None and scanned >= Limit) or read_bytes >= MAX_PAGE_SIZE:
+                exhausted = False
+                break
+            scanned += 1
+            read_bytes += item_size(item)
+            last_item = item
+            if evaluate_condition(FilterExpression, item):
+                items.append(_project(item, projection) if projection else copy.deepcopy(item))
+
+        response = {'Count': len(items), 'ScannedCount': scanned}
+        if Select != 'COUNT':
+            response['Items'] = items
+        if last_item is not None and (not exhausted or (Limit is not None and scanned >= Limit)):
+            response['LastEvaluatedKey'] = last_key(last_item)
+        return response
+
+    def scan(self, Limit=None, ExclusiveStartKey=None, FilterExpression=None, ProjectionExpression=None,
+             ExpressionAttributeNames=None, Segment=None, TotalSegments=None, Select=None, **kwargs):
+        if Limit is not None and Limit < 1:
+            raise _error('ValidationException', 'Limit must be greater than or equal to 1', 'Scan')
+        after = _position(json.loads(self._pk(ExclusiveStartKey, 'Scan'))) if ExclusiveStartKey else None
+
+        def candidates():
+            with self.resource._lock:
+                rows = list(self.resource._store.scan(self.name, after))
+            for position, item in rows:
+                if TotalSegments and int(position, 16) % TotalSegments != Segment:
+                    continue
+                yield item
+
+        return self._page(
+            candidates(), 'Scan', Limit, FilterExpression, ProjectionExpression,
+            ExpressionAttributeNames, Select, self._key_of
+        )
+
+    def query(self, KeyConditionExpression, IndexName=None, FilterExpression=None, ScanIndexForward=True,
+              Limit=None, ExclusiveStartKey=None, ProjectionExpression=None, ExpressionAttributeNames=None,
+              Select=None, **kwargs):
+        definition = self._definition
+        if IndexName:
+            if IndexName not in definition['indexes']:
+                raise _error('ValidationException', f'The table does not have the specified index: {IndexName}', 'Query')
+            index = definition['indexes'][IndexName]
+            index_keys = index['keys']
+        else:
+            index = None
+            index_keys = definition['keys']
+
+        validate_condition(KeyConditionExpression, 'Query')
+        with self.resource._lock:
+            rows = [item for _, item in self.resource._store.scan(self.name)]
+        matching = [
+            item for item in rows
+            if all(k in item for k in index_keys) and evaluate_condition(KeyConditionExpression, item)
+        ]
+        sort_key = index_keys[1] if len(index_keys) > 1 else None
+        table_keys = self.key_names
+
+        def position(item):
+            return item[sort_key] if sort_key else '', [str(item[k]) for k in table_keys]
+
+        matching.sort(key=position, reverse=not ScanIndexForward)
+
+        if index and index['projection'].get('ProjectionType') != 'ALL':
+            keep = set(table_keys) | set(index_keys) | set(index['projection'].get('NonKeyAttributes', []))
+            matching = [{k: v for k, v in item.items() if k in keep} for item in matching]
+
+        if ExclusiveStartKey:
+            # Resume after the start key's position, whether or not that item still exists
+            start = position({k: _normalize(v, 'Query') for k, v in ExclusiveStartKey.items()})
+            matching = [
+                item for item in matching
+                if (position(item) > start if ScanIndexForward else position(item) < start)
+            ]
+
+        def last_key(item):
+            return {k: item[k] for k in set(table_keys) | set(index_keys)}
+
+        return self._page(
+            iter(matching), 'Query', Limit, FilterExpression, ProjectionExpression,
+            ExpressionAttributeNames, Select, last_key
+        )
+
+
+class _LocalBatchWriter:
+    """Mirror of boto3's BatchWriter: buffers puts/deletes and flushes 25 at a time"""
+
+    def __init__(self, table: LocalTable):
+        self.table = table
+        self.buffer = []
+
+    def put_item(self, Item):
+        self.buffer.append({'PutRequest': {'Item': Item}})
+        self._flush_if_full()
+
+    def delete_item(self, Key):
+        self.buffer.append({'DeleteRequest': {'Key': Key}})
+        self._flush_if_full()
+
+    def _flush_if_full(self):
+        if len(self.buffer) >= MAX_BATCH_WRITE:
+            self._flush()
+
+    def _flush(self):
+        while self.buffer:
+            chunk, self.buffer = self.buffer[:MAX_BATCH_WRITE], self.buffer[MAX_BATCH_WRITE:]
+            self.table.resource.batch_write_item(RequestItems={self.table.name: chunk})
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._flush()
@@ -0,0 +1,28 @@
+"""
+Progress reporting for management commands that walk the whole DynamoDB blog table.
+Not a command itself (Django skips modules starting with an underscore).
+"""
+
+import time
+
+
+class ScanProgress:
+    """Callable passed as progress= to the blog service scans; writes a line every interval seconds"""
+
+    def __init__(self, stream, interval=2.0):
+        self.stream = stream
+        self.interval = interval
+        self.started = time.monotonic()
+        self.last_report = self.started
+        self.scanned = 0
+
+    def __call__(self, scanned):
+        self.scanned = scanned
+        now = time.monotonic()
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            self.stream.write(f'  ... {scanned} items scanned ({self.rate():.0f}/s)')
+
+    def rate(self):
+        elapsed = time.monotonic() - self.started
+        return self.scanned / elapsed if elapsed else 0.0
@@ -0,0 +1,36 @@
+"""
+Django management command to store derived text fields on existing DynamoDB blog posts.
+New and edited posts get plain_text, excerpt, word_count and reading_time from the
+blog service on write; this populates them for posts saved before that.
+
+Usage:
+    python manage.py backfill_blog_text
+    python manage.py backfill_blog_text --force   # recompute every post
+"""
+
+from django.core.management.base import BaseCommand
+
+from ._progress import ScanProgress
+
+
+class Command(BaseCommand):
+    help = 'Populate plain_text, excerpt, word_count and reading_time on DynamoDB blog posts'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Recompute the fields even on posts that already have them',
+        )
+
+    def handle(self, *args, **options):
+        from projects.aws_blog_service import blog_service
+        
+        self.stdout.write('Scanning blog posts...')
+        result = blog_service.backfill_text_fields(force=options['force'], progress=ScanProgress(self.stdout))
+        
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✅ Updated {result["updated"]} posts ({result["skipped"]} already up to date)'
+            )
+        )
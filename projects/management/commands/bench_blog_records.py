@@ -0,0 +1,70 @@
+"""
+Django management command to measure the per-item cost of turning DynamoDB blog
+items into objects for list and API views.
+
+Compares the unsaved DynamoDBBlogPost model instances built by
+DynamoDBBlogPostManager._dynamo_to_django with the __slots__-based BlogPostRecord,
+including the attribute reads a list page does (dates, images, tags).
+
+Usage:
+    python manage.py bench_blog_records
+    python manage.py bench_blog_records --items 5000 --repeat 5
+"""
+
+import timeit
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Micro-benchmark DynamoDB blog item conversion for list views'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, default=1000, help='Items converted per run')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per variant (best is reported)')
+
+    def handle(self, *args, **options):
+        from projects.aws_models import DynamoDBBlogPost, BlogPostRecord
+        
+        items = self.make_items(options['items'])
+        manager = DynamoDBBlogPost.objects
+        
+        def list_reads(post):
+            return (post.title, post.created_date, post.image_list, post.get_tags_list(), post.view_count)
+        
+        variants = [
+            ('DynamoDBBlogPost', lambda: [list_reads(manager._dynamo_to_django(item)) for item in items]),
+            ('BlogPostRecord', lambda: [list_reads(BlogPostRecord(item)) for item in items]),
+        ]
+        
+        results = {}
+        for name, run in variants:
+            best = min(timeit.repeat(run, number=1, repeat=options['repeat']))
+            results[name] = best / len(items) * 1_000_000
+            self.stdout.write(f'{name:<18} {results[name]:8.2f} µs per item')
+        
+        speedup = results['DynamoDBBlogPost'] / results['BlogPostRecord']
+        self.stdout.write(self.style.SUCCESS(f'✅ BlogPostRecord is {speedup:.1f}x faster per item'))
+
+    def make_items(self, count):
+        """Summary-shaped items like the ones list views read"""
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        items = []
+        for i in range(count):
+            created = (start + timedelta(hours=i)).isoformat()
+            items.append({
+                'blog_id': str(uuid.uuid4()),
+                'title': f'Blog post {i}',
+                'excerpt': 'Forging notes from the shop. ' * 6,
+                'images': [f'blog-images/post-{i}.jpg'],
+                'tags': ['katana', 'forging', f'batch-{i % 10}'],
+                'created_date': created,
+                'updated_date': created,
+                'published': True,
+                'view_count': i,
+                'word_count': 400,
+                'reading_time': 2,
+            })
+        return items
@@ -0,0 +1,27 @@
+"""
+Django management command to compress large DynamoDB blog post bodies in place.
+The blog service stores content at or above BLOG_CONTENT_COMPRESS_THRESHOLD bytes
+as zlib-compressed content_z on write and reads both forms; this rewrites posts
+saved before that so they get the smaller items too.
+
+Usage:
+    python manage.py compress_blog_content
+"""
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Store large DynamoDB blog post bodies as compressed content_z attributes'
+
+    def handle(self, *args, **options):
+        from projects.aws_blog_service import blog_service
+        
+        self.stdout.write(f'Compressing posts of {blog_service.compress_threshold} bytes or more...')
+        result = blog_service.compress_existing_content()
+        
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✅ Compressed {result["compressed"]} posts ({result["skipped"]} left as they were)'
+            )
+        )
@@ -0,0 +1,40 @@
+"""
+Django management command to replace stored image URLs with storage keys on DynamoDB blog posts.
+Posts used to store presigned S3 URLs, which stop working after AWS_QUERYSTRING_EXPIRE;
+keys are signed at render time instead. URLs that do not point into the media
+storage (e.g. external images) are left untouched.
+
+Usage:
+    python manage.py convert_blog_image_urls
+    python manage.py convert_blog_image_urls --dry-run
+"""
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Rewrite image URLs stored on DynamoDB blog posts into media storage keys'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report how many posts would change without writing anything',
+        )
+
+    def handle(self, *args, **options):
+        from projects.aws_blog_service import blog_service
+        from projects.media_urls import storage_key_from_url
+        
+        def to_key(value):
+            return storage_key_from_url(value) or value
+        
+        self.stdout.write('Scanning blog posts...')
+        result = blog_service.rewrite_post_images(to_key, dry_run=options['dry_run'])
+        
+        verb = 'Would convert' if options['dry_run'] else 'Converted'
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✅ {verb} image URLs on {result["updated"]} posts ({result["skipped"]} already using keys)'
+            )
+        )
@@ -0,0 +1,64 @@
+"""
+Django management command to export DynamoDB blog posts as JSON Lines.
+Reads the table with a parallel segmented scan and streams one post per line,
+so memory stays flat however large the table gets. Compressed content is
+written out as plain HTML; sets become sorted lists and numbers plain ints/floats.
+
+Usage:
+    python manage.py export_dynamo_blog                          # writes blog_posts.jsonl
+    python manage.py export_dynamo_blog --output - --segments 8  # stream to stdout
+"""
+
+import base64
+import json
+import sys
+from decimal import Decimal
+
+from boto3.dynamodb.types import Binary
+from django.core.management.base import BaseCommand
+
+from ._progress import ScanProgress
+
+
+def to_json(value):
+    """json.dumps default= for the types DynamoDB items hold"""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    if isinstance(value, Binary):
+        return base64.b64encode(value.value).decode('ascii')
+    raise TypeError(f'Cannot export {type(value).__name__}')
+
+
+class Command(BaseCommand):
+    help = 'Export DynamoDB blog posts to a JSON Lines file using a parallel scan'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default='blog_posts.jsonl', help="Output file, or '-' for stdout")
+        parser.add_argument('--segments', type=int, default=None, help='Parallel scan segments (default BLOG_SCAN_SEGMENTS)')
+
+    def handle(self, *args, **options):
+        from projects.aws_blog_service import blog_service
+        
+        to_stdout = options['output'] == '-'
+        # Progress goes to stderr when the posts themselves go to stdout
+        report = self.stderr if to_stdout else self.stdout
+        progress = ScanProgress(report)
+        
+        output = sys.stdout if to_stdout else open(options['output'], 'w', encoding='utf-8')
+        exported = 0
+        try:
+            for item in blog_service._scan_all_posts(segments=options['segments'], progress=progress):
+                output.write(json.dumps(item, default=to_json, ensure_ascii=False) + '\n')
+                exported += 1
+        finally:
+            if not to_stdout:
+                output.close()
+        
+        report.write(
+            self.style.SUCCESS(
+                f'✅ Exported {exported} posts ({progress.scanned} items scanned, {progress.rate():.0f}/s)'
+                + ('' if to_stdout else f' to {options["output"]}')
+            )
+        )
@@ -0,0 +1,21 @@
+"""
+Django management command to fold logged simple blog views into the post counters.
+Views are also flushed by the first request after BLOG_VIEW_FLUSH_INTERVAL;
+run this from cron (or set the interval to 0 and rely on it) so counts on
+quiet posts don't wait for the next busy one.
+
+Usage:
+    python manage.py flush_blog_views
+"""
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Flush logged simple blog views to the post counters and the daily rollup'
+
+    def handle(self, *args, **options):
+        from projects.simple_view_counts import flush_view_counts
+        
+        views = flush_view_counts()
+        self.stdout.write(self.style.SUCCESS(f'✅ Flushed {views} logged views'))
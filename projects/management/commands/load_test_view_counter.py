@@ -0,0 +1,64 @@
+"""
+Django management command to load-test blog view counting against the local DynamoDB stand-in.
+Hammers increment_view_count for one post from many threads, with the stand-in
+capping writes per item per second the way a DynamoDB partition does, and reports
+throttled writes and the final count for each shard setting.
+
+Usage:
+    python manage.py load_test_view_counter
+    python manage.py load_test_view_counter --views 50000 --threads 32 --shards 1 4 16
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Load-test single vs sharded DynamoDB blog view counters on the local stand-in'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--views', type=int, default=20000, help='Increments per run')
+        parser.add_argument('--threads', type=int, default=16, help='Concurrent writers')
+        parser.add_argument('--shards', type=int, nargs='+', default=[1, 10], help='Shard counts to compare')
+        parser.add_argument(
+            '--item-write-limit', type=int, default=1000,
+            help='Writes per item per second before the stand-in throttles (DynamoDB partitions allow ~1000)',
+        )
+
+    def handle(self, *args, **options):
+        from projects.aws_blog_service import DynamoDBBlogService
+        from projects.local_dynamodb import LocalDynamoDBResource
+        
+        # Every throttled write is logged as an error; keep the report readable
+        service_logger = logging.getLogger('projects.aws_blog_service')
+        previous_level = service_logger.level
+        service_logger.setLevel(logging.CRITICAL)
+        
+        try:
+            for shards in options['shards']:
+                service = DynamoDBBlogService(
+                    dynamodb=LocalDynamoDBResource(item_write_limit=options['item_write_limit'])
+                )
+                service.view_counter_shards = shards
+                blog_id = service.create_blog_post('Load test', '<p>Viral post</p>')
+                
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=options['threads']) as executor:
+                    results = list(executor.map(lambda _: service.increment_view_count(blog_id), range(options['views'])))
+                elapsed = time.perf_counter() - started
+                
+                service.cache.clear()
+                counted = service.get_blog_post(blog_id)['view_count']
+                succeeded = sum(results)
+                self.stdout.write(
+                    f'shards={shards:<3} {succeeded / elapsed:9.0f} views/s  '
+                    f'throttled={options["views"] - succeeded:<6} counted={counted} '
+                    f'total_views={service.get_blog_stats()["total_views"]}'
+                )
+        finally:
+            service_logger.setLevel(previous_level)
+        
+        self.stdout.write(self.style.SUCCESS('✅ Load test finished'))
@@ -0,0 +1,42 @@
+"""
+Django management command to move the DynamoDB blog table onto the archive index.
+Drops the old DateIndex (hashed on the full timestamp, so it could not serve
+range queries), creates ArchiveIndex (created_month + created_date), sets
+created_month on posts written before it existed and records the oldest
+month, where newest-first list reads stop walking the index.
+
+Usage:
+    python manage.py migrate_blog_archive_index
+    python manage.py migrate_blog_archive_index --skip-index   # only backfill created_month
+"""
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Create the month-partitioned archive index and backfill created_month on DynamoDB blog posts'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--skip-index',
+            action='store_true',
+            help='Only backfill created_month, leave the table indexes alone',
+        )
+
+    def handle(self, *args, **options):
+        from projects.aws_blog_service import blog_service
+        
+        # Backfill first so the new index is built with every post already in it
+        self.stdout.write('Backfilling created_month...')
+        result = blog_service.backfill_archive_months()
+        self.stdout.write(f'Updated {result["updated"]} posts ({result["skipped"]} already set)')
+        
+        if not options['skip_index']:
+            self.stdout.write('Updating table indexes (this waits for DynamoDB to finish building them)...')
+            changes = blog_service.ensure_archive_index()
+            if changes['dropped_legacy']:
+                self.stdout.write('Dropped DateIndex')
+            if changes['created']:
+                self.stdout.write('Created ArchiveIndex')
+        
+        self.stdout.write(self.style.SUCCESS('✅ Blog archive index is ready'))
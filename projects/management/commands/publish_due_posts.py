@@ -0,0 +1,21 @@
+"""
+Django management command to publish scheduled simple blog posts that are due.
+Listings only show status='published' posts, so scheduled posts go live when
+this runs; schedule it every minute or so. Listing views also publish due
+posts on their own, but only once someone visits.
+
+Usage:
+    python manage.py publish_due_posts
+"""
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Publish scheduled simple blog posts whose publish date has passed'
+
+    def handle(self, *args, **options):
+        from projects.simple_blog_publishing import publish_due_posts
+        
+        published = publish_due_posts()
+        self.stdout.write(self.style.SUCCESS(f'✅ Published {published} scheduled posts'))
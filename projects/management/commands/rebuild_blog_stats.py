@@ -0,0 +1,28 @@
+"""
+Django management command to rebuild the DynamoDB blog aggregate counters.
+The blog service keeps STATS#global and TAGCOUNT#<tag> up to date on every write;
+run this once after deploying the counters, or if they ever drift.
+
+Usage:
+    python manage.py rebuild_blog_stats
+"""
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Recompute the DynamoDB blog stats and tag counters from a full table scan'
+
+    def handle(self, *args, **options):
+        from projects.aws_blog_service import blog_service
+        
+        self.stdout.write('Scanning blog posts...')
+        result = blog_service.rebuild_blog_stats()
+        
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✅ Rebuilt blog stats: {result["total_posts"]} posts '
+                f'({result["published_count"]} published, {result["draft_count"]} drafts), '
+                f'{result["total_views"]} views, {result["tag_count"]} tags'
+            )
+        )
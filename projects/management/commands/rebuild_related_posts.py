@@ -0,0 +1,25 @@
+"""
+Django management command to recompute related posts for the simple blog.
+Links are updated whenever a post's tags or category change, but tag
+weights depend on how many posts use each tag; run this after bulk imports
+or periodically to bring every score up to date.
+
+Usage:
+    python manage.py rebuild_related_posts
+"""
+
+from django.core.management.base import BaseCommand
+
+from ._progress import ScanProgress
+
+
+class Command(BaseCommand):
+    help = 'Recompute the related posts table for simple blog posts'
+
+    def handle(self, *args, **options):
+        from projects.simple_related_posts import rebuild_related_posts
+        
+        self.stdout.write('Scoring related posts...')
+        links = rebuild_related_posts(progress=ScanProgress(self.stdout))
+        
+        self.stdout.write(self.style.SUCCESS(f'✅ Stored {links} related post links'))
@@ -0,0 +1,32 @@
+"""
+Django management command to rebuild the SimpleBlogPost full-text search documents.
+Posts are reindexed whenever they or their tags are saved; use this after a
+bulk import, a raw SQL update or a change to the search weights.
+
+Usage:
+    python manage.py rebuild_simple_blog_search
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from ._progress import ScanProgress
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search documents for simple blog posts'
+
+    def handle(self, *args, **options):
+        from projects.simple_blog_search import rebuild_search_documents, search_backend
+        
+        backend = search_backend()
+        if backend == 'fallback':
+            self.stdout.write(
+                self.style.WARNING(f'⚠️  No full-text search backend for {connection.vendor}; nothing to rebuild')
+            )
+            return
+        
+        self.stdout.write(f'Indexing blog posts ({backend})...')
+        count = rebuild_search_documents(progress=ScanProgress(self.stdout))
+        
+        self.stdout.write(self.style.SUCCESS(f'✅ Indexed {count} posts'))
@@ -0,0 +1,30 @@
+"""
+Django management command to rebuild the DynamoDB blog search index.
+Posts are indexed on every write; use this after a bulk import, if the
+postings ever get out of sync with the posts, or once to move an index from
+the old TERM# items into the search table.
+
+Usage:
+    python manage.py reindex_dynamo_blog_search
+"""
+
+from django.core.management.base import BaseCommand
+
+from ._progress import ScanProgress
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index for DynamoDB blog posts'
+
+    def handle(self, *args, **options):
+        from projects.aws_blog_service import blog_service
+        
+        self.stdout.write('Indexing blog posts...')
+        result = blog_service.rebuild_search_index(progress=ScanProgress(self.stdout))
+        
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✅ Indexed {result["posts"]} posts ({result["terms"]} terms, '
+                f'{result["removed_postings"]} stale postings removed)'
+            )
+        )
@@ -0,0 +1,90 @@
+"""
+Storage keys to URLs for blog images, with signed URLs cached.
+DynamoDB blog posts store storage keys (e.g. 'images/katana.jpg') rather than
+URLs, because the media bucket is private and its presigned URLs expire after
+AWS_QUERYSTRING_EXPIRE seconds. Keys are resolved at render time; signed URLs
+are cached for a little less than their lifetime so a page never gets one that
+is about to expire.
+"""
+
+from typing import Iterable, List, Optional
+from urllib.parse import unquote, urlparse
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+
+CACHE_PREFIX = 'blog-image-url:'
+
+# Stop handing out a cached signed URL this long before it expires
+SIGNED_URL_MARGIN = 300
+
+# Cache lifetime for unsigned URLs (local media, public buckets)
+UNSIGNED_URL_TIMEOUT = 24 * 60 * 60
+
+
+def is_storage_key(value: str) -> bool:
+    """Keys are relative paths; legacy items hold absolute or site-relative URLs"""
+    return bool(value) and not value.startswith(('http://', 'https://', '/'))
+
+
+def url_cache_timeout() -> int:
+    """How long a generated media URL (or anything embedding one) may be cached"""
+    if getattr(default_storage, 'querystring_auth', False):
+        expire = getattr(settings, 'AWS_QUERYSTRING_EXPIRE', 3600)
+        return max(expire - SIGNED_URL_MARGIN, 60)
+    return UNSIGNED_URL_TIMEOUT
+
+
+def resolve_image_urls(values: Iterable[str]) -> List[str]:
+    """Turn stored image values into URLs, signing keys once per cache lifetime"""
+    values = list(values)
+    keys = [value for value in values if is_storage_key(value)]
+    if not keys:
+        return values
+
+    cached = cache.get_many([CACHE_PREFIX + key for key in keys])
+    fresh = {}
+    for key in keys:
+        if CACHE_PREFIX + key not in cached:
+            fresh[CACHE_PREFIX + key] = default_storage.url(key)
+    if fresh:
+        cache.set_many(fresh, url_cache_timeout())
+        cached.update(fresh)
+
+    return [cached[CACHE_PREFIX + value] if is_storage_key(value) else value for value in values]
+
+
+def resolve_image_url(value: Optional[str]) -> Optional[str]:
+    return resolve_image_urls([value])[0] if value else value
+
+
+def storage_key_from_url(url: str) -> Optional[str]:
+    """
+    Recover the storage key from a URL generated by the media storage,
+    presigned S3 (virtual-hosted or path style) or local MEDIA_URL.
+    Returns None for URLs that do not point into our media storage.
+    """
+    if is_storage_key(url):
+        return url
+
+    parsed = urlparse(url)
+    path = unquote(parsed.path).lstrip('/')
+    bucket = getattr(settings, 'AWS_STORAGE_BUCKET_NAME', None)
+
+    if parsed.netloc and bucket:
+        if parsed.netloc.startswith(f'{bucket}.s3'):
+            pass  # virtual-hosted style: the path is the object key
+        elif parsed.netloc.startswith('s3') and path.startswith(f'{bucket}/'):
+            path = path[len(bucket) + 1:]
+        else:
+            return None
+        location = getattr(settings, 'AWS_LOCATION', 'media')  # MediaStorage's folder
+        if location and path.startswith(location.strip('/') + '/'):
+            path = path[len(location.strip('/')) + 1:]
+        return path or None
+
+    media_url = getattr(settings, 'MEDIA_URL', '') or ''
+    if not parsed.netloc and media_url.startswith('/') and parsed.path.startswith(media_url):
+        return unquote(parsed.path[len(media_url):]) or None
+    return None
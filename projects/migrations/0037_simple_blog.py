@@ -0,0 +1,102 @@
+# Generated by Django 4.2 on 2026-10-19 06:45
+
+import ckeditor.fields
+from django.conf import settings
+import django.contrib.postgres.search
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('projects', '0036_alter_pagecontent_page_section'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BlogCategory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('slug', models.SlugField(blank=True, max_length=100, unique=True)),
+                ('description', models.TextField(blank=True)),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Blog Categories',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='BlogTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('slug', models.SlugField(blank=True, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SimpleBlogPost',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(help_text='The title of your blog post', max_length=200)),
+                ('slug', models.SlugField(blank=True, help_text='URL-friendly version of title (auto-generated)', max_length=200, unique=True)),
+                ('content', ckeditor.fields.RichTextField(help_text='Write your blog post content here. You can add images, links, and formatting.')),
+                ('excerpt', models.TextField(blank=True, help_text='Short summary (optional - will be auto-generated if left blank)', max_length=300)),
+                ('featured_image', models.ImageField(blank=True, help_text='Main image for your blog post (uploaded to S3)', null=True, upload_to='blog/featured/')),
+                ('featured_image_alt', models.CharField(blank=True, help_text='Alt text for the featured image (for accessibility)', max_length=200)),
+                ('status', models.CharField(choices=[('draft', 'Draft'), ('published', 'Published'), ('scheduled', 'Scheduled')], default='draft', help_text='Is this post ready to be published?', max_length=20)),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('updated_date', models.DateTimeField(auto_now=True)),
+                ('publish_date', models.DateTimeField(default=django.utils.timezone.now, help_text='When should this post be published?')),
+                ('view_count', models.PositiveIntegerField(default=0, editable=False)),
+                ('allow_comments', models.BooleanField(default=True, help_text='Allow readers to comment on this post?')),
+                ('meta_description', models.CharField(blank=True, help_text='Description for search engines (optional)', max_length=160)),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('author', models.ForeignKey(default=1, help_text='Who wrote this post?', on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+                ('category', models.ForeignKey(blank=True, help_text='What category does this post belong to?', null=True, on_delete=django.db.models.deletion.SET_NULL, to='projects.blogcategory')),
+                ('tags', models.ManyToManyField(blank=True, help_text='Add tags to help readers find your post', to='projects.blogtag')),
+            ],
+            options={
+                'verbose_name': 'Blog Post',
+                'verbose_name_plural': 'Blog Posts',
+                'ordering': ['-publish_date'],
+            },
+        ),
+        migrations.CreateModel(
+            name='BlogImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(blank=True, max_length=200)),
+                ('image', models.ImageField(help_text='Upload image to S3', upload_to='blog/images/')),
+                ('alt_text', models.CharField(help_text='Alternative text for accessibility', max_length=200)),
+                ('caption', models.TextField(blank=True)),
+                ('uploaded_date', models.DateTimeField(auto_now_add=True)),
+                ('blog_posts', models.ManyToManyField(blank=True, related_name='additional_images', to='projects.simpleblogpost')),
+            ],
+            options={
+                'ordering': ['-uploaded_date'],
+            },
+        ),
+        migrations.CreateModel(
+            name='BlogComment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('author_name', models.CharField(max_length=100)),
+                ('author_email', models.EmailField(max_length=254)),
+                ('content', models.TextField()),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('is_approved', models.BooleanField(default=False)),
+                ('blog_post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='projects.simpleblogpost')),
+            ],
+            options={
+                'ordering': ['created_date'],
+            },
+        ),
+    ]
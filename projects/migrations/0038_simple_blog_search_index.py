@@ -0,0 +1,44 @@
+from django.db import migrations
+
+FTS_TABLE = 'projects_simpleblogpost_fts'
+GIN_INDEX = 'projects_simpleblogpost_search_gin'
+
+
+def create_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == 'postgresql':
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {GIN_INDEX} ON projects_simpleblogpost USING GIN (search_vector)'
+        )
+    elif connection.vendor == 'sqlite':
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+            f"USING fts5(title, excerpt, content, tags, tokenize='porter unicode61')"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == 'postgresql':
+        schema_editor.execute(f'DROP INDEX IF EXISTS {GIN_INDEX}')
+    elif connection.vendor == 'sqlite':
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+
+
+def build_search_documents(apps, schema_editor):
+    from projects.simple_blog_search import rebuild_search_documents
+    rebuild_search_documents(
+        model=apps.get_model('projects', 'SimpleBlogPost'), conn=schema_editor.connection
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0037_simple_blog'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(build_search_documents, migrations.RunPython.noop),
+    ]
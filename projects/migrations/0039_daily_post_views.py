@@ -0,0 +1,34 @@
+# Generated by Django 4.2 on 2026-10-19 06:47
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0038_simple_blog_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyPostViews',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_views', to='projects.simpleblogpost')),
+            ],
+            options={
+                'verbose_name_plural': 'Daily post views',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='dailypostviews',
+            index=models.Index(fields=['date'], name='projects_da_date_7d1f22_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='dailypostviews',
+            unique_together={('post', 'date')},
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 4.2 on 2026-10-19 06:47
+
+from django.db import migrations, models
+
+BATCH_SIZE = 200
+
+
+def backfill_text_fields(apps, schema_editor):
+    from projects.blog_search import text_fields
+
+    SimpleBlogPost = apps.get_model('projects', 'SimpleBlogPost')
+    batch = []
+    for post in SimpleBlogPost.objects.only('pk', 'content').iterator(chunk_size=BATCH_SIZE):
+        derived = text_fields(post.content)
+        post.plain_text = derived['plain_text']
+        post.word_count = derived['word_count']
+        post.reading_time = derived['reading_time']
+        batch.append(post)
+        if len(batch) >= BATCH_SIZE:
+            SimpleBlogPost.objects.bulk_update(batch, ['plain_text', 'word_count', 'reading_time'])
+            batch = []
+    if batch:
+        SimpleBlogPost.objects.bulk_update(batch, ['plain_text', 'word_count', 'reading_time'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0039_daily_post_views'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='simpleblogpost',
+            name='plain_text',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='simpleblogpost',
+            name='reading_time',
+            field=models.PositiveIntegerField(default=1, editable=False, help_text='Estimated reading time in minutes'),
+        ),
+        migrations.AddField(
+            model_name='simpleblogpost',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_text_fields, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations
+from django.utils import timezone
+
+
+def schedule_future_posts(apps, schema_editor):
+    """Posts marked published with a future publish_date become scheduled"""
+    SimpleBlogPost = apps.get_model('projects', 'SimpleBlogPost')
+    SimpleBlogPost.objects.filter(status='published', publish_date__gt=timezone.now()).update(status='scheduled')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0041_related_posts'),
+    ]
+
+    operations = [
+        migrations.RunPython(schedule_future_posts, migrations.RunPython.noop),
+    ]
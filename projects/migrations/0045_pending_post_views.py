@@ -0,0 +1,22 @@
+# Generated by Django 4.2 on 2026-10-19 07:21
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0044_cachegeneration'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingPostView',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('post', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='projects.simpleblogpost')),
+            ],
+        ),
+    ]
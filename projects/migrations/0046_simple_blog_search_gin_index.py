@@ -0,0 +1,37 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.db import migrations
+
+OLD_NAME = 'projects_simpleblogpost_search_gin'
+NEW_NAME = 'simpleblogpost_search_gin'
+
+
+def rename_search_index(apps, schema_editor):
+    # 0038 built the index with raw SQL; give it the name the model declares
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(f'ALTER INDEX IF EXISTS {OLD_NAME} RENAME TO {NEW_NAME}')
+
+
+def restore_search_index_name(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(f'ALTER INDEX IF EXISTS {NEW_NAME} RENAME TO {OLD_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0045_pending_post_views'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(rename_search_index, restore_search_index_name),
+            ],
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='simpleblogpost',
+                    index=GinIndex(fields=['search_vector'], name=NEW_NAME),
+                ),
+            ],
+        ),
+    ]
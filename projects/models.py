@@ -1,5 +1,8 @@
 from django.db import models
+from django.db.models.signals import m2m_changed, pre_delete
+from django.dispatch import receiver
 from django_ckeditor_5.fields import CKEditor5Field
+from django.utils import timezone
 from django.utils.html import strip_tags
 from ckeditor.fields import RichTextField
 # Create your models here.
@@ -61,9 +64,15 @@ class Sword_sales(models.Model):
 class BlogImages(models.Model):
     image = models.ImageField(upload_to='images/', blank=True, null=True)
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Cached blog fragments are keyed on Blog.updated
+        self.blog_set.update(updated=timezone.now())
+
 
 class Blog(models.Model):
     date = models.DateField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
     description = RichTextField(default="null")
     images = models.ManyToManyField(BlogImages, blank=True)
 
@@ -82,6 +91,27 @@ class Blog(models.Model):
         return f"Blog Post - {self.date.strftime('%B %d, %Y')} - {content_snippet}..."
 
 
+# Cached blog fragments are keyed on Blog.updated, which must also move when
+# a post's images are deleted, attached or detached
+
+@receiver(pre_delete, sender=BlogImages)
+def _blog_image_deleted(sender, instance, **kwargs):
+    # The image's links are gone by post_delete; this runs in the same transaction
+    instance.blog_set.update(updated=timezone.now())
+
+
+@receiver(m2m_changed, sender=Blog.images.through)
+def _blog_images_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            Blog.objects.filter(pk=instance.pk).update(updated=timezone.now())
+    elif action in ('post_add', 'post_remove'):
+        Blog.objects.filter(pk__in=pk_set).update(updated=timezone.now())
+    elif action == 'pre_clear':
+        # Clearing from the image side: its posts can't be found afterwards
+        instance.blog_set.update(updated=timezone.now())
+
+
 class Gallery(models.Model):
     """
     Dedicated model for managing gallery images.
@@ -209,3 +239,21 @@ class PageContent(models.Model):
             return content_obj.content
         except cls.DoesNotExist:
             return default_content
+
+
+class CacheGeneration(models.Model):
+    """
+    Version counter for a family of cache keys. Kept in the database rather
+    than the cache so every worker process sees a bump (see simple_blog_cache).
+    """
+    name = models.CharField(max_length=100, primary_key=True)
+    value = models.PositiveBigIntegerField(default=1)
+
+    def __str__(self):
+        return f"{self.name} = {self.value}"
+
+
+# Blog models defined alongside the simple blog views
+from .simple_aws_models import (  # noqa: E402,F401
+    BlogCategory, BlogComment, BlogImage, BlogTag, DailyPostViews, PendingPostView, RelatedPost, SimpleBlogPost,
+)
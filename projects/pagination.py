@@ -0,0 +1,167 @@
+"""
+Keyset (cursor) pagination for blog listings.
+Pages are fetched with WHERE (publish_date, id) < (last seen) instead of
+OFFSET, and without a COUNT(*), so page 500 costs the same as page 1.
+Cursors are signed so they are opaque to readers and can't be forged into
+arbitrary filters; a bad cursor just gives the first page. The total is
+optional and, when asked for, counted at most once per cache timeout.
+Pages themselves can be cached too, for querysets that don't depend on the
+clock (the caller's cache key must change whenever the results can).
+"""
+
+import hashlib
+from typing import List, Optional, Sequence
+
+from django.core import signing
+from django.core.cache import cache
+from django.db.models import Q
+
+CURSOR_SALT = 'projects.pagination'
+COUNT_CACHE_PREFIX = 'keyset-count:'
+PAGE_CACHE_PREFIX = 'keyset-page:'
+CACHE_TIMEOUT = 300
+
+
+class KeysetPage:
+    """One page of results, iterable like a Paginator page"""
+
+    def __init__(self, object_list: List, next_cursor: Optional[str], previous_cursor: Optional[str],
+                 paginator: 'KeysetPaginator'):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.paginator = paginator
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+    @property
+    def total(self) -> Optional[int]:
+        """Approximate number of results (cached), or None if not requested"""
+        return self.paginator.approximate_count()
+
+
+class KeysetPaginator:
+    """
+    Paginate a queryset by its ordering: the queryset's order_by() (or the
+    model's Meta.ordering) with the primary key appended as a tiebreak, e.g.
+    ('-publish_date', '-pk'). Every ordering field must be non-null.
+    """
+
+    def __init__(self, queryset, per_page: int, ordering: Optional[Sequence[str]] = None,
+                 count_key: Optional[str] = None, count_timeout: int = CACHE_TIMEOUT):
+        ordering = list(ordering or queryset.query.order_by or queryset.model._meta.ordering)
+        if not any(field.lstrip('-') in ('pk', 'id') for field in ordering):
+            descending = bool(ordering) and ordering[0].startswith('-')
+            ordering.append('-pk' if descending else 'pk')
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = ordering
+        self.count_key = count_key
+        self.count_timeout = count_timeout
+
+    def get_page(self, cursor: Optional[str] = None, cache_key: Optional[str] = None,
+                 cache_timeout: int = CACHE_TIMEOUT) -> KeysetPage:
+        """The page after (or before) cursor; the first page for a missing or invalid cursor"""
+        if cache_key is None:
+            return self._get_page(cursor)
+        key = PAGE_CACHE_PREFIX + hashlib.md5(f'{cache_key}:{cursor or ""}'.encode()).hexdigest()
+        cached = cache.get(key)
+        if cached is not None:
+            return KeysetPage(*cached, paginator=self)
+        page = self._get_page(cursor)
+        cache.set(key, (page.object_list, page.next_cursor, page.previous_cursor), cache_timeout)
+        return page
+
+    def _get_page(self, cursor: Optional[str]) -> KeysetPage:
+        position = self._decode(cursor)
+        if position is None:
+            return self._forward_page(None, has_previous=False)
+        direction, values = position
+        if direction == 'prev':
+            return self._backward_page(values)
+        return self._forward_page(values, has_previous=True)
+
+    def approximate_count(self) -> Optional[int]:
+        """
+        Total cached under count_key, which names the listing (querysets
+        filtered on timezone.now() never produce the same SQL twice).
+        """
+        if self.count_key is None:
+            return None
+        key = COUNT_CACHE_PREFIX + hashlib.md5(self.count_key.encode()).hexdigest()
+        count = cache.get(key)
+        if count is None:
+            count = self.queryset.order_by().count()
+            cache.set(key, count, self.count_timeout)
+        return count
+
+    def _forward_page(self, after, has_previous: bool) -> KeysetPage:
+        queryset = self.queryset.order_by(*self.ordering)
+        if after is not None:
+            queryset = queryset.filter(self._seek(after, self.ordering))
+        rows = list(queryset[:self.per_page + 1])
+        items = rows[:self.per_page]
+        next_cursor = self._encode('next', items[-1]) if len(rows) > self.per_page else None
+        previous_cursor = self._encode('prev', items[0]) if has_previous and items else None
+        return KeysetPage(items, next_cursor, previous_cursor, self)
+
+    def _backward_page(self, before) -> KeysetPage:
+        reversed_ordering = [_flip(field) for field in self.ordering]
+        queryset = self.queryset.order_by(*reversed_ordering).filter(self._seek(before, reversed_ordering))
+        rows = list(queryset[:self.per_page + 1])
+        items = rows[:self.per_page][::-1]
+        if not items:
+            return self._forward_page(None, has_previous=False)
+        previous_cursor = self._encode('prev', items[0]) if len(rows) > self.per_page else None
+        return KeysetPage(items, self._encode('next', items[-1]), previous_cursor, self)
+
+    @staticmethod
+    def _seek(values: Sequence, ordering: Sequence[str]) -> Q:
+        """Rows strictly after values in ordering: (a, b) after (x, y) = a > x OR (a = x AND b > y)"""
+        condition = Q()
+        for i in reversed(range(len(ordering))):
+            field = ordering[i].lstrip('-')
+            lookup = 'lt' if ordering[i].startswith('-') else 'gt'
+            after = Q(**{f'{field}__{lookup}': values[i]})
+            if i < len(ordering) - 1:
+                after |= Q(**{field: values[i]}) & condition
+            condition = after
+        return condition
+
+    def _encode(self, direction: str, obj) -> str:
+        values = [getattr(obj, field.lstrip('-')) for field in self.ordering]
+        # Full-precision ISO strings for datetimes; the ORM parses them back in lookups
+        values = [value.isoformat() if hasattr(value, 'isoformat') else value for value in values]
+        return signing.dumps([direction, values], salt=CURSOR_SALT)
+
+    def _decode(self, cursor: Optional[str]):
+        if not cursor:
+            return None
+        try:
+            direction, values = signing.loads(cursor, salt=CURSOR_SALT)
+        except (signing.BadSignature, ValueError, TypeError):
+            return None
+        if direction not in ('next', 'prev') or len(values) != len(self.ordering):
+            return None
+        return direction, values
+
+
+def _flip(field: str) -> str:
+    return field[1:] if field.startswith('-') else '-' + field
+
@@ -3,14 +3,19 @@ Simple AWS-powered blog models using PostgreSQL + S3
 Much cleaner and easier to use than DynamoDB approach
 """
 
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.contrib.auth.models import User
 from django.utils.text import slugify
 from django.urls import reverse
 from ckeditor.fields import RichTextField
 from django.utils import timezone
+import re
 import uuid
 
+from .blog_search import text_fields
+
 
 class BlogCategory(models.Model):
     """Blog categories for organization"""
@@ -49,6 +54,17 @@ class BlogTag(models.Model):
         super().save(*args, **kwargs)
 
 
+# Room left after a truncated title slug for a "-N" suffix
+SLUG_SUFFIX_RESERVE = 8
+SLUG_ALLOCATION_ATTEMPTS = 5
+
+
+class SimpleBlogPostQuerySet(models.QuerySet):
+    def published(self):
+        """Live posts. Scheduled posts only become 'published' when due (see simple_blog_publishing)"""
+        return self.filter(status='published')
+
+
 class SimpleBlogPost(models.Model):
     """Simple, user-friendly blog post model"""
     
@@ -142,59 +158,160 @@ class SimpleBlogPost(models.Model):
         help_text="Description for search engines (optional)"
     )
     
+    # Derived from content in save() so list pages and search never parse HTML
+    plain_text = models.TextField(blank=True, editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_time = models.PositiveIntegerField(
+        default=1,
+        editable=False,
+        help_text="Estimated reading time in minutes"
+    )
+    
+    # Weighted full-text document (PostgreSQL); maintained by simple_blog_search
+    search_vector = SearchVectorField(null=True, editable=False)
+    
+    objects = SimpleBlogPostQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-publish_date']
         verbose_name = "Blog Post"
         verbose_name_plural = "Blog Posts"
+        # Only built on PostgreSQL (see migration 0046); SQLite searches an FTS5 table instead
+        indexes = [GinIndex(fields=['search_vector'], name='simpleblogpost_search_gin')]
     
     def __str__(self):
         return self.title
     
     def save(self, *args, **kwargs):
-        # Auto-generate slug from title
-        if not self.slug:
-            base_slug = slugify(self.title)
-            slug = base_slug
-            counter = 1
-            while SimpleBlogPost.objects.filter(slug=slug).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
+        # Auto-generate slug from title (allocated below, as the row is written)
+        allocate_slug = not self.slug
+        
+        # A post published with a future date waits as scheduled until it is due
+        if self.status == 'published' and self.publish_date > timezone.now():
+            self.status = 'scheduled'
+        
+        # Plain text, word count and reading time
+        derived = text_fields(self.content)
+        self.plain_text = derived['plain_text']
+        self.word_count = derived['word_count']
+        self.reading_time = derived['reading_time']
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'content' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'plain_text', 'word_count', 'reading_time'}
         
         # Auto-generate excerpt if not provided
         if not self.excerpt and self.content:
-            # Strip HTML and create excerpt
-            from django.utils.html import strip_tags
-            clean_content = strip_tags(self.content)
+            clean_content = self.plain_text
             self.excerpt = clean_content[:297] + "..." if len(clean_content) > 297 else clean_content
         
         # Auto-generate meta description if not provided
         if not self.meta_description:
             self.meta_description = self.excerpt[:157] + "..." if len(self.excerpt) > 157 else self.excerpt
         
-        super().save(*args, **kwargs)
+        if not allocate_slug:
+            super().save(*args, **kwargs)
+            return
+        
+        # A concurrent save can take the same slug between choosing it and
+        # inserting; the unique constraint catches that and we pick again
+        for attempt in range(SLUG_ALLOCATION_ATTEMPTS):
+            self.slug = self._next_free_slug()
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                slug_taken = SimpleBlogPost.objects.filter(slug=self.slug).exclude(pk=self.pk).exists()
+                if not slug_taken or attempt == SLUG_ALLOCATION_ATTEMPTS - 1:
+                    self.slug = ''
+                    raise
+    
+    def _next_free_slug(self):
+        """
+        Slug from the title, with the lowest free -N suffix if it is taken.
+        All colliding slugs are fetched in one query instead of probing
+        -1, -2, ... one at a time.
+        """
+        max_length = self._meta.get_field('slug').max_length
+        base_slug = (slugify(self.title) or 'post')[:max_length - SLUG_SUFFIX_RESERVE].strip('-')
+        taken = set(
+            SimpleBlogPost.objects.filter(slug__regex=rf'^{re.escape(base_slug)}(-[0-9]+)?$')
+            .exclude(pk=self.pk)
+            .values_list('slug', flat=True)
+        )
+        if base_slug not in taken:
+            return base_slug
+        suffixes = {int(slug[len(base_slug) + 1:]) for slug in taken if slug != base_slug}
+        counter = 1
+        while counter in suffixes:
+            counter += 1
+        return f"{base_slug}-{counter}"
     
     def get_absolute_url(self):
         return reverse('simple_blog_detail', kwargs={'slug': self.slug})
     
     @property
     def is_published(self):
-        return (
-            self.status == 'published' and 
-            self.publish_date <= timezone.now()
-        )
-    
-    @property
-    def reading_time(self):
-        """Estimate reading time in minutes"""
-        from django.utils.html import strip_tags
-        word_count = len(strip_tags(self.content).split())
-        return max(1, round(word_count / 200))  # Assume 200 words per minute
+        return self.status == 'published'
     
     def increment_view_count(self):
-        """Increment view count"""
+        """
+        Count a view. It is logged with one INSERT and added to the database
+        counter in batches by simple_view_counts; only this instance's copy
+        changes right away.
+        """
+        from .simple_view_counts import record_view
+        record_view(self.pk)
         self.view_count += 1
-        self.save(update_fields=['view_count'])
+
+
+class PendingPostView(models.Model):
+    """One logged view not yet added to its post's counter; see simple_view_counts"""
+    # No index on post: the log is insert-heavy and only ever read in full
+    post = models.ForeignKey(SimpleBlogPost, on_delete=models.CASCADE, db_index=False, related_name='+')
+    date = models.DateField()
+
+
+class DailyPostViews(models.Model):
+    """Views per post per day, rolled up when logged views are flushed"""
+    post = models.ForeignKey(
+        SimpleBlogPost,
+        on_delete=models.CASCADE,
+        related_name='daily_views'
+    )
+    date = models.DateField()
+    views = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        unique_together = [('post', 'date')]
+        indexes = [models.Index(fields=['date'])]
+        verbose_name_plural = "Daily post views"
+    
+    def __str__(self):
+        return f"{self.post_id} on {self.date}: {self.views}"
+
+
+class RelatedPost(models.Model):
+    """Precomputed post similarity (shared tags and category); see simple_related_posts"""
+    post = models.ForeignKey(
+        SimpleBlogPost,
+        on_delete=models.CASCADE,
+        related_name='related_links'
+    )
+    related = models.ForeignKey(
+        SimpleBlogPost,
+        on_delete=models.CASCADE,
+        related_name='+'
+    )
+    score = models.FloatField()
+    
+    class Meta:
+        unique_together = [('post', 'related')]
+        indexes = [models.Index(fields=['post', '-score'])]
+        ordering = ['-score']
+    
+    def __str__(self):
+        return f"{self.post_id} -> {self.related_id} ({self.score:.2f})"
 
 
 class BlogImage(models.Model):
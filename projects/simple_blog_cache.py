@@ -0,0 +1,76 @@
+"""
+Generation-scoped caching for the simple blog.
+Listings no longer depend on the clock (scheduled posts are published by an
+explicit transition, see simple_blog_publishing), so their results only
+change when posts, tags or categories do. Every cache key embeds the current
+generation, and any such change bumps it: old entries are never read again
+and simply expire.
+
+The cache itself is per-process LocMemCache, so generations are stored in the
+CacheGeneration table where every worker sees a bump. Each worker re-reads
+its generation at most every GENERATION_TTL seconds, which bounds how long
+another worker's change can go unnoticed.
+"""
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .models import CacheGeneration
+from .simple_aws_models import BlogCategory, BlogTag, SimpleBlogPost
+
+GENERATION_KEY = 'simple-blog-generation'
+GENERATION_TTL = 5
+
+# Upper bound on staleness for data that changes without a bump (view counts)
+CACHE_TIMEOUT = 300
+
+# Saves that only touch these fields leave cached listings valid
+UNCACHED_FIELDS = frozenset(['view_count', 'updated_date'])
+
+
+def cache_generation(key: str = GENERATION_KEY) -> int:
+    generation = cache.get(key)
+    if generation is None:
+        generation = CacheGeneration.objects.filter(name=key).values_list('value', flat=True).first() or 1
+        cache.set(key, generation, GENERATION_TTL)
+    return generation
+
+
+def bump_cache_generation(key: str = GENERATION_KEY):
+    """Invalidate every entry scoped to the generation stored under key, in every worker"""
+    if not CacheGeneration.objects.filter(name=key).update(value=F('value') + 1):
+        try:
+            with transaction.atomic():
+                # A missing row reads as generation 1
+                CacheGeneration.objects.create(name=key, value=2)
+        except IntegrityError:
+            CacheGeneration.objects.filter(name=key).update(value=F('value') + 1)
+    cache.delete(key)
+
+
+def cache_key(*parts) -> str:
+    return ':'.join(['simple-blog', str(cache_generation()), *map(str, parts)])
+
+
+@receiver(post_save, sender=SimpleBlogPost)
+def _post_saved(sender, update_fields=None, **kwargs):
+    if not (update_fields and set(update_fields) <= UNCACHED_FIELDS):
+        bump_cache_generation()
+
+
+@receiver(post_delete, sender=SimpleBlogPost)
+@receiver(post_save, sender=BlogCategory)
+@receiver(post_delete, sender=BlogCategory)
+@receiver(post_save, sender=BlogTag)
+@receiver(post_delete, sender=BlogTag)
+def _blog_changed(sender, **kwargs):
+    bump_cache_generation()
+
+
+@receiver(m2m_changed, sender=SimpleBlogPost.tags.through)
+def _post_retagged(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        bump_cache_generation()
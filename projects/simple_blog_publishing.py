@@ -0,0 +1,53 @@
+"""
+Scheduled publishing for the simple blog.
+A post is live exactly when status == 'published', so listing queries don't
+compare publish_date with now() and their results can be cached. Posts saved
+as published with a future publish_date are stored as 'scheduled', and
+publish_due_posts() flips them once due and bumps the cache generation.
+
+It runs from the publish_due_posts command (cron) and, as a backstop, from
+listing views once the earliest scheduled publish_date has passed; that
+check is a single cache read until then. If the posts turn out to be
+published already (by cron or another worker), the cached time is dropped
+so the next check looks up the new earliest one instead of retrying.
+"""
+
+import datetime
+import logging
+from typing import Optional
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from .simple_aws_models import SimpleBlogPost
+from .simple_blog_cache import CACHE_TIMEOUT, bump_cache_generation, cache_key
+
+logger = logging.getLogger(__name__)
+
+# Cached "nothing scheduled" marker
+NOTHING_SCHEDULED = 'none'
+
+
+def publish_due_posts(now: Optional[datetime.datetime] = None) -> int:
+    """Publish scheduled posts whose publish_date has passed; returns how many"""
+    due = SimpleBlogPost.objects.filter(status='scheduled', publish_date__lte=now or timezone.now())
+    published = due.update(status='published')
+    if published:
+        logger.info(f"Published {published} scheduled blog posts")
+        bump_cache_generation()
+    return published
+
+
+def publish_due_posts_if_needed():
+    """Cheap per-request check: publish only once the next scheduled post is due"""
+    key = cache_key('next-scheduled')
+    next_due = cache.get(key)
+    if next_due is None:
+        next_due = (
+            SimpleBlogPost.objects.filter(status='scheduled')
+            .order_by('publish_date').values_list('publish_date', flat=True).first()
+        ) or NOTHING_SCHEDULED
+        cache.set(key, next_due, CACHE_TIMEOUT)
+    if next_due != NOTHING_SCHEDULED and next_due <= timezone.now():
+        if not publish_due_posts():
+            cache.delete(key)
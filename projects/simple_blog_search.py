@@ -0,0 +1,220 @@
+"""
+Full-text search for SimpleBlogPost.
+Each post gets a weighted search document (title > excerpt > content > tags):
+on PostgreSQL it is the GIN-indexed search_vector column ranked with
+SearchRank, on SQLite it lives in an FTS5 shadow table ranked with bm25().
+Documents are rewritten whenever a post or its tags are saved; other
+databases fall back to icontains matching. Ranking happens in SQL on both
+backends, so any number of matches costs the same single query.
+"""
+
+import logging
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .blog_search import plain_text
+from .simple_aws_models import BlogTag, SimpleBlogPost
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = 'projects_simpleblogpost_fts'  # created by migration 0038, rowid = post id
+SEARCH_CONFIG = 'english'
+
+# Column weights, in document order: title, excerpt, content, tags
+WEIGHTS = ('A', 'B', 'C', 'D')
+FTS_WEIGHTS = (10.0, 5.0, 2.0, 1.0)
+
+# Saves that only touch these fields leave the search document alone
+UNINDEXED_FIELDS = frozenset(['view_count', 'updated_date'])
+
+PostTag = SimpleBlogPost.tags.through
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def search_backend(conn=None) -> str:
+    """'postgresql', 'sqlite' or 'fallback' for the given connection"""
+    conn = conn or connection
+    if conn.vendor == 'postgresql':
+        return 'postgresql'
+    if conn.vendor == 'sqlite' and fts_table_exists(conn):
+        return 'sqlite'
+    return 'fallback'
+
+
+def fts_table_exists(conn=None) -> bool:
+    conn = conn or connection
+    return FTS_TABLE in conn.introspection.table_names()
+
+
+def search_document(post: SimpleBlogPost):
+    """The post's searchable text as (title, excerpt, content, tags)"""
+    tags = ' '.join(tag.name for tag in post.tags.all()) if post.pk else ''
+    # Historical models in migrations before 0040 have no plain_text column
+    text = post.plain_text if hasattr(post, 'plain_text') else plain_text(post.content)
+    return (post.title or '', post.excerpt or '', text, tags)
+
+
+def update_search_document(post: SimpleBlogPost, model=SimpleBlogPost, conn=None):
+    """Rewrite the stored search document for one post"""
+    conn = conn or connection
+    backend = search_backend(conn)
+    if backend == 'fallback':
+        return
+    document = search_document(post)
+
+    if backend == 'postgresql':
+        vector = None
+        for text, weight in zip(document, WEIGHTS):
+            part = SearchVector(Value(text), weight=weight, config=SEARCH_CONFIG)
+            vector = part if vector is None else vector + part
+        model.objects.using(conn.alias).filter(pk=post.pk).update(search_vector=vector)
+        return
+
+    with conn.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [post.pk])
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, excerpt, content, tags) VALUES (%s, %s, %s, %s, %s)",
+            [post.pk, *document],
+        )
+
+
+def delete_search_document(post_id: int, conn=None):
+    conn = conn or connection
+    if search_backend(conn) == 'sqlite':
+        with conn.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [post_id])
+
+
+def rebuild_search_documents(progress=None, model=SimpleBlogPost, conn=None) -> int:
+    """
+    Recompute every post's search document; returns the number indexed.
+    Migrations pass their historical model and schema_editor.connection.
+    """
+    conn = conn or connection
+    backend = search_backend(conn)
+    if backend == 'fallback':
+        logger.warning(f"No full-text search backend for {conn.vendor}; nothing to rebuild")
+        return 0
+    if backend == 'sqlite':
+        with conn.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+
+    count = 0
+    for post in model.objects.using(conn.alias).prefetch_related('tags').iterator(chunk_size=200):
+        update_search_document(post, model, conn)
+        count += 1
+        if progress:
+            progress(count)
+    return count
+
+
+def update_search_documents(post_ids):
+    """Rewrite the search documents of several posts, e.g. everything carrying a changed tag"""
+    for post in SimpleBlogPost.objects.filter(pk__in=list(post_ids)).prefetch_related('tags'):
+        update_search_document(post)
+
+
+def fts_match_expression(query: str) -> str:
+    """
+    Quote each word so user input can't inject FTS5 syntax, and treat the
+    last word as a prefix so results keep up while the query is being typed.
+    """
+    tokens = _TOKEN_RE.findall(query)
+    if not tokens:
+        return ''
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def search_posts(queryset, query: str):
+    """Filter queryset to posts matching query, best matches first"""
+    query = (query or '').strip()
+    if not query:
+        return queryset.none()
+    backend = search_backend()
+
+    if backend == 'postgresql':
+        search_query = SearchQuery(query, search_type='websearch', config=SEARCH_CONFIG)
+        return queryset.filter(search_vector=search_query).annotate(
+            rank=SearchRank(F('search_vector'), search_query)
+        ).order_by('-rank', '-publish_date')
+
+    if backend == 'sqlite':
+        match = fts_match_expression(query)
+        if not match:
+            return queryset.none()
+        weights = ', '.join(str(weight) for weight in FTS_WEIGHTS)
+        post_id = f'"{queryset.model._meta.db_table}"."{queryset.model._meta.pk.column}"'
+        # bm25() is lower for better matches; rowid is the post id
+        rank = RawSQL(
+            f"SELECT bm25({FTS_TABLE}, {weights}) FROM {FTS_TABLE} "
+            f"WHERE {FTS_TABLE} MATCH %s AND rowid = {post_id}",
+            [match], output_field=FloatField(),
+        )
+        return queryset.filter(
+            pk__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match])
+        ).annotate(rank=rank).order_by('rank')
+
+    return queryset.filter(
+        Q(title__icontains=query) |
+        Q(plain_text__icontains=query) |
+        Q(excerpt__icontains=query) |
+        Q(tags__name__icontains=query)
+    ).distinct()
+
+
+@receiver(post_save, sender=SimpleBlogPost)
+def _index_saved_post(sender, instance, update_fields=None, raw=False, **kwargs):
+    if raw or (update_fields and set(update_fields) <= UNINDEXED_FIELDS):
+        return
+    update_search_document(instance)
+
+
+@receiver(post_delete, sender=SimpleBlogPost)
+def _unindex_deleted_post(sender, instance, **kwargs):
+    delete_search_document(instance.pk)
+
+
+@receiver(m2m_changed, sender=PostTag)
+def _index_retagged_post(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            update_search_document(instance)
+        return
+    # Tag side of the relation: reindex the affected posts. A clear doesn't say
+    # which posts it touched, so they are collected before it runs.
+    if action == 'pre_clear':
+        instance._search_post_ids = _tagged_post_ids(instance)
+    elif action in ('post_add', 'post_remove'):
+        update_search_documents(pk_set)
+    elif action == 'post_clear':
+        update_search_documents(getattr(instance, '_search_post_ids', []))
+
+
+def _tagged_post_ids(tag):
+    return list(PostTag.objects.filter(blogtag_id=tag.pk).values_list('simpleblogpost_id', flat=True))
+
+
+@receiver(post_save, sender=BlogTag)
+def _index_renamed_tag(sender, instance, created, raw=False, **kwargs):
+    if not created and not raw:
+        update_search_documents(_tagged_post_ids(instance))
+
+
+@receiver(pre_delete, sender=BlogTag)
+def _remember_tagged_posts(sender, instance, **kwargs):
+    # Deleting a tag removes its links without an m2m_changed signal
+    instance._search_post_ids = _tagged_post_ids(instance)
+
+
+@receiver(post_delete, sender=BlogTag)
+def _index_untagged_posts(sender, instance, **kwargs):
+    update_search_documents(getattr(instance, '_search_post_ids', []))
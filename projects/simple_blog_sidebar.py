@@ -0,0 +1,32 @@
+"""
+Sidebar data for the simple blog: categories and popular tags with their
+published post counts. Each list is one aggregate query, ordered by count,
+and the pair is cached until the blog changes (see simple_blog_cache).
+"""
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from .simple_aws_models import BlogCategory, BlogTag
+from .simple_blog_cache import CACHE_TIMEOUT, cache_key
+
+POPULAR_TAG_LIMIT = 10
+
+
+def get_sidebar():
+    """{'categories': [...], 'popular_tags': [...]}, each item annotated with post_count"""
+    key = cache_key('sidebar')
+    sidebar = cache.get(key)
+    if sidebar is None:
+        published = Count('simpleblogpost', filter=Q(simpleblogpost__status='published'))
+        sidebar = {
+            'categories': list(
+                BlogCategory.objects.annotate(post_count=published).order_by('-post_count', 'name')
+            ),
+            'popular_tags': list(
+                BlogTag.objects.annotate(post_count=published)
+                .filter(post_count__gt=0).order_by('-post_count', 'name')[:POPULAR_TAG_LIMIT]
+            ),
+        }
+        cache.set(key, sidebar, CACHE_TIMEOUT)
+    return sidebar
@@ -0,0 +1,213 @@
+"""
+Related posts for SimpleBlogPost, precomputed into the RelatedPost table.
+Two posts score the sum of idf(tag) over the tags they share, where
+idf = log(1 + posts / posts with the tag), so a rare shared tag counts for
+more than a common one, plus CATEGORY_WEIGHT if they share a category.
+Only each post's RELATED_POSTS_STORED best links are kept, so the table
+grows with the number of posts, not the number of pairs.
+
+When a post is saved, retagged or deleted, its links are recomputed along
+with those of the posts whose top links it enters or leaves. Tag frequencies
+drift as the corpus grows, so rebuild_related_posts recomputes every post
+from scratch.
+"""
+
+import math
+from collections import defaultdict
+from typing import Dict, Iterable, List
+
+from django.db import transaction
+from django.db.models import Count, Min
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .simple_aws_models import BlogTag, RelatedPost, SimpleBlogPost
+
+# Sharing a category counts for less than sharing even a very common tag (idf >= log 2)
+CATEGORY_WEIGHT = 0.5
+
+RELATED_POSTS_SHOWN = 3
+RELATED_POSTS_STORED = 10
+BULK_BATCH_SIZE = 1000
+
+# Saves that only touch these fields can't change a post's tags or category
+UNRELATED_FIELDS = frozenset(['view_count', 'updated_date'])
+
+PostTag = SimpleBlogPost.tags.through
+
+
+def idf(tag_posts: int, total_posts: int) -> float:
+    return math.log(1 + total_posts / tag_posts)
+
+
+def _scores(post_id: int, tag_ids: Iterable[int], category_id, posts_by_tag: Dict[int, List[int]],
+            posts_by_category: Dict[int, List[int]], total_posts: int) -> Dict[int, float]:
+    """Similarity of post_id to every post it shares a tag or category with"""
+    scores = defaultdict(float)
+    for tag_id in tag_ids:
+        tagged = posts_by_tag.get(tag_id, [])
+        weight = idf(len(tagged), total_posts) if tagged else 0.0
+        for other_id in tagged:
+            scores[other_id] += weight
+    if category_id is not None:
+        for other_id in posts_by_category.get(category_id, []):
+            scores[other_id] += CATEGORY_WEIGHT
+    scores.pop(post_id, None)
+    return scores
+
+
+def _top_links(post_id: int, scores: Dict[int, float]) -> List[RelatedPost]:
+    """The post's RELATED_POSTS_STORED best links, ties broken like get_related_posts"""
+    best = sorted(scores.items(), key=lambda pair: (-pair[1], pair[0]))[:RELATED_POSTS_STORED]
+    return [RelatedPost(post_id=post_id, related_id=other_id, score=score) for other_id, score in best]
+
+
+def _link_scores(post_ids: Iterable[int]) -> Dict[int, Dict[int, float]]:
+    """{post_id: {other_id: score}} for the given posts, read in a fixed number of queries"""
+    categories = dict(SimpleBlogPost.objects.filter(pk__in=post_ids).values_list('pk', 'category_id'))
+    tags_by_post = defaultdict(list)
+    for post_id, tag_id in PostTag.objects.filter(simpleblogpost_id__in=list(categories)).values_list('simpleblogpost_id', 'blogtag_id'):
+        tags_by_post[post_id].append(tag_id)
+
+    posts_by_tag = defaultdict(list)
+    tag_ids = {tag_id for tag_ids in tags_by_post.values() for tag_id in tag_ids}
+    for post_id, tag_id in PostTag.objects.filter(blogtag_id__in=tag_ids).values_list('simpleblogpost_id', 'blogtag_id'):
+        posts_by_tag[tag_id].append(post_id)
+    posts_by_category = defaultdict(list)
+    category_ids = {category_id for category_id in categories.values() if category_id is not None}
+    for post_id, category_id in SimpleBlogPost.objects.filter(category_id__in=category_ids).values_list('pk', 'category_id'):
+        posts_by_category[category_id].append(post_id)
+
+    total_posts = SimpleBlogPost.objects.count()
+    return {
+        post_id: _scores(post_id, tags_by_post.get(post_id, []), category_id, posts_by_tag, posts_by_category, total_posts)
+        for post_id, category_id in categories.items()
+    }
+
+
+def refresh_related_posts(post_ids: Iterable[int], linked_from: Iterable[int] = ()):
+    """
+    Recompute the links of posts whose tags or category changed, and of every
+    post whose top links they may have entered or left: those that linked to
+    them before (or to a deleted post, via linked_from) and those where the
+    new score would make the cut.
+    """
+    changed = set(post_ids)
+    scores = _link_scores(changed)
+    affected = set(linked_from) | set(
+        RelatedPost.objects.filter(related_id__in=changed).values_list('post_id', flat=True)
+    )
+
+    # How full each candidate's list is and the score it takes to get on it
+    candidates = {other_id for links in scores.values() for other_id in links} - changed - affected
+    standing = {
+        row['post_id']: (row['links'], row['lowest'])
+        for row in RelatedPost.objects.filter(post_id__in=candidates).values('post_id').annotate(
+            links=Count('pk'), lowest=Min('score')
+        )
+    }
+    for links in scores.values():
+        for other_id, score in links.items():
+            if other_id not in candidates:
+                continue
+            stored, lowest = standing.get(other_id, (0, None))
+            if stored < RELATED_POSTS_STORED or score >= lowest:
+                affected.add(other_id)
+
+    affected -= changed
+    if affected:
+        scores.update(_link_scores(affected))
+    links = [link for post_id, post_scores in scores.items() for link in _top_links(post_id, post_scores)]
+
+    with transaction.atomic():
+        RelatedPost.objects.filter(post_id__in=changed | affected).delete()
+        RelatedPost.objects.bulk_create(links, batch_size=BULK_BATCH_SIZE)
+
+
+def update_related_posts(post: SimpleBlogPost):
+    """Recompute one post's links after its tags or category changed"""
+    refresh_related_posts([post.pk])
+
+
+def rebuild_related_posts(progress=None) -> int:
+    """Recompute every post's links from scratch; returns the number of links stored"""
+    posts_by_tag = defaultdict(list)
+    tags_by_post = defaultdict(list)
+    for post_id, tag_id in PostTag.objects.values_list('simpleblogpost_id', 'blogtag_id'):
+        posts_by_tag[tag_id].append(post_id)
+        tags_by_post[post_id].append(tag_id)
+
+    categories = dict(SimpleBlogPost.objects.values_list('pk', 'category_id'))
+    posts_by_category = defaultdict(list)
+    for post_id, category_id in categories.items():
+        if category_id is not None:
+            posts_by_category[category_id].append(post_id)
+
+    links = []
+    for count, (post_id, category_id) in enumerate(categories.items(), 1):
+        scores = _scores(
+            post_id, tags_by_post.get(post_id, []), category_id,
+            posts_by_tag, posts_by_category, len(categories),
+        )
+        links.extend(_top_links(post_id, scores))
+        if progress:
+            progress(count)
+
+    with transaction.atomic():
+        RelatedPost.objects.all().delete()
+        RelatedPost.objects.bulk_create(links, batch_size=BULK_BATCH_SIZE)
+    return len(links)
+
+
+def get_related_posts(post: SimpleBlogPost, limit: int = RELATED_POSTS_SHOWN) -> List[SimpleBlogPost]:
+    """The post's most similar published posts, best first (one query on the (post, -score) index)"""
+    links = RelatedPost.objects.filter(post_id=post.pk, related__status='published').select_related('related').order_by('-score', 'related_id')[:limit]
+    return [link.related for link in links]
+
+
+@receiver(post_save, sender=SimpleBlogPost)
+def _relate_saved_post(sender, instance, update_fields=None, raw=False, **kwargs):
+    if raw or (update_fields and set(update_fields) <= UNRELATED_FIELDS):
+        return
+    update_related_posts(instance)
+
+
+@receiver(pre_delete, sender=SimpleBlogPost)
+def _remember_linking_posts(sender, instance, **kwargs):
+    # The links to the post are cascaded away before post_delete
+    instance._related_linked_from = list(RelatedPost.objects.filter(related_id=instance.pk).values_list('post_id', flat=True))
+
+
+@receiver(post_delete, sender=SimpleBlogPost)
+def _relink_after_delete(sender, instance, **kwargs):
+    linked_from = getattr(instance, '_related_linked_from', [])
+    if linked_from:
+        refresh_related_posts([], linked_from=linked_from)
+
+
+@receiver(m2m_changed, sender=PostTag)
+def _relate_retagged_post(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            update_related_posts(instance)
+        return
+    # Tag side of the relation: a clear doesn't say which posts it touched
+    if action == 'pre_clear':
+        instance._related_post_ids = list(PostTag.objects.filter(blogtag_id=instance.pk).values_list('simpleblogpost_id', flat=True))
+    elif action in ('post_add', 'post_remove'):
+        refresh_related_posts(pk_set)
+    elif action == 'post_clear':
+        refresh_related_posts(getattr(instance, '_related_post_ids', []))
+
+
+@receiver(pre_delete, sender=BlogTag)
+def _remember_tagged_posts(sender, instance, **kwargs):
+    # Deleting a tag drops its links without an m2m_changed signal
+    instance._related_post_ids = list(PostTag.objects.filter(blogtag_id=instance.pk).values_list('simpleblogpost_id', flat=True))
+
+
+@receiver(post_delete, sender=BlogTag)
+def _relate_untagged_posts(sender, instance, **kwargs):
+    post_ids = getattr(instance, '_related_post_ids', [])
+    if post_ids:
+        refresh_related_posts(post_ids)
@@ -0,0 +1,94 @@
+"""
+Batched view counting for SimpleBlogPost.
+A detail view only INSERTs a PendingPostView row: no existing row is read,
+updated or locked in the request. The log is folded into the posts with
+atomic F('view_count') + n updates, either by the flush_blog_views command
+(cron) or by the first request after BLOG_VIEW_FLUSH_INTERVAL seconds. Each
+flush also adds the views to the DailyPostViews rollup (BLOG_VIEW_ROLLUP) so
+popular-post queries never have to touch the posts table's counters.
+
+The log lives in the database, so every worker's views reach the same
+flush and none are lost when a worker restarts or a cache evicts.
+"""
+
+import datetime
+import logging
+from typing import Dict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, IntegrityError, transaction
+from django.db.models import Count, F, Max, Sum
+from django.utils import timezone
+
+from .simple_aws_models import DailyPostViews, PendingPostView, SimpleBlogPost
+
+logger = logging.getLogger(__name__)
+
+FLUSH_LOCK_KEY = 'simple-blog-views:flush-lock'
+
+
+def record_view(post_id: int):
+    """Log one view with a single INSERT; the post's counter catches up at the next flush"""
+    PendingPostView.objects.create(post_id=post_id, date=timezone.localdate())
+
+    # The lock only spaces out this worker's flushes; overlapping flushes are safe
+    interval = getattr(settings, 'BLOG_VIEW_FLUSH_INTERVAL', 60)
+    if interval > 0 and cache.add(FLUSH_LOCK_KEY, True, interval):
+        try:
+            flush_view_counts()
+        except DatabaseError as e:
+            logger.warning(f"Could not flush blog views, leaving them for the next flush: {e}")
+
+
+def flush_view_counts() -> int:
+    """Move logged views into the posts and the rollup; returns the number of views written"""
+    with transaction.atomic():
+        last_id = PendingPostView.objects.aggregate(last=Max('pk'))['last']
+        if last_id is None:
+            return 0
+        pending = PendingPostView.objects.filter(pk__lte=last_id)
+        views = {
+            (row['post_id'], row['date']): row['views']
+            for row in pending.order_by().values('post_id', 'date').annotate(views=Count('pk'))
+        }
+        # A concurrent flush that deleted some of these rows first has counted them;
+        # back out and leave whatever it did not take for the next flush
+        if pending.delete()[0] != sum(views.values()):
+            transaction.set_rollback(True)
+            return 0
+        _apply_views(views)
+    return sum(views.values())
+
+
+def _apply_views(views: Dict[tuple, int]):
+    """Add {(post_id, date): count} to the posts and the daily rollup"""
+    totals = {}
+    for (post_id, _), count in views.items():
+        totals[post_id] = totals.get(post_id, 0) + count
+
+    for post_id, count in totals.items():
+        SimpleBlogPost.objects.filter(pk=post_id).update(view_count=F('view_count') + count)
+    if getattr(settings, 'BLOG_VIEW_ROLLUP', True):
+        for (post_id, date), count in views.items():
+            _add_daily_views(post_id, date, count)
+
+
+def _add_daily_views(post_id: int, date: datetime.date, count: int):
+    rows = DailyPostViews.objects.filter(post_id=post_id, date=date)
+    if rows.update(views=F('views') + count):
+        return
+    try:
+        with transaction.atomic():
+            DailyPostViews.objects.create(post_id=post_id, date=date, views=count)
+    except IntegrityError:
+        # Another flush created the row first
+        rows.update(views=F('views') + count)
+
+
+def popular_posts(days: int = 30, limit: int = 5):
+    """Published posts with the most views over the last days, from the rollup"""
+    since = timezone.localdate() - datetime.timedelta(days=days - 1)
+    return SimpleBlogPost.objects.published().filter(
+        daily_views__date__gte=since,
+    ).annotate(recent_views=Sum('daily_views__views')).order_by('-recent_views')[:limit]
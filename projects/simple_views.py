@@ -4,22 +4,26 @@ Much simpler than the DynamoDB approach
 """
 
 from django.shortcuts import render, get_object_or_404
-from django.core.paginator import Paginator
-from django.db.models import Q
 from django.http import Http404
-from django.utils import timezone
 from .simple_aws_models import SimpleBlogPost, BlogCategory, BlogTag
+from .simple_blog_cache import cache_key
+from .simple_blog_publishing import publish_due_posts_if_needed
+from .simple_blog_search import search_posts
+from .simple_related_posts import get_related_posts
+from .simple_blog_sidebar import get_sidebar
+from .pagination import KeysetPaginator
+
+POSTS_PER_PAGE = 10
 
 
 def simple_blog_list(request):
     """
     Display published blog posts with pagination
     """
+    publish_due_posts_if_needed()
+    
     # Get only published posts
-    posts = SimpleBlogPost.objects.filter(
-        status='published',
-        publish_date__lte=timezone.now()
-    ).select_related('category', 'author').prefetch_related('tags')
+    posts = SimpleBlogPost.objects.published().select_related('category', 'author').prefetch_related('tags')
     
     # Handle category filtering
     category_slug = request.GET.get('category')
@@ -34,27 +38,20 @@ def simple_blog_list(request):
     # Handle search
     search_query = request.GET.get('search')
     if search_query:
-        posts = posts.filter(
-            Q(title__icontains=search_query) |
-            Q(content__icontains=search_query) |
-            Q(excerpt__icontains=search_query)
-        ).distinct()
+        posts = search_posts(posts, search_query)
     
-    # Pagination
-    paginator = Paginator(posts, 10)  # 10 posts per page
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    # Pagination (newest first, by publish_date then id), cached until the blog changes
+    listing_key = cache_key('list', category_slug, tag_slug, search_query)
+    paginator = KeysetPaginator(posts, POSTS_PER_PAGE, count_key=listing_key)
+    page_obj = paginator.get_page(request.GET.get('cursor'), cache_key=listing_key)
     
-    # Get categories and tags for sidebar
-    categories = BlogCategory.objects.all()
-    popular_tags = BlogTag.objects.filter(
-        simpleblogpost__status='published'
-    ).distinct()[:10]
+    # Categories and popular tags (with post counts) for the sidebar
+    sidebar = get_sidebar()
     
     context = {
         'posts': page_obj,
-        'categories': categories,
-        'popular_tags': popular_tags,
+        'categories': sidebar['categories'],
+        'popular_tags': sidebar['popular_tags'],
         'search_query': search_query,
         'current_category': category_slug,
         'current_tag': tag_slug,
@@ -68,6 +65,8 @@ def simple_blog_detail(request, slug):
     """
     Display a single blog post
     """
+    publish_due_posts_if_needed()
+    
     post = get_object_or_404(
         SimpleBlogPost.objects.select_related('category', 'author').prefetch_related('tags'),
         slug=slug
@@ -81,12 +80,8 @@ def simple_blog_detail(request, slug):
     if post.is_published and not request.user.is_staff:
         post.increment_view_count()
     
-    # Get related posts (same category, excluding current post)
-    related_posts = SimpleBlogPost.objects.filter(
-        status='published',
-        publish_date__lte=timezone.now(),
-        category=post.category
-    ).exclude(id=post.id)[:3]
+    # Get related posts (shared tags and category, precomputed)
+    related_posts = get_related_posts(post)
     
     # Get comments if enabled
     comments = []
@@ -106,18 +101,17 @@ def simple_blog_category(request, slug):
     """
     Display posts from a specific category
     """
+    publish_due_posts_if_needed()
     category = get_object_or_404(BlogCategory, slug=slug)
     
-    posts = SimpleBlogPost.objects.filter(
-        status='published',
-        publish_date__lte=timezone.now(),
+    posts = SimpleBlogPost.objects.published().filter(
         category=category
     ).select_related('author').prefetch_related('tags')
     
     # Pagination
-    paginator = Paginator(posts, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    listing_key = cache_key('category', category.pk)
+    paginator = KeysetPaginator(posts, POSTS_PER_PAGE, count_key=listing_key)
+    page_obj = paginator.get_page(request.GET.get('cursor'), cache_key=listing_key)
     
     context = {
         'posts': page_obj,
@@ -132,18 +126,17 @@ def simple_blog_tag(request, slug):
     """
     Display posts with a specific tag
     """
+    publish_due_posts_if_needed()
     tag = get_object_or_404(BlogTag, slug=slug)
     
-    posts = SimpleBlogPost.objects.filter(
-        status='published',
-        publish_date__lte=timezone.now(),
+    posts = SimpleBlogPost.objects.published().filter(
         tags=tag
     ).select_related('category', 'author').prefetch_related('tags')
     
     # Pagination
-    paginator = Paginator(posts, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    listing_key = cache_key('tag', tag.pk)
+    paginator = KeysetPaginator(posts, POSTS_PER_PAGE, count_key=listing_key)
+    page_obj = paginator.get_page(request.GET.get('cursor'), cache_key=listing_key)
     
     context = {
         'posts': page_obj,
@@ -158,24 +151,20 @@ def simple_blog_search(request):
     """
     Search blog posts
     """
+    publish_due_posts_if_needed()
     search_query = request.GET.get('q', '').strip()
-    posts = []
+    posts = SimpleBlogPost.objects.none()
     
     if search_query:
-        posts = SimpleBlogPost.objects.filter(
-            status='published',
-            publish_date__lte=timezone.now()
-        ).filter(
-            Q(title__icontains=search_query) |
-            Q(content__icontains=search_query) |
-            Q(excerpt__icontains=search_query) |
-            Q(tags__name__icontains=search_query)
-        ).select_related('category', 'author').prefetch_related('tags').distinct()
-    
-    # Pagination
-    paginator = Paginator(posts, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+        posts = search_posts(
+            SimpleBlogPost.objects.published().select_related('category', 'author').prefetch_related('tags'),
+            search_query
+        )
+    
+    # Pagination (best matches first)
+    listing_key = cache_key('search', search_query)
+    paginator = KeysetPaginator(posts, POSTS_PER_PAGE, count_key=listing_key)
+    page_obj = paginator.get_page(request.GET.get('cursor'), cache_key=listing_key)
     
     context = {
         'posts': page_obj,
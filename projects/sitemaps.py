@@ -0,0 +1,91 @@
+"""
+XML sitemap sections for the site. Each section is its own document under
+the /sitemap.xml index and is cached (see document_cache) until that
+section's content changes, so editing the gallery doesn't re-render blog URLs.
+"""
+
+from django.contrib.sitemaps import Sitemap
+from django.contrib.sitemaps import views as sitemap_views
+from django.urls import reverse
+
+from .document_cache import SECTIONS, cached_document
+from .feeds import blog_entries
+from .models import Classes, Gallery, Sword_sales
+
+
+class PagesSitemap(Sitemap):
+    changefreq = 'weekly'
+    priority = 0.8
+
+    def items(self):
+        return ['home', 'about', 'gallery', 'sales', 'blog', 'order_form']
+
+    def location(self, item):
+        return reverse(item)
+
+
+class ClassesSitemap(Sitemap):
+    """The classes page, listed while any class is on the schedule"""
+    changefreq = 'weekly'
+    priority = 0.8
+
+    def items(self):
+        return ['classes'] if Classes.objects.exists() else []
+
+    def location(self, item):
+        return reverse(item)
+
+
+class GallerySitemap(Sitemap):
+    changefreq = 'monthly'
+    priority = 0.6
+
+    def items(self):
+        return Gallery.objects.filter(is_active=True).only('pk', 'date_added').order_by('pk')
+
+    def location(self, item):
+        return reverse('gallery_detail', args=[item.pk])
+
+    def lastmod(self, item):
+        return item.date_added
+
+
+class SalesSitemap(Sitemap):
+    changefreq = 'weekly'
+    priority = 0.7
+
+    def items(self):
+        return Sword_sales.objects.only('pk').order_by('pk')
+
+    def location(self, item):
+        return reverse('details_sales', args=[item.pk])
+
+
+class BlogSitemap(Sitemap):
+    changefreq = 'weekly'
+    priority = 0.6
+
+    def items(self):
+        # Legacy posts have no URL of their own; the blog page is already in PagesSitemap
+        return blog_entries(limit=None, include_legacy=False)
+
+    def location(self, item):
+        return item.link
+
+    def lastmod(self, item):
+        return item.updated
+
+
+SITEMAPS = {
+    'pages': PagesSitemap,
+    'classes': ClassesSitemap,
+    'gallery': GallerySitemap,
+    'sales': SalesSitemap,
+    'blog': BlogSitemap,
+}
+
+
+sitemap_index = cached_document(lambda **kwargs: SECTIONS)(sitemap_views.index)
+sitemap_section = cached_document(
+    lambda section, **kwargs: [section] if section in SITEMAPS else []
+)(sitemap_views.sitemap)
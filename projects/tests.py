@@ -1,3 +1,978 @@
-from django.test import TestCase
+import datetime
+import tempfile
+import threading
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db.models import F, QuerySet
+from django.urls import path
+from django.views.generic import RedirectView
+from django.utils import timezone
+from boto3.dynamodb.conditions import Attr, Key
+from boto3.resources.base import ServiceResource
+from botocore.exceptions import ClientError
+
+from omimi import urls as site_urls
+
+from .aws_blog_service import DynamoDBBlogService
+from .local_dynamodb import LocalDynamoDBResource
+from .simple_aws_models import BlogCategory, BlogTag, DailyPostViews, PendingPostView, RelatedPost, SimpleBlogPost
+from .simple_blog_search import rebuild_search_documents, search_backend, search_posts
+from .feeds import blog_entries
+from .simple_view_counts import flush_view_counts, popular_posts
+from .simple_related_posts import RELATED_POSTS_STORED, get_related_posts, rebuild_related_posts
+from .simple_blog_sidebar import get_sidebar
+from .simple_blog_cache import GENERATION_KEY, cache_key
+from .simple_blog_publishing import publish_due_posts, publish_due_posts_if_needed
+from .pagination import KeysetPaginator
+from .models import Blog, BlogImages, CacheGeneration, Gallery
+
+
+class LocalDynamoDBTests(SimpleTestCase):
+    """The local stand-in should behave like DynamoDB for the calls the blog makes"""
+
+    def setUp(self):
+        self.resource = LocalDynamoDBResource()
+        self.table = self.resource.create_table(
+            TableName='items',
+            KeySchema=[{'AttributeName': 'pk', 'KeyType': 'HASH'}],
+        )
+
+    def test_missing_table_raises_resource_not_found(self):
+        with self.assertRaises(ClientError) as raised:
+            self.resource.Table('missing').load()
+        self.assertEqual(raised.exception.response['Error']['Code'], 'ResourceNotFoundException')
+
+    def test_scan_limit_applies_before_filter(self):
+        for i in range(10):
+            self.table.put_item(Item={'pk': f'item-{i}', 'even': i % 2 == 0})
+
+        seen = []
+        kwargs = {'Limit': 3, 'FilterExpression': Attr('even').eq(True)}
+        while True:
+            response = self.table.scan(**kwargs)
+            self.assertLessEqual(response['ScannedCount'], 3)
+            seen.extend(item['pk'] for item in response['Items'])
+            if 'LastEvaluatedKey' not in response:
+                break
+            kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+        self.assertEqual(sorted(seen), [f'item-{i}' for i in range(0, 10, 2)])
+
+    def test_query_resumes_after_a_deleted_start_key(self):
+        table = self.resource.create_table(
+            TableName='ranged',
+            KeySchema=[{'AttributeName': 'pk', 'KeyType': 'HASH'}, {'AttributeName': 'sk', 'KeyType': 'RANGE'}],
+        )
+        for i in range(1, 6):
+            table.put_item(Item={'pk': 'a', 'sk': i})
+
+        for forward, expected in ((True, [3, 4, 5]), (False, [3, 2, 1])):
+            first = table.query(KeyConditionExpression=Key('pk').eq('a'), ScanIndexForward=forward, Limit=2)
+            table.delete_item(Key=first['LastEvaluatedKey'])
+            rest = table.query(
+                KeyConditionExpression=Key('pk').eq('a'), ScanIndexForward=forward,
+                ExclusiveStartKey=first['LastEvaluatedKey'],
+            )
+            self.assertEqual([item['sk'] for item in rest['Items']], expected)
+            table.put_item(Item=first['LastEvaluatedKey'])
+
+    def test_unsupported_conditions_are_validation_errors(self):
+        self.table.put_item(Item={'pk': 'a'})
+        calls = [
+            lambda: self.table.scan(FilterExpression='attribute_exists(pk)'),
+            lambda: self.table.query(KeyConditionExpression='pk = :pk'),
+            lambda: self.table.put_item(Item={'pk': 'b'}, ConditionExpression='attribute_not_exists(pk)'),
+        ]
+        for call in calls:
+            with self.assertRaises(ClientError) as raised:
+                call()
+            self.assertEqual(raised.exception.response['Error']['Code'], 'ValidationException')
+        self.assertEqual(self.table.get_item(Key={'pk': 'b'}), {})
+
+    def test_update_expression(self):
+        self.table.put_item(Item={'pk': 'a', 'views': 1, 'ids': ['x']})
+        response = self.table.update_item(
+            Key={'pk': 'a'},
+            UpdateExpression='SET ids = list_append(:new, ids), #t = if_not_exists(#t, :t) ADD views :one, tags :tags',
+            ExpressionAttributeNames={'#t': 'title'},
+            ExpressionAttributeValues={':new': ['y'], ':t': 'Title', ':one': 1, ':tags': {'steel'}},
+            ReturnValues='ALL_NEW',
+        )
+        item = response['Attributes']
+        self.assertEqual(item['ids'], ['y', 'x'])
+        self.assertEqual(item['views'], Decimal(2))
+        self.assertEqual(item['tags'], {'steel'})
+        self.assertEqual(item['title'], 'Title')
+
+        self.table.update_item(Key={'pk': 'a'}, UpdateExpression='REMOVE ids[0], ids[1], title')
+        self.assertEqual(self.table.get_item(Key={'pk': 'a'})['Item'], {'pk': 'a', 'views': 2, 'ids': [], 'tags': {'steel'}})
+
+    def test_item_write_limit_throttles_hot_keys(self):
+        table = LocalDynamoDBResource(item_write_limit=2).create_table(
+            TableName='t', KeySchema=[{'AttributeName': 'pk', 'KeyType': 'HASH'}]
+        )
+        with mock.patch('projects.local_dynamodb.time.monotonic', return_value=100.0):
+            table.put_item(Item={'pk': 'hot'})
+            table.put_item(Item={'pk': 'hot'})
+            table.put_item(Item={'pk': 'cold'})
+            with self.assertRaises(ClientError) as raised:
+                table.put_item(Item={'pk': 'hot'})
+        self.assertEqual(raised.exception.response['Error']['Code'], 'ProvisionedThroughputExceededException')
+        table.put_item(Item={'pk': 'hot'})
+
+    def test_sqlite_backend_persists(self):
+        with tempfile.NamedTemporaryFile(suffix='.sqlite3') as db:
+            resource = LocalDynamoDBResource(path=db.name)
+            resource.create_table(TableName='items', KeySchema=[{'AttributeName': 'pk', 'KeyType': 'HASH'}])
+            resource.Table('items').put_item(Item={'pk': 'a', 'tags': {'x'}, 'count': 3})
+
+            reopened = LocalDynamoDBResource(path=db.name).Table('items')
+            self.assertEqual(reopened.get_item(Key={'pk': 'a'})['Item'], {'pk': 'a', 'tags': {'x'}, 'count': 3})
+
+
+class BlogServiceTests(SimpleTestCase):
+    """DynamoDBBlogService running against the in-memory stand-in"""
+
+    def setUp(self):
+        self.service = DynamoDBBlogService(dynamodb=LocalDynamoDBResource())
+
+    def test_stats_follow_writes(self):
+        first = self.service.create_blog_post('Forging', '<p>Hot steel</p>', tags=['steel', 'forge'])
+        second = self.service.create_blog_post('Polishing', '<p>Stones</p>', tags=['steel'])
+        self.service.update_blog_post(second, published=False)
+        with mock.patch.object(self.service.table, 'update_item', wraps=self.service.table.update_item) as update_item:
+            self.service.increment_view_count(first)
+        # The post and one of the view total shards, never STATS#global itself
+        keys = [call.kwargs['Key']['blog_id'] for call in update_item.call_args_list]
+        self.assertEqual(keys[0], first)
+        self.assertRegex(keys[1], r'^VIEWS#STATS#global#\d$')
+
+        stats = self.service.get_blog_stats()
+        self.assertEqual((stats['total_posts'], stats['published_count'], stats['draft_count']), (2, 1, 1))
+        self.assertEqual(stats['total_views'], 1)
+        self.assertEqual(stats['popular_tags'], [('forge', 1), ('steel', 1)])
+        self.assertEqual(stats['recent_ids'], [second, first])
+
+        self.assertFalse(self.service.update_blog_post('missing', title='Ghost'))
+        self.assertEqual(self.service.table.get_item(Key={'blog_id': 'missing'}), {})
+
+        self.service.delete_blog_post(first)
+        stats = self.service.get_blog_stats()
+        self.assertEqual((stats['total_posts'], stats['published_count'], stats['total_views']), (1, 0, 0))
+        self.assertEqual(stats['popular_tags'], [])
+        self.assertEqual(stats['recent_ids'], [second])
+
+    def test_search_ranks_and_highlights(self):
+        title_match = self.service.create_blog_post('Forging a katana', '<p>Notes from the shop.</p>')
+        body_match = self.service.create_blog_post('Shop notes', '<p>We were <b>forging</b> all day.</p>')
+        self.service.create_blog_post('Gardening', '<p>Nothing about swords.</p>')
+
+        results = self.service.search_blog_posts('FORGED')
+        self.assertEqual([item['blog_id'] for item in results], [title_match, body_match])
+        self.assertIn('<mark>forging</mark>', results[1]['search_snippet'])
+
+        self.service.update_blog_post(body_match, content='<p>Quiet day.</p>')
+        self.assertEqual([item['blog_id'] for item in self.service.search_blog_posts('forge')], [title_match])
+
+    def test_search_postings_live_in_their_own_table(self):
+        blog_id = self.service.create_blog_post('Tamahagane', '<p>Smelted steel, folded steel.</p>')
+        self.service.table.put_item(Item={'blog_id': 'TERM#steel', 'd_gone': [1, 1]})
+        posting = self.service.search_table.get_item(Key={'term': 'steel', 'blog_id': blog_id})['Item']
+        self.assertEqual(posting['tf'], 2)
+
+        with mock.patch.object(self.service.search_table, 'batch_writer', wraps=self.service.search_table.batch_writer) as writer:
+            self.service.update_blog_post(blog_id, content='<p>Smelted steel, folded steel and iron.</p>')
+        writer.assert_called_once()
+        self.assertEqual(self.service.search_table.get_item(Key={'term': 'iron', 'blog_id': blog_id})['Item']['tf'], 1)
+
+        self.assertEqual(self.service.rebuild_search_index()['removed_postings'], 1)
+        self.assertEqual(self.service.table.get_item(Key={'blog_id': 'TERM#steel'}), {})
+        self.assertEqual([item['blog_id'] for item in self.service.search_blog_posts('iron')], [blog_id])
+
+    def test_summary_reads_skip_content(self):
+        blog_id = self.service.create_blog_post(
+            'Tsuba', '<p>' + 'guard ' * 100 + '</p>', images=['a.jpg', 'b.jpg'], tags=['fittings']
+        )
+
+        summary = self.service.get_all_blog_posts(summary=True)[0]
+        self.assertNotIn('content', summary)
+        self.assertEqual(summary['images'], ['a.jpg', 'b.jpg'])
+        self.assertTrue(summary['excerpt'].startswith('guard guard'))
+        self.assertTrue(summary['excerpt'].endswith('...'))
+        self.assertEqual(self.service.get_blog_post(blog_id, summary=True), summary)
+
+    def test_text_fields_stored_and_backfilled(self):
+        blog_id = self.service.create_blog_post('Hamon', '<p>Clay &amp; <em>quench</em></p>')
+        item = self.service.get_blog_post(blog_id)
+        self.assertEqual(item['plain_text'], 'Clay & quench')
+        self.assertEqual((item['word_count'], item['reading_time']), (3, 1))
+
+        self.service.table.put_item(Item={'blog_id': 'legacy', 'title': 'Old', 'content': '<p>Old post</p>'})
+        self.assertEqual(self.service.backfill_text_fields(), {'updated': 1, 'skipped': 1})
+        self.assertEqual(self.service.get_blog_post('legacy')['excerpt'], 'Old post')
+
+    def test_query_layer_pushes_filters_down(self):
+        from .aws_models import DynamoDBBlogPost
+
+        ids = []
+        for day, tags in ((1, ['steel']), (2, ['wood']), (3, ['steel'])):
+            blog_id = self.service.create_blog_post(f'Day {day}', '<p>Log</p>', tags=tags)
+            self.service.table.update_item(
+                Key={'blog_id': blog_id}, UpdateExpression='SET created_date = :d REMOVE created_month',
+                ExpressionAttributeValues={':d': f'2025-03-0{day}T00:00:00+00:00'},
+            )
+            ids.append(blog_id)
+        self.service.backfill_archive_months()
+        self.service.update_blog_post(ids[2], published=False)
+
+        with mock.patch('projects.aws_models.blog_service', self.service):
+            steel = DynamoDBBlogPost.objects.filter(tags__contains='steel')
+            self.assertEqual([post.blog_id for post in steel], [ids[2], ids[0]])
+            published = DynamoDBBlogPost.objects.filter(published=True).order_by('created_date')
+            self.assertEqual([post.blog_id for post in published], [ids[0], ids[1]])
+            # Ordered, limited reads walk the archive index from the newest month
+            with mock.patch.object(self.service.table, 'scan', side_effect=AssertionError('scanned')):
+                newest = DynamoDBBlogPost.objects.filter(created_date__gte='2025-03-02').summaries()[:1]
+                self.assertEqual([post.blog_id for post in newest], [ids[2]])
+                latest = self.service.get_all_blog_posts(limit=1, summary=True)
+                self.assertEqual([item['blog_id'] for item in latest], [ids[1]])
+                tagged = DynamoDBBlogPost.objects.filter(published=True, tags__contains='steel').summaries()
+                self.assertEqual(tagged.count(), 1)
+                self.assertEqual([post.blog_id for post in tagged[:10]], [ids[0]])
+            self.assertEqual(len(DynamoDBBlogPost.objects.filter(blog_id__in=[ids[1], 'missing'])), 1)
+            with self.assertRaises(ValueError):
+                DynamoDBBlogPost.objects.filter(title__icontains='day')
+
+    def test_tags_are_matched_without_case(self):
+        from .aws_models import DynamoDBBlogPost
+
+        blog_id = self.service.create_blog_post('Saya', '<p>Scabbard</p>', tags=['Fittings', ' fittings', 'Wood'])
+        self.assertEqual(self.service.get_blog_post(blog_id)['tags'], ['fittings', 'wood'])
+        self.service.table.put_item(Item={
+            'blog_id': 'legacy', 'title': 'Old', 'content': '<p>Old</p>', 'published': True,
+            'created_date': '2025-01-01T00:00:00+00:00', 'tags': ['Wood'],
+        })
+        self.assertEqual(self.service.rebuild_blog_stats()['tag_count'], 2)
+        self.assertEqual(self.service.table.get_item(Key={'blog_id': 'legacy'})['Item']['tags'], ['wood'])
+        self.assertEqual(self.service.get_blog_stats()['popular_tags'], [('wood', 2), ('fittings', 1)])
+
+        with mock.patch('projects.aws_models.blog_service', self.service):
+            tagged = DynamoDBBlogPost.objects.filter(published=True, tags__contains='WOOD').summaries()
+            self.assertEqual(tagged.count(), 2)
+            self.assertEqual(len(list(tagged)), 2)
+
+    def test_get_many_keeps_order_and_retries_unprocessed_keys(self):
+        ids = [self.service.create_blog_post(f'Post {n}', '<p>Body</p>') for n in range(3)]
+        real_batch_get = self.service.dynamodb.batch_get_item
+        calls = []
+
+        def throttled_batch_get(RequestItems):
+            calls.append(RequestItems)
+            if len(calls) == 1:
+                # First call only serves one key and hands the rest back
+                request = RequestItems[self.service.table_name]
+                response = real_batch_get({self.service.table_name: dict(request, Keys=request['Keys'][:1])})
+                response['UnprocessedKeys'] = {self.service.table_name: dict(request, Keys=request['Keys'][1:])}
+                return response
+            return real_batch_get(RequestItems)
+
+        with mock.patch.object(self.service.dynamodb, 'batch_get_item', throttled_batch_get), \
+                mock.patch('projects.aws_blog_service.time.sleep') as sleep:
+            items = self.service.get_many([ids[2], 'missing', ids[0], ids[1], ids[2]], summary=True)
+
+        self.assertEqual([item['blog_id'] for item in items], [ids[2], ids[0], ids[1], ids[2]])
+        self.assertNotIn('content', items[0])
+        self.assertEqual(len(calls), 2)
+        sleep.assert_called_once()
+
+    def test_bulk_publish_and_delete(self):
+        ids = [
+            self.service.create_blog_post(f'Blade {n}', '<p>Forged steel</p>', tags=['steel'])
+            for n in range(30)
+        ]
+
+        self.assertEqual(self.service.set_published_many(ids[:20] + ['missing'], False), 20)
+        stats = self.service.get_blog_stats()
+        self.assertEqual((stats['published_count'], stats['draft_count']), (10, 20))
+        self.assertEqual(stats['popular_tags'], [('steel', 10)])
+
+        # A stale cached copy must not decide the stats delta
+        self.service.get_many(ids[25:])
+        self.service.table.update_item(
+            Key={'blog_id': ids[29]}, UpdateExpression='SET published = :p', ExpressionAttributeValues={':p': False}
+        )
+        self.service._update_stats({'blog_id': ids[29], 'tags': ['steel']}, {'blog_id': ids[29], 'tags': ['steel'], 'published': False})
+        self.assertEqual(self.service.delete_blog_posts(ids[15:] + ['missing']), 15)
+        stats = self.service.get_blog_stats()
+        self.assertEqual((stats['total_posts'], stats['published_count'], stats['draft_count']), (15, 0, 15))
+        self.assertEqual(stats['popular_tags'], [])
+        self.assertFalse(set(stats['recent_ids']) & set(ids[15:]))
+        self.assertEqual(self.service.search_blog_posts('steel'), [])
+        self.service.set_published_many(ids[:2], True)
+        self.assertEqual(len(self.service.search_blog_posts('steel')), 2)
+
+    def test_archive_index_serves_date_ranges(self):
+        dates = ['2025-02-28T23:00:00+00:00', '2025-03-01T06:00:00+00:00', '2025-03-31T12:00:00+00:00',
+                 '2025-04-01T05:00:00+00:00', '2025-04-01T06:00:00+00:00']
+        ids = []
+        for date in dates:
+            blog_id = self.service.create_blog_post(date, '<p>Archive</p>')
+            self.service.table.update_item(
+                Key={'blog_id': blog_id}, UpdateExpression='SET created_date = :d REMOVE created_month',
+                ExpressionAttributeValues={':d': date},
+            )
+            ids.append(blog_id)
+        self.assertEqual(self.service.backfill_archive_months(), {'updated': 5, 'skipped': 0})
+
+        # March in US Central time covers two UTC partitions
+        with mock.patch.object(self.service.table, 'scan', side_effect=AssertionError('scanned')):
+            posts = self.service.find_blog_posts(
+                created_from='2025-03-01T06:00:00+00:00', created_before='2025-04-01T05:00:00+00:00'
+            )
+            self.assertEqual([post['blog_id'] for post in posts], [ids[2], ids[1]])
+            self.assertIn('content', posts[0])
+            oldest = self.service.find_blog_posts(
+                created_from='2025-01-01T00:00:00+00:00', created_before='2025-05-01T00:00:00+00:00',
+                newest_first=False, limit=2, summary=True
+            )
+            self.assertEqual([post['blog_id'] for post in oldest], ids[:2])
+
+    def test_archive_index_migration_replaces_date_index(self):
+        resource = LocalDynamoDBResource()
+        resource.create_table(
+            TableName='omimi-blog-posts',
+            KeySchema=[{'AttributeName': 'blog_id', 'KeyType': 'HASH'}],
+            GlobalSecondaryIndexes=[{
+                'IndexName': 'DateIndex',
+                'KeySchema': [{'AttributeName': 'created_date', 'KeyType': 'HASH'}],
+                'Projection': {'ProjectionType': 'ALL'},
+            }],
+        )
+        service = DynamoDBBlogService(dynamodb=resource)
+        self.assertEqual(service.ensure_archive_index(), {'dropped_legacy': True, 'created': True})
+        self.assertEqual([index['IndexName'] for index in service.table.global_secondary_indexes], ['ArchiveIndex'])
+        self.assertEqual(service.ensure_archive_index(), {'dropped_legacy': False, 'created': False})
+
+    def test_read_through_cache_hits_and_invalidates(self):
+        blog_id = self.service.create_blog_post('Habaki', '<p>Collar</p>')
+        self.service.get_blog_post(blog_id)
+
+        with mock.patch.object(self.service.table, 'get_item', side_effect=AssertionError('not cached')):
+            item = self.service.get_blog_post(blog_id)
+            item['title'] = 'Mutated by a caller'
+            self.assertEqual(self.service.get_blog_post(blog_id)['title'], 'Habaki')
+        self.assertEqual(self.service.cache.stats()['hits'], 2)
+
+        self.service.get_all_blog_posts(summary=True)
+        self.service.update_blog_post(blog_id, title='Habaki collar')
+        self.assertEqual(self.service.get_blog_post(blog_id)['title'], 'Habaki collar')
+        self.assertEqual(self.service.get_all_blog_posts(summary=True)[0]['title'], 'Habaki collar')
+
+        with mock.patch('projects.blog_cache.time.monotonic', return_value=10 ** 9):
+            with mock.patch.object(self.service.table, 'get_item', wraps=self.service.table.get_item) as get_item:
+                self.service.get_blog_post(blog_id)
+                get_item.assert_called_once()
+
+    def test_large_content_is_stored_compressed(self):
+        self.service.compress_threshold = 1024
+        body = '<p>' + 'Differential hardening with clay. ' * 200 + '</p>'
+        blog_id = self.service.create_blog_post('Yaki-ire', body)
+        stored = self.service.table.get_item(Key={'blog_id': blog_id})['Item']
+        self.assertNotIn('content', stored)
+        self.assertLess(len(stored['content_z'].value), len(body) // 10)
+        self.assertEqual(self.service.get_blog_post(blog_id)['content'], body)
+        self.assertEqual(len(self.service.search_blog_posts('hardening')), 1)
+
+        self.service.update_blog_post(blog_id, content='<p>Short now</p>')
+        stored = self.service.table.get_item(Key={'blog_id': blog_id})['Item']
+        self.assertEqual((stored['content'], 'content_z' in stored), ('<p>Short now</p>', False))
+
+        self.service.table.put_item(Item={'blog_id': 'legacy', 'title': 'Old', 'content': body})
+        self.assertEqual(self.service.compress_existing_content(), {'compressed': 1, 'skipped': 1})
+        self.assertEqual(self.service.get_blog_post('legacy')['content'], body)
+
+    def test_sharded_view_counters(self):
+        self.service.view_counter_shards = 4
+        keep = self.service.create_blog_post('Viral', '<p>Popular</p>')
+        gone = self.service.create_blog_post('Also viral', '<p>Popular</p>')
+        for _ in range(10):
+            self.service.increment_view_count(keep)
+        for _ in range(3):
+            self.service.increment_view_count(gone)
+
+        self.assertEqual(self.service.get_blog_post(keep)['view_count'], 10)
+        with mock.patch.object(self.service.table, 'scan', side_effect=AssertionError('scanned')):
+            self.assertEqual(self.service.get_blog_stats()['total_views'], 13)
+        self.assertEqual(self.service.rebuild_blog_stats()['total_views'], 13)
+        self.assertEqual(self.service.get_blog_stats()['total_views'], 13)
+
+        self.service.delete_blog_post(gone)
+        self.assertEqual(self.service.get_blog_stats()['total_views'], 10)
+        shards = self.service.table.scan(FilterExpression=Attr('blog_id').begins_with(f'VIEWS#{gone}'))
+        self.assertEqual(shards['Count'], 0)
+        self.assertEqual(self.service.get_all_blog_posts(summary=True)[0]['view_count'], 10)
+
+    def test_parallel_scan_covers_every_item_once(self):
+        ids = {self.service.create_blog_post(f'Post {n}', '<p>Body</p>') for n in range(40)}
+        scanned = []
+
+        posts = list(self.service._scan_all_posts(segments=4, progress=scanned.append))
+        self.assertEqual(sorted(post['blog_id'] for post in posts), sorted(ids))
+        self.assertEqual(scanned[-1], self.service.table.scan(Select='COUNT')['ScannedCount'])
+
+        with mock.patch.object(self.service.table, 'scan', side_effect=ClientError({'Error': {'Code': 'Boom'}}, 'Scan')):
+            with self.assertRaises(ClientError):
+                list(self.service.parallel_scan(segments=2))
+
+    def test_worker_threads_get_their_own_boto3_tables(self):
+        self.service.dynamodb = mock.Mock(spec=ServiceResource)
+        handles = []
+
+        def use_table():
+            handles.append((self.service._thread_table('posts'), self.service._thread_table('posts')))
+
+        with mock.patch.object(DynamoDBBlogService, '_boto3_resource', side_effect=lambda session: mock.Mock()) as build:
+            threads = [threading.Thread(target=use_table) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        (first, first_again), (second, _) = handles
+        self.assertIs(first, first_again)
+        self.assertIsNot(first, second)
+        self.assertEqual(build.call_count, 2)
+
+
+class BlogPostRecordTests(SimpleTestCase):
+
+    def test_record_reads_summary_item(self):
+        from .aws_models import BlogPostRecord
+
+        record = BlogPostRecord({
+            'blog_id': 'abc', 'title': 'Saya', 'images': ['cover.jpg', 'b.jpg'],
+            'tags': ['wood'], 'created_date': '2025-01-02T03:04:05+00:00',
+        })
+        self.assertIsNone(record._created_date)
+        self.assertEqual(record.created_date.year, 2025)
+        self.assertEqual(record.updated_date, record.created_date)
+        self.assertEqual(record.cover_image, default_storage.url('cover.jpg'))
+        self.assertEqual(record.get_tags_list(), ['wood'])
+        with self.assertRaises(AttributeError):
+            record.unexpected = True
+
+    def test_stripped_content_falls_back_before_backfill(self):
+        from .aws_models import BlogPostRecord, DynamoDBBlogPost
+
+        legacy = {'blog_id': 'old', 'title': 'Old', 'content': '<p>Old <b>post</b></p>'}
+        self.assertEqual(DynamoDBBlogPost.objects._dynamo_to_django(legacy).stripped_content, 'Old post')
+        self.assertEqual(BlogPostRecord(legacy).stripped_content, 'Old post')
+        self.assertEqual(BlogPostRecord({'blog_id': 'a', 'excerpt': 'Summary'}).stripped_content, 'Summary')
+        self.assertEqual(BlogPostRecord({'blog_id': 'a', 'plain_text': 'Stored', 'excerpt': 'x'}).stripped_content, 'Stored')
+
+
+class MediaUrlTests(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    @override_settings(AWS_STORAGE_BUCKET_NAME='omimi-media', AWS_LOCATION='media')
+    def test_storage_key_from_url(self):
+        from .media_urls import storage_key_from_url
+
+        signed = 'https://omimi-media.s3.amazonaws.com/media/images/hamon%201.jpg?X-Amz-Expires=3600&X-Amz-Signature=abc'
+        self.assertEqual(storage_key_from_url(signed), 'images/hamon 1.jpg')
+        self.assertEqual(storage_key_from_url('https://s3.amazonaws.com/omimi-media/media/images/a.jpg'), 'images/a.jpg')
+        self.assertEqual(storage_key_from_url('/media/images/b.jpg'), 'images/b.jpg')
+        self.assertEqual(storage_key_from_url('images/c.jpg'), 'images/c.jpg')
+        self.assertIsNone(storage_key_from_url('https://example.com/d.jpg'))
+
+    def test_keys_are_signed_once_per_cache_lifetime(self):
+        from .media_urls import resolve_image_urls
+
+        with mock.patch('projects.media_urls.default_storage') as storage:
+            storage.querystring_auth = True
+            storage.url.side_effect = lambda key: f'https://signed/{key}?sig=1'
+            values = ['images/a.jpg', 'https://example.com/b.jpg']
+            self.assertEqual(resolve_image_urls(values), ['https://signed/images/a.jpg?sig=1', 'https://example.com/b.jpg'])
+            self.assertEqual(resolve_image_urls(values)[0], 'https://signed/images/a.jpg?sig=1')
+            storage.url.assert_called_once_with('images/a.jpg')
+
+    @override_settings(AWS_STORAGE_BUCKET_NAME='omimi-media', AWS_LOCATION='media')
+    def test_convert_stored_urls_to_keys(self):
+        from .media_urls import storage_key_from_url
+
+        service = DynamoDBBlogService(dynamodb=LocalDynamoDBResource())
+        blog_id = service.create_blog_post('Koshirae', '<p>Mounts</p>', images=[
+            'https://omimi-media.s3.amazonaws.com/media/images/a.jpg?X-Amz-Signature=abc',
+            'https://example.com/b.jpg',
+        ])
+        service.create_blog_post('Plain', '<p>No images</p>')
+
+        result = service.rewrite_post_images(lambda value: storage_key_from_url(value) or value)
+        self.assertEqual(result, {'updated': 1, 'skipped': 1})
+        self.assertEqual(service.get_blog_post(blog_id)['images'], ['images/a.jpg', 'https://example.com/b.jpg'])
+
+
+class SimpleBlogTestCase(TestCase):
+    """Shared setup for the simple blog tests: an author and a helper for published posts"""
+
+    def setUp(self):
+        self.author = User.objects.create(username='writer')
+
+    def _post(self, title, content, **kwargs):
+        return SimpleBlogPost.objects.create(
+            title=title, content=content, author=self.author, status='published', **kwargs
+        )
+
+
+class SimpleBlogSlugTests(SimpleBlogTestCase):
+    def test_slug_allocation_is_one_query_per_save(self):
+        first = self._post('Forge Day', 'x')
+        SimpleBlogPost.objects.create(title='Forge Day 7', content='x', author=self.author)
+        with CaptureQueriesContext(connection) as second:
+            self._post('Forge Day', 'x')
+        for _ in range(300):
+            self._post('Forge Day', 'x')
+        with CaptureQueriesContext(connection) as last:
+            latest = self._post('Forge Day', 'x')
+
+        self.assertEqual(len(last), len(second))
+        self.assertEqual(first.slug, 'forge-day')
+        self.assertEqual(latest.slug, 'forge-day-303')  # lowest free suffix, skipping forge-day-7
+        slugs = SimpleBlogPost.objects.filter(title='Forge Day').values_list('slug', flat=True)
+        self.assertEqual(len(set(slugs)), 303)
+
+    def test_slug_collision_on_insert_is_retried(self):
+        self._post('Forge Day', 'x')
+        post = SimpleBlogPost(title='Forge Day', content='x', author=self.author)
+        with mock.patch.object(SimpleBlogPost, '_next_free_slug', side_effect=['forge-day', 'forge-day-1']):
+            post.save()
+        self.assertEqual(post.slug, 'forge-day-1')
+
+
+class SimpleBlogTextFieldTests(SimpleBlogTestCase):
+    def test_text_fields_are_derived_on_save(self):
+        post = self._post('Long read', '<p>' + 'steel &amp; fire ' * 300 + '</p>')
+        self.assertEqual(post.word_count, 900)
+        self.assertEqual(post.reading_time, 4)
+        self.assertTrue(post.plain_text.startswith('steel & fire'))
+        self.assertNotIn('<p>', post.excerpt)
+
+        post.content = '<p>Short now.</p>'
+        post.save(update_fields=['content'])
+        post = SimpleBlogPost.objects.get(pk=post.pk)
+        self.assertEqual((post.word_count, post.reading_time, post.plain_text), (2, 1, 'Short now.'))
+
+
+class SimpleRelatedPostTests(SimpleBlogTestCase):
+    def test_related_posts_weight_rare_tags_and_stay_current(self):
+        common, rare = BlogTag.objects.create(name='Steel'), BlogTag.objects.create(name='Hamon')
+        post = self._post('Polishing', 'x')
+        post.tags.add(common, rare)
+        shares_rare = self._post('Hamon lines', 'x')
+        shares_rare.tags.add(rare)
+        shares_common = [self._post(f'Steel {i}', 'x') for i in range(3)]
+        for other in shares_common:
+            other.tags.add(common)
+        self._post('Unrelated', 'x')
+        self.assertEqual(len(get_related_posts(post, limit=10)), 4)
+
+        # Scores written while the corpus grew used the tag counts of the time
+        rebuild_related_posts()
+        related = get_related_posts(post)
+        self.assertEqual(related[0], shares_rare)
+        self.assertEqual(len(related), 3)
+
+        category = BlogCategory.objects.create(name='Forging')
+        for other in (post, shares_common[2]):
+            other.category = category
+            other.save()
+        shares_rare.tags.remove(rare)
+        self.assertEqual(get_related_posts(post)[0], shares_common[2])
+        self.assertNotIn(shares_rare, get_related_posts(post, limit=10))
+
+        incremental = set(RelatedPost.objects.values_list('post_id', 'related_id'))
+        self.assertEqual(rebuild_related_posts(), len(incremental))
+        self.assertEqual(set(RelatedPost.objects.values_list('post_id', 'related_id')), incremental)
+
+    def test_related_links_are_capped_and_follow_tag_clears_and_deletes(self):
+        steel = BlogTag.objects.create(name='Steel')
+        posts = [self._post(f'Steel {i}', 'x') for i in range(RELATED_POSTS_STORED + 5)]
+        for post in posts:
+            post.tags.add(steel)
+        self.assertEqual(RelatedPost.objects.count(), len(posts) * RELATED_POSTS_STORED)
+
+        hamon = BlogTag.objects.create(name='Hamon')
+        hamon.simpleblogpost_set.add(posts[-1], posts[-2])
+        self.assertEqual(get_related_posts(posts[-1])[0], posts[-2])
+        hamon.simpleblogpost_set.clear()
+        self.assertEqual(get_related_posts(posts[-1])[0], posts[0])
+
+        posts[-1].tags.add(hamon)
+        posts[-2].tags.add(hamon)
+        self.assertEqual(get_related_posts(posts[-1])[0], posts[-2])
+        hamon.delete()
+        self.assertEqual(get_related_posts(posts[-1])[0], posts[0])
+        posts[1].delete()
+        self.assertEqual(RelatedPost.objects.filter(post=posts[0]).count(), RELATED_POSTS_STORED)
+
+        incremental = set(RelatedPost.objects.values_list('post_id', 'related_id'))
+        rebuild_related_posts()
+        self.assertEqual(set(RelatedPost.objects.values_list('post_id', 'related_id')), incremental)
+
+
+class SimpleBlogSidebarTests(SimpleBlogTestCase):
+    def test_sidebar_counts_are_cached_until_posts_change(self):
+        cache.clear()
+        forging, shop = BlogCategory.objects.create(name='Forging'), BlogCategory.objects.create(name='Shop')
+        steel, hamon = BlogTag.objects.create(name='Steel'), BlogTag.objects.create(name='Hamon')
+        for i in range(3):
+            self._post(f'Forge {i}', 'x', category=forging).tags.add(steel)
+        self._post('Sale', 'x', category=shop).tags.add(hamon)
+        SimpleBlogPost.objects.create(title='Draft', content='x', author=self.author, category=shop)
+
+        with self.assertNumQueries(3):  # the cache generation, then categories and tags
+            sidebar = get_sidebar()
+        self.assertEqual([(c.name, c.post_count) for c in sidebar['categories']], [('Forging', 3), ('Shop', 1)])
+        self.assertEqual([(t.name, t.post_count) for t in sidebar['popular_tags']], [('Steel', 3), ('Hamon', 1)])
+        with self.assertNumQueries(0):
+            get_sidebar()
+
+        self._post('Sale 2', 'x', category=shop).tags.add(hamon)
+        SimpleBlogPost.objects.get(title='Forge 0').delete()
+        sidebar = get_sidebar()
+        self.assertEqual([(c.name, c.post_count) for c in sidebar['categories']], [('Forging', 2), ('Shop', 2)])  # ties by name
+        self.assertEqual([(t.name, t.post_count) for t in sidebar['popular_tags']], [('Hamon', 2), ('Steel', 2)])
+
+
+class SimpleBlogPublishingTests(SimpleBlogTestCase):
+    def test_scheduled_posts_publish_explicitly_and_bump_the_cache(self):
+        cache.clear()
+        live = self._post('Live', 'x')
+        later = self._post('Later', 'x', publish_date=timezone.now() + datetime.timedelta(hours=1))
+        self.assertEqual(later.status, 'scheduled')
+        self.assertEqual(list(SimpleBlogPost.objects.published()), [live])
+
+        publish_due_posts_if_needed()
+        self.assertEqual(publish_due_posts(), 0)
+        key = cache_key('list')
+        SimpleBlogPost.objects.filter(pk=later.pk).update(publish_date=timezone.now() - datetime.timedelta(minutes=1))
+        self.assertEqual(publish_due_posts(timezone.now() - datetime.timedelta(hours=1)), 0)
+        self.assertEqual(cache_key('list'), key)
+
+        # The cached next-due time is still an hour away; a fresh check publishes
+        cache.clear()
+        publish_due_posts_if_needed()
+        later.refresh_from_db()
+        self.assertTrue(later.is_published)
+        self.assertNotEqual(cache_key('list'), key)
+        publish_due_posts_if_needed()  # next-due time recomputed for the new generation
+        with self.assertNumQueries(0):
+            publish_due_posts_if_needed()
+
+        # Already published elsewhere (cron, another worker): the stale time is dropped, not retried
+        self._post('Soon', 'x', publish_date=timezone.now() + datetime.timedelta(hours=1))
+        key = cache_key('next-scheduled')
+        cache.set(key, timezone.now() - datetime.timedelta(minutes=1))
+        publish_due_posts_if_needed()
+        self.assertIsNone(cache.get(key))
+        publish_due_posts_if_needed()
+        with self.assertNumQueries(0):
+            publish_due_posts_if_needed()
+
+
+class SimpleBlogListingCacheTests(SimpleBlogTestCase):
+    def test_listing_pages_are_cached_until_the_blog_changes(self):
+        cache.clear()
+        self._post('First', 'x')
+        paginator = KeysetPaginator(SimpleBlogPost.objects.published(), 10)
+        self.assertEqual(len(paginator.get_page(cache_key=cache_key('list'))), 1)
+        with self.assertNumQueries(0):
+            self.assertEqual(len(paginator.get_page(cache_key=cache_key('list'))), 1)
+        self._post('Second', 'x')
+        self.assertEqual(len(paginator.get_page(cache_key=cache_key('list'))), 2)
+
+        # The generation lives in the database, so a bump in another worker is seen here
+        CacheGeneration.objects.filter(name=GENERATION_KEY).update(value=F('value') + 1)
+        cache.delete(GENERATION_KEY)  # this worker's copy expiring
+        self.assertEqual(len(paginator.get_page(cache_key=cache_key('list'))), 2)
+        self.assertEqual(cache_key('list'), f'simple-blog:{CacheGeneration.objects.get().value}:list')
+
+
+class SimpleBlogSearchTests(SimpleBlogTestCase):
+    def test_ranked_search_kept_in_sync_with_saves(self):
+        self.assertEqual(search_backend(), 'sqlite')
+        body = self._post('Workshop notes', '<p>Forging a katana takes weeks.</p>')
+        title = self._post('Katana forging', '<p>Notes from the forge.</p>')
+        tagged = self._post('Shop update', '<p>New steel arrived.</p>')
+        tagged.tags.add(BlogTag.objects.create(name='Katana'))
+
+        with CaptureQueriesContext(connection) as queries:
+            results = list(search_posts(SimpleBlogPost.objects.all(), 'katana'))
+        self.assertEqual(results[0], title)
+        self.assertEqual(set(results), {title, body, tagged})
+        # After the FTS table check, matched and ranked in one statement rather than via a list of ids
+        self.assertEqual(len(queries), 2)
+        self.assertIn('bm25', queries[-1]['sql'])
+        # Stemming and prefix matching while typing
+        self.assertIn(body, search_posts(SimpleBlogPost.objects.all(), 'forge'))
+        self.assertIn(title, search_posts(SimpleBlogPost.objects.all(), 'kata'))
+        # FTS syntax in user input is treated as plain words
+        self.assertEqual(list(search_posts(SimpleBlogPost.objects.all(), 'steel" OR')), [])
+
+        title.title = 'Tanto forging'
+        title.save()
+        tagged.tags.clear()
+        body.delete()
+        self.assertEqual(list(search_posts(SimpleBlogPost.objects.all(), 'katana')), [])
+
+        self.assertEqual(rebuild_search_documents(), 2)
+        self.assertEqual(list(search_posts(SimpleBlogPost.objects.all(), 'tanto')), [title])
+
+    def test_tag_side_changes_reindex_their_posts(self):
+        post = self._post('Shop update', '<p>New steel arrived.</p>')
+        tag = BlogTag.objects.create(name='Katana')
+        tag.simpleblogpost_set.add(post)
+        self.assertEqual(list(search_posts(SimpleBlogPost.objects.all(), 'katana')), [post])
+        tag.simpleblogpost_set.clear()
+        self.assertEqual(list(search_posts(SimpleBlogPost.objects.all(), 'katana')), [])
+
+        post.tags.add(tag)
+        tag.name = 'Wakizashi'
+        tag.save()
+        self.assertEqual(list(search_posts(SimpleBlogPost.objects.all(), 'wakizashi')), [post])
+        tag.delete()
+        self.assertEqual(list(search_posts(SimpleBlogPost.objects.all(), 'wakizashi')), [])
+
+
+@override_settings(BLOG_VIEW_FLUSH_INTERVAL=0)
+class SimpleViewCountTests(TestCase):
+    def setUp(self):
+        author = User.objects.create(username='writer')
+        self.quiet = SimpleBlogPost.objects.create(title='Quiet', content='x', author=author, status='published')
+        self.busy = SimpleBlogPost.objects.create(title='Busy', content='x', author=author, status='published')
+
+    def test_views_are_logged_and_flushed_in_batches(self):
+        stale = [SimpleBlogPost.objects.get(pk=self.busy.pk) for _ in range(3)]
+        for post in stale:
+            post.increment_view_count()
+        self.quiet.increment_view_count()
+        self.assertEqual([post.view_count for post in stale], [1, 1, 1])
+
+        with CaptureQueriesContext(connection) as queries:
+            self.busy.increment_view_count()
+        self.assertEqual(len(queries), 1)
+        self.assertTrue(queries[0]['sql'].startswith('INSERT INTO "projects_pendingpostview"'))
+        self.busy.refresh_from_db()
+        self.assertEqual(self.busy.view_count, 0)
+
+        self.assertEqual(flush_view_counts(), 5)
+        self.assertEqual(flush_view_counts(), 0)
+        self.busy.refresh_from_db()
+        self.assertEqual(self.busy.view_count, 4)
+        self.assertEqual(DailyPostViews.objects.get(post=self.busy).views, 4)
+        self.assertEqual(list(popular_posts()), [self.busy, self.quiet])
+
+    def test_overlapping_flush_backs_out(self):
+        self.busy.increment_view_count()
+        self.busy.increment_view_count()
+        real_delete = QuerySet.delete
+
+        def delete_after_another_flush(queryset):
+            # Another flush commits one of the rows first
+            PendingPostView.objects.order_by('pk').first().delete()
+            return real_delete(queryset)
+
+        with mock.patch.object(QuerySet, 'delete', delete_after_another_flush):
+            self.assertEqual(flush_view_counts(), 0)
+        self.assertEqual(PendingPostView.objects.count(), 2)
+        self.busy.refresh_from_db()
+        self.assertEqual(self.busy.view_count, 0)
+
+
+class KeysetPaginatorTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        author = User.objects.create(username='writer')
+        same_time = timezone.now()
+        for i in range(25):
+            SimpleBlogPost.objects.create(
+                title=f'Post {i}', content='katana', author=author, status='published',
+                # Ties on publish_date are broken by id
+                publish_date=same_time if i % 2 else same_time - datetime.timedelta(days=i),
+            )
+
+    def _walk(self, queryset, per_page=10):
+        paginator = KeysetPaginator(queryset, per_page)
+        pages = [paginator.get_page()]
+        while pages[-1].has_next():
+            pages.append(paginator.get_page(pages[-1].next_cursor))
+        return paginator, pages
+
+    def test_pages_cover_every_post_once_in_order(self):
+        expected = list(SimpleBlogPost.objects.order_by('-publish_date', '-pk'))
+        paginator, pages = self._walk(SimpleBlogPost.objects.all())
+        self.assertEqual([len(page) for page in pages], [10, 10, 5])
+        self.assertEqual([post for page in pages for post in page], expected)
+        self.assertFalse(pages[0].has_previous())
+
+        back = paginator.get_page(pages[2].previous_cursor)
+        self.assertEqual(list(back), list(pages[1]))
+        self.assertEqual(list(paginator.get_page(back.previous_cursor)), list(pages[0]))
+        # Tampered cursors fall back to the first page
+        self.assertEqual(list(paginator.get_page(pages[1].next_cursor + 'x')), list(pages[0]))
+
+    def test_deep_pages_do_not_count_or_offset(self):
+        paginator, pages = self._walk(SimpleBlogPost.objects.all())
+        with CaptureQueriesContext(connection) as queries:
+            paginator.get_page(pages[1].next_cursor)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('OFFSET', queries[0]['sql'])
+        self.assertNotIn('COUNT', queries[0]['sql'])
+
+        counted = KeysetPaginator(SimpleBlogPost.objects.all(), 10, count_key='all-posts')
+        self.assertEqual(counted.get_page().total, 25)
+        page = counted.get_page()
+        with self.assertNumQueries(0):
+            self.assertEqual(page.total, 25)
+
+    def test_search_results_page_by_rank(self):
+        ranked = search_posts(SimpleBlogPost.objects.all(), 'katana')
+        _, pages = self._walk(ranked, per_page=7)
+        self.assertEqual([post for page in pages for post in page], list(ranked))
+
+
+# Stand-ins for the blogs' detail routes, which omimi.urls doesn't install;
+# the feeds only need to reverse them
+urlpatterns = site_urls.urlpatterns + [
+    path('simple-blog/<slug:slug>/', RedirectView.as_view(pattern_name='blog'), name='simple_blog_detail'),
+    path('aws-blog/<str:blog_id>/', RedirectView.as_view(pattern_name='blog'), name='aws_blog_detail'),
+]
+
+
+@override_settings(ROOT_URLCONF='projects.tests', BLOG_FEEDS_INCLUDE_DYNAMODB=True)
+class DocumentTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        author = User.objects.create(username='writer')
+        SimpleBlogPost.objects.create(title='Forge day', content='<p>Hot steel</p>', author=author, status='published')
+        Blog.objects.create(description='<p>Howard at the anvil</p>')
+        self.blog_service = mock.Mock()
+        dynamo_posts = mock.patch('projects.aws_blog_service.blog_service', new=self.blog_service)
+        dynamo_posts.start()
+        self.addCleanup(dynamo_posts.stop)
+        self.blog_service.get_all_blog_posts.return_value = [{
+            'blog_id': 'abc', 'title': 'Polishing notes', 'excerpt': 'Stones',
+            'created_date': '2026-01-02T03:04:05+00:00',
+        }]
+
+    def test_blog_feed_is_cached_and_revalidated(self):
+        response = self.client.get('/feeds/blog.xml')
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Forge day')
+        self.assertContains(response, 'Polishing notes')
+        self.assertIn('public', response['Cache-Control'])
+
+        with self.assertNumQueries(0):
+            cached = self.client.get('/feeds/blog.xml', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(self.blog_service.get_all_blog_posts.call_count, 1)
+
+        post = SimpleBlogPost.objects.get()
+        post.title = 'Forge night'
+        post.save()
+        changed = self.client.get('/feeds/blog.xml', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(changed.status_code, 200)
+        self.assertContains(changed, 'Forge night')
+        self.assertContains(self.client.get('/feeds/blog.atom'), '<feed')
+
+    def test_feeds_list_only_posts_that_can_be_linked(self):
+        guids = {entry.guid: entry.link for entry in blog_entries()}
+        self.assertEqual(guids['aws-blog-abc'], '/aws-blog/abc/')
+        self.assertEqual(guids[f'legacy-blog-{Blog.objects.get().pk}'], '/blog/')
+        self.assertIn('Howard at the anvil', self.client.get('/feeds/blog.xml').content.decode())
+        self.assertEqual(len(blog_entries(limit=None, include_legacy=False)), 2)
+
+        with override_settings(ROOT_URLCONF='omimi.urls'):
+            self.assertEqual([entry.guid[:11] for entry in blog_entries()], ['legacy-blog'])
+        with override_settings(BLOG_FEEDS_INCLUDE_DYNAMODB=False):
+            self.assertNotIn('aws-blog-abc', {entry.guid for entry in blog_entries()})
+        self.assertEqual(self.blog_service.get_all_blog_posts.call_count, 3)
+        self.assertEqual(self.blog_service.get_all_blog_posts.call_args.kwargs['limit'], 1000)
+
+    def test_sitemap_sections_are_cached_separately(self):
+        index = self.client.get('/sitemap.xml')
+        self.assertEqual(index.status_code, 200)
+        for section in ('pages', 'classes', 'gallery', 'sales', 'blog'):
+            self.assertContains(index, f'sitemap-{section}.xml')
+        self.assertEqual(self.client.get('/sitemap-nope.xml').status_code, 404)
+
+        gallery = self.client.get('/sitemap-gallery.xml')
+        self.assertNotContains(gallery, '/gallery/')
+        self.assertEqual(self.client.get('/sitemap-gallery.xml?p=2').status_code, 404)
+        self.client.get('/sitemap-blog.xml')
+        item = Gallery.objects.create(title='Tanto', image='images/gallery/tanto.jpg')
+        self.assertContains(self.client.get('/sitemap-gallery.xml'), f'/gallery/{item.pk}/')
+        # The blog section was not affected by the gallery change
+        with self.assertNumQueries(0):
+            self.client.get('/sitemap-blog.xml')
+
+
+class LegacyBlogPageTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _blog(self, text):
+        blog = Blog.objects.create(description=f'<p>{text}</p>')
+        blog.images.add(BlogImages.objects.create(image=f'images/{text}.jpg'))
+        return blog
+
+    def test_page_cost_stays_flat_and_fragments_follow_edits(self):
+        self._blog('first')
+        with CaptureQueriesContext(connection) as small:
+            self.client.get('/blog/')
+        for i in range(14):
+            self._blog(f'post{i}')
+        cache.clear()
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.get('/blog/')
+        self.assertEqual(len(large), len(small))
+        self.assertEqual(len(response.context['blogs']), 10)
+
+        older = self.client.get('/blog/', {'cursor': response.context['page_obj'].next_cursor})
+        self.assertEqual(len(older.context['blogs']), 5)
+        self.assertContains(older, 'Newer posts')
+
+        blog = Blog.objects.get(description='<p>post13</p>')
+        Blog.objects.filter(pk=blog.pk).update(description='<p>edited quietly</p>')
+        self.assertContains(self.client.get('/blog/'), 'post13')  # served from the fragment cache
+        blog.refresh_from_db()
+        blog.description = '<p>edited</p>'
+        blog.save()
+        response = self.client.get('/blog/')
+        self.assertContains(response, '<p>edited</p>')
+        self.assertNotContains(response, '<p>post13</p>')
+
+    def test_image_changes_refresh_the_post_fragment(self):
+        blog = self._blog('tsuba')
+        self.client.get('/blog/')
+        fuchi = BlogImages.objects.create(image='images/fuchi.jpg')
+        blog.images.add(fuchi)
+        self.assertContains(self.client.get('/blog/'), 'fuchi.jpg')
+        fuchi.blog_set.clear()
+        self.assertNotContains(self.client.get('/blog/'), 'fuchi.jpg')
+        fuchi.blog_set.add(blog)
+        self.assertContains(self.client.get('/blog/'), 'fuchi.jpg')
+        blog.images.remove(fuchi)
+        self.assertNotContains(self.client.get('/blog/'), 'fuchi.jpg')
+        BlogImages.objects.get(image='images/tsuba.jpg').delete()
+        self.assertNotContains(self.client.get('/blog/'), 'tsuba.jpg')
 
-# Create your tests here.
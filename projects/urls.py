@@ -28,6 +28,7 @@ urlpatterns = [
     # AWS Blog URLs
     path('aws-blog/', aws_views.aws_blog, name='aws_blog'),
     path('aws-blog/<str:blog_id>/', aws_views.aws_blog_detail, name='aws_blog_detail'),
+    path('aws-blog/archive/<int:year>/<int:month>/', aws_views.aws_blog_archive, name='aws_blog_archive'),
     path('aws-blog/search/', aws_views.aws_blog_search, name='aws_blog_search'),
     path('aws-blog/tag/<str:tag>/', aws_views.aws_blog_by_tag, name='aws_blog_by_tag'),
     path('aws-blog/api/posts/', aws_views.aws_blog_api, name='aws_blog_api'),
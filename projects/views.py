@@ -8,6 +8,10 @@ from django.conf import settings
 from django.utils.safestring import mark_safe
 
 from .models import Year, Classes, Sword_img, Hotel, Blog, Sword_sales, BlogImages, OrderSettings, PageContent
+from .media_urls import url_cache_timeout
+from .pagination import KeysetPaginator
+
+BLOG_POSTS_PER_PAGE = 10
 # Create your views here.
 
 
@@ -100,15 +104,22 @@ def movie(request):
 
 
 def blog(request):
-    blogs = Blog.objects.all()
+    # Newest first, a page at a time; each post renders from a cached fragment
+    blogs = Blog.objects.prefetch_related('images')
+    page_obj = KeysetPaginator(blogs, BLOG_POSTS_PER_PAGE, ordering=['-date', '-pk']).get_page(
+        request.GET.get('cursor')
+    )
     
     # Get blog page content
     blog_page_greeting = PageContent.get_content('blog_page_greeting', 
         'A Look into the Life of Howard Clark and his Animal companions')
     
     context = {
-        'blogs': blogs,
+        'blogs': page_obj,
+        'page_obj': page_obj,
         'blog_page_greeting': blog_page_greeting,
+        # Fragments embed image URLs, so they must not outlive signed URLs
+        'fragment_timeout': url_cache_timeout(),
     }
 
     return render(request, 'projects/blog.html', context)